@@ -0,0 +1,54 @@
+"""Solve time of NumericBeam2D for continuous beams from 1 to 100 spans.
+
+Run from the repository root:
+    python -m benchmarks.beam_spans
+"""
+
+import time
+
+from engineering.beam_numeric import NumericBeam2D
+
+SPAN = 6.0  # [m]
+SPAN_COUNTS = (1, 2, 5, 10, 15, 20, 50, 100)
+
+
+def continuous_beam(nSpans, hingeEvery=0):
+    length = SPAN * nSpans
+    supports = [(i * SPAN, "simple") for i in range(nSpans + 1)]
+    # Gerber hinges inside every n-th span keep the beam stable
+    hinges = [
+        (i + 0.8) * SPAN
+        for i in range(1, nSpans - 1)
+        if hingeEvery and i % hingeEvery == 0
+    ]
+    return NumericBeam2D(
+        youngModulus=210e9,
+        inertia=8e-5,
+        length=length,
+        supports=supports,
+        pointLoads=[((i + 0.5) * SPAN, 50e3) for i in range(nSpans)],
+        distributedLoads=[((0.0, length), (10e3, 0.0, 0.0))],
+        hinges=hinges,
+    )
+
+
+def best_time(nSpans, hingeEvery=0, repeats=20):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        continuous_beam(nSpans, hingeEvery).solve()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    print(
+        f"{'spans':>6} {'solve [ms]':>11} {'per span [µs]':>14} {'with hinges [ms]':>17}"
+    )
+    for nSpans in SPAN_COUNTS:
+        elapsed = best_time(nSpans)
+        withHinges = best_time(nSpans, hingeEvery=3)
+        print(
+            f"{nSpans:>6} {elapsed * 1e3:>11.3f} {elapsed / nSpans * 1e6:>14.1f}"
+            f" {withHinges * 1e3:>17.3f}"
+        )
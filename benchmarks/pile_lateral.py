@@ -0,0 +1,41 @@
+"""Solve time of the p-y lateral pile solver from 100 to 100k nodes.
+
+Run from the repository root:
+    python -m benchmarks.pile_lateral
+"""
+
+import time
+
+from engineering.pile import SoilLayer
+from engineering.pile_lateral import lateral_pile
+
+NODE_COUNTS = (100, 300, 1_000, 3_000, 10_000, 30_000, 100_000)
+LAYERS = [
+    SoilLayer(5.0, 30e3, 0.5),
+    SoilLayer(10.0, 60e3, 0.5),
+    SoilLayer(20.0, 100e3, 0.5),
+]
+
+
+def best_time(nNodes, repeats=5):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = lateral_pile(
+            210e9, 1e-3, 30.0, 0.8, LAYERS, H=300e3, M0=100e3, nNodes=nNodes
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+if __name__ == "__main__":
+    print(
+        f"{'nodes':>8} {'solve [ms]':>11} {'per node [µs]':>14} {'iterations':>11}"
+        f" {'head y [mm]':>12}"
+    )
+    for nNodes in NODE_COUNTS:
+        elapsed, result = best_time(nNodes)
+        print(
+            f"{nNodes:>8} {elapsed * 1e3:>11.2f} {elapsed / nNodes * 1e6:>14.2f}"
+            f" {result.iterations:>11} {result.deflection[0] * 1e3:>12.3f}"
+        )
@@ -0,0 +1,45 @@
+"""Monte Carlo pile reliability with 10^7 samples, in process and on a pool.
+
+The results depend on the seed and the chunk size only, so every worker
+count must give the same failure count. The page runs in process or on at
+most two workers; wider pools are meant for batch runs like this one.
+
+Run from the repository root:
+    python -m benchmarks.pile_reliability
+"""
+
+import os
+import time
+
+from engineering.pile import PileGeometry, SoilLayer, SteelProperties
+from engineering.pile_reliability import PileReliabilityModel, monte_carlo
+
+SAMPLES = 10**7
+CHUNK_SIZE = 10**6
+MODEL = PileReliabilityModel(
+    SteelProperties(355, 510),
+    PileGeometry(10.0, 0.3, 0.012),
+    [SoilLayer(5.0, 50e3, 0.5), SoilLayer(5.0, 50e3, 0.5), SoilLayer(5.0, 50e3, 0.5)],
+    load=150.0,
+)
+
+
+def run(workers):
+    start = time.perf_counter()
+    for estimate in monte_carlo(MODEL, SAMPLES, CHUNK_SIZE, workers=workers):
+        pass
+    return time.perf_counter() - start, estimate
+
+
+if __name__ == "__main__":
+    cpus = os.cpu_count() or 1
+    print(
+        f"{'workers':>8} {'time [s]':>9} {'samples/s':>10} {'failures':>9}"
+        f" {'Pf':>10}"
+    )
+    for workers in sorted({1, min(2, cpus), cpus}):
+        elapsed, estimate = run(workers)
+        print(
+            f"{workers:>8} {elapsed:>9.2f} {SAMPLES / elapsed:>10.2e}"
+            f" {estimate.failures:>9} {estimate.probability:>10.3e}"
+        )
@@ -0,0 +1,62 @@
+"""Polygon section properties for built-up sections of 1k to 10k vertices.
+
+A welded box whose corners are rounded with many vertices, so the outer
+boundary and the hole each carry half of the vertices. Compares
+``polygon_properties`` with the cached lookup by geometry hash, and checks
+the area against shapely.
+
+Run from the repository root:
+    python -m benchmarks.section_polygon
+"""
+
+import time
+
+import numpy as np
+from shapely.geometry import Polygon
+
+from engineering.section_polygon import PolygonPropertyCache, polygon_properties
+
+VERTEX_COUNTS = (1_000, 2_000, 5_000, 10_000)
+REPEATS = 200
+
+
+def rounded_box(width, height, radius, n):
+    """Open counter-clockwise ring of a rounded rectangle with n vertices."""
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    cx = np.where(np.cos(t) >= 0, width / 2 - radius, radius - width / 2)
+    cy = np.where(np.sin(t) >= 0, height / 2 - radius, radius - height / 2)
+    return np.column_stack([cx + radius * np.cos(t), cy + radius * np.sin(t)])
+
+
+def built_up_box(vertices):
+    """Outer boundary and hole of a 300 x 400 box with 10 mm walls."""
+    return [
+        rounded_box(300, 400, 30, vertices // 2),
+        rounded_box(280, 380, 20, vertices // 2)[::-1],
+    ]
+
+
+def timed(function, *args, repeats=REPEATS):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = function(*args)
+    return (time.perf_counter() - start) / repeats, result
+
+
+if __name__ == "__main__":
+    print(
+        f"{'vertices':>9} {'compute [µs]':>13} {'cached [µs]':>12}"
+        f" {'shapely [µs]':>13} {'same area':>10}"
+    )
+    for n in VERTEX_COUNTS:
+        rings = built_up_box(n)
+        compute, properties = timed(polygon_properties, rings)
+        cache = PolygonPropertyCache()
+        cache.properties(rings)
+        cached, _ = timed(cache.properties, rings)
+        shapely, area = timed(lambda: Polygon(rings[0], rings[1:]).area)
+        same = np.isclose(properties.area, area, rtol=1e-12)
+        print(
+            f"{n:>9} {compute * 1e6:>13.1f} {cached * 1e6:>12.1f}"
+            f" {shapely * 1e6:>13.1f} {str(same):>10}"
+        )
@@ -0,0 +1,80 @@
+"""Lightest-section queries on synthetic I-section catalogues of 1k to 100k rows.
+
+Compares the bisection index of ``engineering.section_query`` with a Python
+scan over the rows, for "lightest section with Iyy ≥ X and Wpl,x ≥ Y".
+
+Run from the repository root:
+    python -m benchmarks.section_query
+"""
+
+import time
+
+import numpy as np
+
+from engineering.constants import STEEL_DENSITY
+from engineering.section_families import i_section
+from engineering.section_query import SectionIndex, scan_query
+from engineering.section_table import SECTION_DTYPE
+
+CATALOGUE_SIZES = (1_000, 10_000, 30_000, 100_000)
+QUERIES = 50
+
+
+def synthetic_catalogue(n, seed=0):
+    """Section table rows of n random rolled I sections."""
+    rng = np.random.default_rng(seed)
+    h = rng.uniform(80, 1000, n)
+    b = h * rng.uniform(0.3, 1.0, n)
+    tf = h * rng.uniform(0.02, 0.08, n)
+    tw = tf * rng.uniform(0.5, 0.8, n)
+    r = tw * rng.uniform(1.0, 2.5, n)
+    p = i_section(h, b, tw, tf, r)
+    table = np.zeros(n, dtype=SECTION_DTYPE)
+    table["name"] = [f"SYN {i}" for i in range(n)]
+    table["family"] = "SYN"
+    table["A"], table["xc"], table["yc"] = p["A"], b / 2, h / 2
+    table["Ixx"], table["Iyy"] = p["Iy"], p["Iz"]
+    table["ix"], table["iy"] = np.sqrt(p["Iy"] / p["A"]), np.sqrt(p["Iz"] / p["A"])
+    table["Welx"], table["Wely"] = p["Wel_y"], p["Wel_z"]
+    table["Wplx"], table["Wply"] = p["Wpl_y"], p["Wpl_z"]
+    table["mass"] = p["A"] * 1e-6 * STEEL_DENSITY
+    return table
+
+
+def random_bounds(table, rng):
+    """Bounds between the 50th and 95th percentiles of Iyy and Wpl,x."""
+    q = rng.uniform(50, 95, 2)
+    return {
+        "Iyy": np.percentile(table["Iyy"], q[0]),
+        "Wplx": np.percentile(table["Wplx"], q[1]),
+    }
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    print(
+        f"{'sections':>9} {'index [ms]':>11} {'query [µs]':>11}"
+        f" {'scan [ms]':>10} {'speed-up':>9} {'same':>5}"
+    )
+    for n in CATALOGUE_SIZES:
+        table = synthetic_catalogue(n)
+        build, index = timed(SectionIndex, table)
+        rng = np.random.default_rng(1)
+        bounds = [random_bounds(table, rng) for _ in range(QUERIES)]
+        queryTimes, scanTimes, same = [], [], True
+        for minimum in bounds:
+            elapsed, result = timed(index.query, minimum)
+            queryTimes.append(elapsed)
+            elapsed, scanned = timed(scan_query, table, minimum)
+            scanTimes.append(elapsed)
+            same &= list(result.rows["name"]) == [row["name"] for row in scanned]
+        query, scan = np.mean(queryTimes), np.mean(scanTimes)
+        print(
+            f"{n:>9} {build * 1e3:>11.2f} {query * 1e6:>11.1f}"
+            f" {scan * 1e3:>10.2f} {scan / query:>9.0f} {str(same):>5}"
+        )
@@ -0,0 +1,146 @@
+"""Headless batch solver for beam definitions exported from other tools.
+
+Each input record has the same shape as the ``Beam2D(...)`` arguments, plus
+an optional ``id``. JSONL files hold one JSON object per line; CSV files hold
+one beam per row, with the list-valued columns (``supports``, ``pointLoads``,
+``pointMoments``, ``distributedLoads``, ``hinges``) written as JSON.
+
+Records are read lazily, solved in chunks across a process pool and written
+as JSON lines in input order, with a bounded number of chunks in flight so
+memory stays flat for any input size:
+
+    python -m engineering.beam_batch beams.jsonl -o results.jsonl --workers 8
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from engineering.beam_cache import plain_minmax
+
+BEAM_ARGUMENTS = (
+    "youngModulus",
+    "inertia",
+    "length",
+    "supports",
+    "pointLoads",
+    "pointMoments",
+    "distributedLoads",
+    "hinges",
+)
+LIST_COLUMNS = BEAM_ARGUMENTS[3:]
+
+
+def read_records(path, fileFormat=None):
+    """Lazily yield beam definitions from a JSONL or CSV file ("-" is stdin)."""
+    fileFormat = fileFormat or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+    try:
+        if fileFormat == "csv":
+            for row in csv.DictReader(stream):
+                yield {
+                    key: json.loads(value) if key in LIST_COLUMNS else value
+                    for key, value in row.items()
+                    if value not in (None, "")
+                }
+        else:
+            for line in stream:
+                if line.strip():
+                    yield json.loads(line)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _beam_class(engine):
+    if engine == "symbolic":
+        from structuralelement.beam2d import Beam2D
+
+        return Beam2D
+    from engineering.beam_numeric import NumericBeam2D
+
+    return NumericBeam2D
+
+
+def solve_record(record, engine="numeric"):
+    """Reactions and min/max of one beam, or the error that stopped it."""
+    result = {"id": record.get("id")}
+    try:
+        beamArgs = {k: record[k] for k in BEAM_ARGUMENTS if k in record}
+        for key in ("youngModulus", "inertia", "length"):
+            beamArgs[key] = float(beamArgs[key])
+        beam = _beam_class(engine)(**beamArgs)
+        beam.solve()
+        result["reactions"] = [
+            [
+                float(x),
+                kind,
+                None if v is None else float(v),
+                None if m is None else float(m),
+            ]
+            for x, kind, v, m in beam.reactions
+        ]
+        result["minmax"] = plain_minmax(beam.get_minmax())
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def _solve_chunk(records, engine):
+    return [solve_record(record, engine) for record in records]
+
+
+def _chunks(records, chunkSize):
+    records = iter(records)
+    while chunk := list(islice(records, chunkSize)):
+        yield chunk
+
+
+def solve_stream(records, workers=None, chunkSize=64, engine="numeric"):
+    """Yield results in input order while at most two chunks per worker are
+    queued or running, so only a bounded part of the input is in memory."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in _chunks(records, chunkSize):
+            yield from _solve_chunk(chunk, engine)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(records, chunkSize):
+            pending.append(pool.submit(_solve_chunk, chunk, engine))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("input", help="JSONL or CSV file with beam definitions")
+    parser.add_argument("-o", "--output", help="JSONL results file (default stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="input format")
+    parser.add_argument("--workers", type=int, help="processes (default: all CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="beams per task")
+    parser.add_argument("--engine", choices=["numeric", "symbolic"], default="numeric")
+    args = parser.parse_args(argv)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = 0
+    try:
+        records = read_records(args.input, args.format)
+        for result in solve_stream(records, args.workers, args.chunk_size, args.engine):
+            failed += "error" in result
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Process-wide LRU cache of solved beams shared by every Streamlit session."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BeamSolution:
+    beam: object  # solved beam instance
+    plot_data: tuple  # output of beam.data_plot()
+    minmax: dict  # output of beam.get_minmax() as plain floats
+
+
+def _number(value) -> float:
+    """Float rounded to 12 significant digits, with -0.0 folded into 0.0."""
+    value = float(f"{float(value):.12g}")
+    return 0.0 if value == 0 else value
+
+
+def _expression(expr):
+    """Canonical form of a distributed load expression or coefficient list."""
+    if isinstance(expr, str):
+        return "".join(expr.split())
+    return tuple(_number(a) for a in expr)
+
+
+def plain_minmax(minmax: dict) -> dict:
+    """get_minmax() output with positions and values as plain floats, so
+    symbolic engines do not leak sympy numbers into the display code."""
+
+    def plain(position):
+        if isinstance(position, (list, tuple)):
+            return [float(p) for p in position]
+        return float(position)
+
+    return {
+        key: {
+            bound: (plain(value[bound][0]), float(value[bound][1])) for bound in value
+        }
+        for key, value in minmax.items()
+    }
+
+
+def canonical_key(
+    youngModulus,
+    inertia,
+    length,
+    supports=(),
+    pointLoads=(),
+    pointMoments=(),
+    distributedLoads=(),
+    hinges=(),
+):
+    """Hashable key of the Beam2D constructor arguments, independent of the
+    order in which supports and loads were listed."""
+    return (
+        _number(youngModulus),
+        _number(inertia),
+        _number(length),
+        tuple(sorted((_number(x), str(kind).strip().lower()) for x, kind in supports)),
+        tuple(sorted((_number(x), _number(p)) for x, p in pointLoads)),
+        tuple(sorted((_number(x), _number(m)) for x, m in pointMoments)),
+        tuple(
+            sorted(
+                ((_number(x1), _number(x2)), _expression(expr))
+                for (x1, x2), expr in distributedLoads
+            )
+        ),
+        tuple(sorted(_number(x) for x in hinges)),
+    )
+
+
+class BeamSolveCache:
+    """Bounded LRU cache of solved beams keyed on their canonical inputs."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def solve(self, beamClass, **beamArgs) -> BeamSolution:
+        """Return the cached solution for these inputs, solving on a miss."""
+        key = (beamClass, canonical_key(**beamArgs))
+        with self._lock:
+            solution = self._entries.get(key)
+            if solution is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return solution
+            self.misses += 1
+        # solve outside the lock so other sessions are not blocked
+        beam = beamClass(**beamArgs)
+        beam.solve()
+        solution = BeamSolution(beam, beam.data_plot(), plain_minmax(beam.get_minmax()))
+        with self._lock:
+            self._entries[key] = solution
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return solution
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# module level instance, shared by all sessions of the server process
+beam_cache = BeamSolveCache()
@@ -0,0 +1,115 @@
+"""Lightest catalogue section for a prismatic beam from a single solve.
+
+For a prismatic beam V and M do not depend on EI, and w and θ scale with
+1/EI. The beam is therefore solved once with a reference inertia and the
+bending and deflection checks of every profile in the catalogue follow from
+array arithmetic on the catalogue properties.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from engineering.beam_numeric import NumericBeam2D
+from engineering.constants import STEEL_DENSITY
+
+REFERENCE_INERTIA = 1e-4  # [m⁴] inertia of the single reference solve
+
+
+@dataclass
+class SectionCatalogue:
+    names: np.ndarray  # profile names
+    area: np.ndarray  # [mm²]
+    inertia: np.ndarray  # strong-axis second moment of area [mm⁴]
+    elasticModulus: np.ndarray  # strong-axis elastic section modulus [mm³]
+
+    @property
+    def mass(self):
+        """Mass per metre [kg/m]."""
+        return self.area * 1e-6 * STEEL_DENSITY
+
+
+def catalogue_from_table(rows: np.ndarray) -> SectionCatalogue:
+    """Array catalogue of rows of ``engineering.section_table``, about the
+    strong axis of every profile."""
+    strongX = rows["Ixx"] >= rows["Iyy"]
+    return SectionCatalogue(
+        np.asarray(rows["name"]),
+        np.asarray(rows["A"]),
+        np.where(strongX, rows["Ixx"], rows["Iyy"]),
+        np.where(strongX, rows["Welx"], rows["Wely"]),
+    )
+
+
+@lru_cache(maxsize=1)
+def ipe_catalogue() -> SectionCatalogue:
+    from engineering.section_table import section_table
+
+    return catalogue_from_table(section_table().family("IPE"))
+
+
+@dataclass
+class DesignResult:
+    catalogue: SectionCatalogue
+    maxMoment: float  # governing |M| [N·m], independent of the section
+    deflection: np.ndarray  # max |w| of every profile [m]
+    bendingUtilisation: np.ndarray  # M / M_Rd of every profile
+    deflectionUtilisation: np.ndarray  # w / w_limit of every profile
+
+    @property
+    def feasible(self):
+        return (self.bendingUtilisation <= 1.0) & (self.deflectionUtilisation <= 1.0)
+
+    @property
+    def selected(self):
+        """Index of the lightest feasible profile, or None."""
+        if not self.feasible.any():
+            return None
+        mass = np.where(self.feasible, self.catalogue.mass, np.inf)
+        return int(np.argmin(mass))
+
+
+def design_beam(
+    youngModulus,
+    length,
+    supports,
+    pointLoads=(),
+    pointMoments=(),
+    distributedLoads=(),
+    hinges=(),
+    fy=355e6,
+    gammaM0=1.0,
+    deflectionLimit=None,
+    catalogue=None,
+) -> DesignResult:
+    """Check every catalogue profile with one solve of the beam.
+
+    fy in Pa; deflectionLimit in m, L/250 by default. Loads follow the
+    Beam2D arguments and are not increased by the self weight.
+    """
+    catalogue = catalogue or ipe_catalogue()
+    deflectionLimit = deflectionLimit or length / 250
+    beam = NumericBeam2D(
+        youngModulus,
+        REFERENCE_INERTIA,
+        length,
+        supports=supports,
+        pointLoads=pointLoads,
+        pointMoments=pointMoments,
+        distributedLoads=distributedLoads,
+        hinges=hinges,
+    ).solve()
+    minmax = beam.get_minmax()
+    maxMoment = max(abs(minmax["M"]["max"][1]), abs(minmax["M"]["min"][1]))
+    wReference = max(abs(minmax["w"]["max"][1]), abs(minmax["w"]["min"][1]))
+    # w ∝ 1/I, M independent of I
+    deflection = wReference * REFERENCE_INERTIA / (catalogue.inertia * 1e-12)
+    momentResistance = fy * catalogue.elasticModulus * 1e-9 / gammaM0
+    return DesignResult(
+        catalogue=catalogue,
+        maxMoment=maxMoment,
+        deflection=deflection,
+        bendingUtilisation=maxMoment / momentResistance,
+        deflectionUtilisation=deflection / deflectionLimit,
+    )
@@ -0,0 +1,119 @@
+"""Influence lines and moving-load envelopes for beams.
+
+A unit load is placed at every node of a fine mesh and all positions are
+solved together as the columns of one banded system. Any load pattern on the
+mesh is then a matrix product with the influence-line matrices, so a moving
+load train costs one matrix multiply instead of one solve per position.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from engineering.beam_numeric import (
+    _HERMITE_N,
+    element_stiffness,
+    nodal_residual,
+    node_dofs,
+    restrained_dofs,
+    solve_stiffness,
+)
+
+
+def _end_operators(le, scale, EI, s):
+    """Rows mapping element dofs to M and V at local coordinate s ∈ [0, 1]."""
+    d2 = np.array([0.0, 0.0, 2.0, 6.0 * s])  # second derivative of s**k
+    d3 = np.array([0.0, 0.0, 0.0, 6.0])  # third derivative of s**k
+    bM = -EI * scale * (_HERMITE_N @ d2) / le[:, None] ** 2
+    bV = -EI * scale * (_HERMITE_N @ d3) / le[:, None] ** 3
+    return bM, bV
+
+
+@dataclass
+class InfluenceLines:
+    x: np.ndarray  # mesh nodes: output sections and unit-load positions [m]
+    supports: list  # (x, kind) of every support
+    reaction: np.ndarray  # (nSupports, nPos) vertical reactions
+    shear: np.ndarray  # (nX, nPos) shear just right of each section
+    moment: np.ndarray  # (nX, nPos) bending moment at each section
+
+    @property
+    def length(self):
+        return float(self.x[-1])
+
+    def load_matrix(self, positions, loads) -> np.ndarray:
+        """Nodal load matrix (nPos, nColumns) for point loads at arbitrary
+        positions, split to the neighbouring nodes by the lever rule.
+
+        positions and loads are broadcast arrays of shape (nAxles, nColumns);
+        loads outside the beam are dropped.
+        """
+        positions, loads = np.broadcast_arrays(positions, loads)
+        columns = np.broadcast_to(np.arange(positions.shape[-1]), positions.shape)
+        onBeam = (positions >= 0.0) & (positions <= self.length)
+        p, P, col = positions[onBeam], loads[onBeam], columns[onBeam]
+        left = np.clip(np.searchsorted(self.x, p, side="right") - 1, 0, self.x.size - 2)
+        frac = (p - self.x[left]) / (self.x[left + 1] - self.x[left])
+        W = np.zeros((self.x.size, positions.shape[-1]))
+        np.add.at(W, (left, col), P * (1.0 - frac))
+        np.add.at(W, (left + 1, col), P * frac)
+        return W
+
+    def train_loads(self, axles, step=None, bothDirections=True):
+        """Lead-axle positions and nodal load matrix of a load train crossing
+        the beam. axles is a list of (offset behind the lead axle [m], load)."""
+        offsets = np.array([offset for offset, _ in axles], dtype=float)
+        loads = np.array([load for _, load in axles], dtype=float)
+        step = step or float(np.min(np.diff(self.x)))
+        lead = np.arange(0.0, self.length + offsets.max() + step, step)
+        positions = lead[None, :] - offsets[:, None]
+        if bothDirections:
+            positions = np.hstack([positions, self.length - positions])
+            lead = np.concatenate([lead, self.length - lead])
+        return lead, self.load_matrix(positions, loads[:, None])
+
+    def envelope(self, axles, step=None, bothDirections=True) -> dict:
+        """Max/min of V, M and the reactions for a moving load train."""
+        _, W = self.train_loads(axles, step, bothDirections)
+        shear, moment, reaction = self.shear @ W, self.moment @ W, self.reaction @ W
+        return {
+            "x": self.x,
+            "V": (shear.min(axis=1), shear.max(axis=1)),
+            "M": (moment.min(axis=1), moment.max(axis=1)),
+            "R": (reaction.min(axis=1), reaction.max(axis=1)),
+        }
+
+
+def influence_lines(
+    youngModulus, inertia, length, supports, hinges=(), nPoints=201
+) -> InfluenceLines:
+    """Influence lines of reactions, V and M for a unit downward load."""
+    supports = [(float(x), str(kind).lower()) for x, kind in supports]
+    keyPoints = [x for x, _ in supports] + [float(x) for x in hinges]
+    xNodes = np.unique(np.concatenate([np.linspace(0.0, length, nPoints), keyPoints]))
+    xNodes = xNodes[np.concatenate(([True], np.diff(xNodes) > 1e-9 * length))]
+    EI = float(youngModulus) * float(inertia)
+    nodeDofs = node_dofs(xNodes, hinges)
+    wDof = nodeDofs[0]
+    ke, scale, dofs = element_stiffness(xNodes, EI, nodeDofs)
+    restrained = restrained_dofs(xNodes, supports, nodeDofs)
+    # one unit load per node, all solved as columns of the same system
+    nNodes = xNodes.size
+    F = np.zeros((restrained.size, nNodes))
+    F[wDof, np.arange(nNodes)] = 1.0
+    U = solve_stiffness(ke, dofs, restrained, F)
+    residual = nodal_residual(ke, dofs, U, F)
+    supportNodes = [int(np.argmin(np.abs(xNodes - x))) for x, _ in supports]
+    reaction = -residual[wDof[np.array(supportNodes, dtype=int)]]
+    # section forces at the left end of every element plus the last node
+    le = np.diff(xNodes)
+    Ue = U[dofs]  # (nElem, 4, nPos)
+    bM0, bV0 = _end_operators(le, scale, EI, 0.0)
+    bM1, bV1 = _end_operators(le[-1:], scale[-1:], EI, 1.0)
+    moment = np.vstack(
+        [np.einsum("ei,eip->ep", bM0, Ue), np.einsum("ei,eip->ep", bM1, Ue[-1:])]
+    )
+    shear = np.vstack(
+        [np.einsum("ei,eip->ep", bV0, Ue), np.einsum("ei,eip->ep", bV1, Ue[-1:])]
+    )
+    return InfluenceLines(xNodes, supports, reaction, shear, moment)
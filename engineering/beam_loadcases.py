@@ -0,0 +1,147 @@
+"""Named load cases and factored load combinations for beams.
+
+Every basic load case is solved once on a mesh shared by all cases, so the
+sampled w, θ, V and M arrays line up on the same x-grid. A combination is a
+row of factors and all combinations are evaluated together as one matrix
+product of the factor matrix with the stacked case results.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from engineering.beam_numeric import FIELDS, NumericBeam2D
+
+
+@dataclass
+class LoadCase:
+    name: str
+    pointLoads: list = field(default_factory=list)  # (x, P)
+    pointMoments: list = field(default_factory=list)  # (x, M)
+    distributedLoads: list = field(default_factory=list)  # ((x1, x2), q(x))
+
+
+@dataclass
+class LoadCombination:
+    name: str
+    factors: dict  # load case name -> factor
+
+
+@dataclass
+class CombinationResults:
+    x: np.ndarray  # shared x-grid with NaN separators between elements
+    names: list  # combination names
+    fields: dict  # field -> (nCombinations, nX) array
+    reactions: np.ndarray  # (nCombinations, nSupports, 2) vertical force and moment
+
+    def minmax(self) -> dict:
+        """Max and min of every field for each combination, as plain floats."""
+        result = {}
+        for i, name in enumerate(self.names):
+            result[name] = {}
+            for key, values in self.fields.items():
+                iMax, iMin = np.nanargmax(values[i]), np.nanargmin(values[i])
+                result[name][key] = {
+                    "max": (float(self.x[iMax]), float(values[i, iMax])),
+                    "min": (float(self.x[iMin]), float(values[i, iMin])),
+                }
+        return result
+
+    def envelope(self) -> dict:
+        """Governing max/min over all combinations at every x, with the index
+        of the governing combination."""
+        result = {}
+        for key, values in self.fields.items():
+            # separator columns are NaN for every combination
+            filled = np.where(np.isnan(values), 0.0, values)
+            iMax, iMin = np.argmax(filled, axis=0), np.argmin(filled, axis=0)
+            columns = np.arange(values.shape[1])
+            result[key] = {
+                "max": values[iMax, columns],
+                "min": values[iMin, columns],
+                "maxCombination": iMax,
+                "minCombination": iMin,
+            }
+        return result
+
+
+class LoadCaseLibrary:
+    """Basic load cases of one beam, solved once and combined linearly."""
+
+    def __init__(
+        self,
+        youngModulus,
+        inertia,
+        length,
+        supports,
+        cases,
+        hinges=(),
+        nPoints=500,
+    ):
+        self.youngModulus = youngModulus
+        self.inertia = inertia
+        self.length = length
+        self.supports = supports
+        self.hinges = hinges
+        self.cases = list(cases)
+        self.nPoints = nPoints
+        self.names = [case.name for case in self.cases]
+        if len(set(self.names)) != len(self.names):
+            raise ValueError("Load case names must be unique")
+
+    def _beam(self, case, meshPoints=()):
+        return NumericBeam2D(
+            youngModulus=self.youngModulus,
+            inertia=self.inertia,
+            length=self.length,
+            supports=self.supports,
+            pointLoads=case.pointLoads,
+            pointMoments=case.pointMoments,
+            distributedLoads=case.distributedLoads,
+            meshPoints=meshPoints,
+            hinges=self.hinges,
+        )
+
+    def solve(self):
+        """Solve every basic case once on the union of all key points."""
+        meshPoints = sorted(
+            {x for case in self.cases for x in self._beam(case).key_points()}
+        )
+        beams = [self._beam(case, meshPoints).solve() for case in self.cases]
+        samples = [beam.data_plot(n_points=self.nPoints) for beam in beams]
+        self.x = samples[0][0]
+        # (nCases, nX) per field
+        self.fields = {
+            key: np.vstack([sample[i + 1] for sample in samples])
+            for i, key in enumerate(FIELDS)
+        }
+        self.reactions = np.array(
+            [
+                [
+                    [vReaction or 0.0, mReaction or 0.0]
+                    for _, _, vReaction, mReaction in beam.reactions
+                ]
+                for beam in beams
+            ]
+        )
+        return self
+
+    def factor_matrix(self, combinations) -> np.ndarray:
+        """(nCombinations, nCases) matrix of load factors."""
+        unknown = {n for c in combinations for n in c.factors} - set(self.names)
+        if unknown:
+            raise ValueError(f"Unknown load cases in combinations: {sorted(unknown)}")
+        return np.array(
+            [[c.factors.get(name, 0.0) for name in self.names] for c in combinations],
+            dtype=float,
+        )
+
+    def combine(self, combinations) -> CombinationResults:
+        """Results of every combination from one matrix product per field."""
+        C = self.factor_matrix(combinations)
+        return CombinationResults(
+            x=self.x,
+            names=[c.name for c in combinations],
+            fields={key: C @ values for key, values in self.fields.items()},
+            reactions=np.einsum("ck,ksr->csr", C, self.reactions),
+        )
@@ -0,0 +1,471 @@
+"""Numeric Euler-Bernoulli beam solver using a banded stiffness matrix.
+
+Drop-in alternative to ``structuralelement.beam2d.Beam2D``: same constructor
+arguments, ``solve()``, ``reactions``, ``data_plot()`` and ``get_minmax()``.
+Nodes are placed at the beam ends, supports, point loads and at both ends of
+every distributed load, and each element between two nodes is a cubic Hermite
+element. Polynomial loads are integrated exactly, so nodal values are exact
+and the element fields are recovered as exact polynomials.
+
+Sign convention: loads and deflections ``w`` are positive downwards,
+``θ = dw/dx``, ``M = -EI·w''`` (sagging positive) and ``V = dM/dx``.
+Reactions are positive upwards.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from scipy.linalg import LinAlgError, solveh_banded
+
+# cubic Hermite element stiffness for dofs (w1, θ1, w2, θ2), to be scaled by EI/L³
+_HERMITE_K = np.array(
+    [
+        [12.0, 6.0, -12.0, 6.0],
+        [6.0, 4.0, -6.0, 2.0],
+        [-12.0, -6.0, 12.0, -6.0],
+        [6.0, 2.0, -6.0, 4.0],
+    ]
+)
+# Hermite shape functions in s = ξ/L as ascending power coefficients of s;
+# rows 1 and 3 (rotational dofs) are still to be multiplied by L
+_HERMITE_N = np.array(
+    [
+        [1.0, 0.0, -3.0, 2.0],
+        [0.0, 1.0, -2.0, 1.0],
+        [0.0, 0.0, 3.0, -2.0],
+        [0.0, 0.0, -1.0, 1.0],
+    ]
+)
+# result fields in the order returned by data_plot()
+FIELDS = ("w", "θ", "V", "M")
+# restrained dofs (w, θ) per support kind
+_RESTRAINTS = {"fixed": (True, True), "simple": (True, False), "free": (False, False)}
+
+
+def load_polynomial(expr) -> np.ndarray:
+    """Ascending coefficients of a distributed load q(x) in global x.
+
+    Accepts a coefficient sequence ``(a0, a1, a2, ...)`` or the string form
+    used by Beam2D, e.g. ``"50 + 0*x + 2*x**2"``.
+    """
+    if isinstance(expr, str):
+        return np.array(_parse_polynomial("".join(expr.split())))
+    coeffs = np.atleast_1d(np.asarray(expr, dtype=float))
+    return coeffs if coeffs.size else np.zeros(1)
+
+
+@lru_cache(maxsize=1024)
+def _parse_polynomial(expr: str) -> tuple:
+    """Parse a load expression once; batches repeat the same few strings."""
+    import sympy
+
+    x = sympy.Symbol("x")
+    poly = sympy.Poly(sympy.sympify(expr, locals={"x": x}), x)
+    return tuple(float(a) for a in reversed(poly.all_coeffs()))
+
+
+def _shift_polynomial(coeffs: np.ndarray, x0: np.ndarray) -> np.ndarray:
+    """Coefficients of p(x0 + ξ) in ξ for each origin in x0, shape (n, deg+1)."""
+    deg = coeffs.size - 1
+    shifted = np.zeros((x0.size, deg + 1))
+    for k, ak in enumerate(coeffs):
+        # binomial expansion of (x0 + ξ)**k
+        for j in range(k + 1):
+            shifted[:, j] += ak * _binomial(k, j) * x0 ** (k - j)
+    return shifted
+
+
+def _binomial(n: int, k: int) -> float:
+    return float(np.prod(np.arange(n - k + 1, n + 1)) / np.prod(np.arange(1, k + 1)))
+
+
+def _polyval(coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Evaluate row-wise ascending polynomials ``coeffs[i]`` at ``x[i, :]``."""
+    result = np.zeros_like(x)
+    for k in range(coeffs.shape[1] - 1, -1, -1):
+        result = result * x + coeffs[:, k : k + 1]
+    return result
+
+
+def _derivative(coeffs: np.ndarray) -> np.ndarray:
+    """Row-wise derivative of ascending polynomial coefficients (same width)."""
+    powers = np.arange(1, coeffs.shape[1])
+    deriv = np.zeros_like(coeffs)
+    deriv[:, :-1] = coeffs[:, 1:] * powers
+    return deriv
+
+
+def polynomial_roots(coeffs: np.ndarray, rtol: float = 1e-12):
+    """Complex roots of row-wise ascending polynomials.
+
+    Rows are grouped by effective degree (trailing coefficients below rtol of
+    the row's largest one are dropped) and the eigenvalues of the companion
+    matrices of each group are computed in one batched call. Returns the row
+    index of every root and the roots themselves as flat arrays.
+    """
+    magnitude = np.abs(coeffs)
+    significant = magnitude > rtol * magnitude.max(axis=1, keepdims=True)
+    degree = np.where(
+        significant.any(axis=1),
+        coeffs.shape[1] - 1 - np.argmax(significant[:, ::-1], axis=1),
+        0,
+    )
+    rowsOut, rootsOut = [], []
+    for d in np.unique(degree[degree > 0]):
+        rows = np.flatnonzero(degree == d)
+        monic = coeffs[rows, :d] / coeffs[rows, d : d + 1]
+        companion = np.zeros((rows.size, d, d))
+        companion[:, np.arange(1, d), np.arange(d - 1)] = 1.0
+        companion[:, :, -1] = -monic
+        rowsOut.append(np.repeat(rows, d))
+        rootsOut.append(np.linalg.eigvals(companion).ravel())
+    if not rowsOut:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=complex)
+    return np.concatenate(rowsOut), np.concatenate(rootsOut)
+
+
+def _banded_upper(rows, cols, values, size, bandwidth) -> np.ndarray:
+    """Upper banded storage (as used by solveh_banded) of a symmetric matrix
+    given by its COO entries; only entries with row <= col are kept."""
+    ab = np.zeros((bandwidth + 1, size))
+    upper = rows <= cols
+    np.add.at(ab, (bandwidth + rows[upper] - cols[upper], cols[upper]), values[upper])
+    return ab
+
+
+def _reduce_banded(ab: np.ndarray, keep: np.ndarray) -> np.ndarray:
+    """Upper banded storage of the submatrix K[keep][:, keep]."""
+    bandwidth = ab.shape[0] - 1
+    reduced = np.zeros((bandwidth + 1, keep.size))
+    for d in range(min(bandwidth + 1, keep.size)):
+        # reduced entry (jr - d, jr) maps to full entry (keep[jr - d], keep[jr])
+        i, j = keep[: keep.size - d], keep[d:]
+        inBand = j - i <= bandwidth
+        reduced[bandwidth - d, d:][inBand] = ab[bandwidth + i - j, j][inBand]
+    return reduced
+
+
+def node_index(xNodes: np.ndarray, x: float) -> int:
+    """Index of the mesh node closest to x."""
+    return int(np.argmin(np.abs(xNodes - x)))
+
+
+def node_dofs(xNodes: np.ndarray, hinges=()):
+    """Global dof numbers (w, θ left, θ right) of every node.
+
+    Dofs are numbered node by node so the stiffness matrix stays banded.
+    Interior hinge nodes get a second, independent rotation; elsewhere the
+    left and right rotations are the same dof.
+    """
+    isHinge = np.zeros(xNodes.size, dtype=bool)
+    for x in hinges:
+        isHinge[node_index(xNodes, x)] = True
+    isHinge[[0, -1]] = False  # a hinge at a free end releases nothing
+    wDof = np.concatenate(([0], np.cumsum(2 + isHinge)[:-1]))
+    thetaLeft = wDof + 1
+    return wDof, thetaLeft, thetaLeft + isHinge
+
+
+def element_stiffness(xNodes: np.ndarray, EI: float, nodeDofs=None):
+    """Element stiffness matrices (nElem, 4, 4), the per-dof length factors of
+    the rotational dofs (nElem, 4) and the global dof map (nElem, 4)."""
+    wDof, thetaLeft, thetaRight = nodeDofs or node_dofs(xNodes)
+    le = np.diff(xNodes)
+    ones = np.ones_like(le)
+    scale = np.stack([ones, le, ones, le], axis=1)
+    ke = _HERMITE_K * (EI / le**3)[:, None, None]
+    ke = ke * scale[:, :, None] * scale[:, None, :]
+    dofs = np.stack([wDof[:-1], thetaRight[:-1], wDof[1:], thetaLeft[1:]], axis=1)
+    return ke, scale, dofs
+
+
+def restrained_dofs(xNodes: np.ndarray, supports, nodeDofs=None) -> np.ndarray:
+    """Boolean mask of the dofs fixed by the supports."""
+    wDof, thetaLeft, thetaRight = nodeDofs or node_dofs(xNodes)
+    restrained = np.zeros(thetaRight[-1] + 1, dtype=bool)
+    for x, kind in supports:
+        if kind not in _RESTRAINTS:
+            raise ValueError(f"Unknown support type '{kind}'")
+        node = node_index(xNodes, x)
+        fixW, fixTheta = _RESTRAINTS[kind]
+        restrained[wDof[node]] |= fixW
+        restrained[[thetaLeft[node], thetaRight[node]]] |= fixTheta
+    return restrained
+
+
+def solve_stiffness(ke, dofs, restrained, F) -> np.ndarray:
+    """Displacements of K·u = F with restrained dofs set to zero.
+
+    The banded Cholesky factorization costs O(nDof), i.e. it grows linearly
+    with the number of spans. F may hold several load vectors as columns,
+    shape (nDof, nCases); they share one factorization.
+    """
+    nDof = restrained.size
+    bandwidth = int(np.max(dofs.max(axis=1) - dofs.min(axis=1)))
+    rows = np.broadcast_to(dofs[:, :, None], ke.shape).ravel()
+    cols = np.broadcast_to(dofs[:, None, :], ke.shape).ravel()
+    ab = _banded_upper(rows, cols, ke.ravel(), nDof, bandwidth)
+    free = np.flatnonzero(~restrained)
+    u = np.zeros_like(F, dtype=float)
+    if free.size:
+        try:
+            u[free] = solveh_banded(_reduce_banded(ab, free), F[free])
+        except LinAlgError:
+            raise ValueError(
+                "The beam is unstable (mechanism): add or change supports"
+            ) from None
+    return u
+
+
+def nodal_residual(ke, dofs, u, F) -> np.ndarray:
+    """K·u - F, i.e. the support reactions acting on the beam in the direction
+    of the dofs (zero at free dofs); works column-wise for 2D u and F."""
+    internal = np.zeros_like(F, dtype=float)
+    np.add.at(internal, dofs, np.einsum("eij,ej...->ei...", ke, u[dofs]))
+    return internal - F
+
+
+class NumericBeam2D:
+    """Euler-Bernoulli beam solved with a banded stiffness matrix."""
+
+    def __init__(
+        self,
+        youngModulus,
+        inertia,
+        length,
+        supports=(),
+        pointLoads=(),
+        pointMoments=(),
+        distributedLoads=(),
+        meshPoints=(),
+        hinges=(),
+    ):
+        self.youngModulus = float(youngModulus)
+        self.inertia = float(inertia)
+        self.length = float(length)
+        self.supports = [(float(x), str(kind).lower()) for x, kind in supports]
+        self.pointLoads = [(float(x), float(p)) for x, p in pointLoads]
+        self.pointMoments = [(float(x), float(m)) for x, m in pointMoments]
+        self.distributedLoads = [
+            ((float(x1), float(x2)), load_polynomial(expr))
+            for (x1, x2), expr in distributedLoads
+        ]
+        # extra node positions, e.g. to share one mesh between load cases
+        self.meshPoints = [float(x) for x in meshPoints]
+        # internal hinges (moment releases)
+        self.hinges = [float(x) for x in hinges]
+        self.reactions = []
+        self._fieldCoeffs = None
+
+    @property
+    def EI(self):
+        return self.youngModulus * self.inertia
+
+    # --- MESH ---
+    def key_points(self) -> list:
+        """Positions where the fields may have kinks or jumps."""
+        keyPoints = [0.0, self.length] + self.meshPoints + self.hinges
+        keyPoints += [x for x, _ in self.supports]
+        keyPoints += [x for x, _ in self.pointLoads]
+        keyPoints += [x for x, _ in self.pointMoments]
+        for (x1, x2), _ in self.distributedLoads:
+            keyPoints += [x1, x2]
+        return keyPoints
+
+    def _build_nodes(self):
+        nodes = np.unique(np.clip(self.key_points(), 0.0, self.length))
+        # merge nodes closer than a relative tolerance
+        tol = 1e-9 * self.length
+        return nodes[np.concatenate(([True], np.diff(nodes) > tol))]
+
+    def _element_loads(self):
+        """Ascending local load coefficients q(ξ) per element, ξ from its start."""
+        xa, le = self.xNodes[:-1], np.diff(self.xNodes)
+        degree = max((q.size - 1 for _, q in self.distributedLoads), default=0)
+        qLocal = np.zeros((le.size, degree + 1))
+        tol = 1e-9 * self.length
+        for (x1, x2), q in self.distributedLoads:
+            lo, hi = min(x1, x2), max(x1, x2)
+            inside = (xa >= lo - tol) & (xa + le <= hi + tol)
+            if np.any(inside):
+                qLocal[inside, : q.size] += _shift_polynomial(q, xa[inside])
+        return qLocal
+
+    # --- SOLVER ---
+    def solve(self):
+        self.xNodes = self._build_nodes()
+        le = np.diff(self.xNodes)
+        nodeDofs = node_dofs(self.xNodes, self.hinges)
+        wDof, thetaLeft, thetaRight = nodeDofs
+        ke, scale, dofs = element_stiffness(self.xNodes, self.EI, nodeDofs)
+        restrained = restrained_dofs(self.xNodes, self.supports, nodeDofs)
+        # consistent load vectors from exact polynomial integration
+        qLocal = self._element_loads()
+        fe = self._consistent_loads(qLocal, le, scale)
+        F = np.zeros(restrained.size)
+        np.add.at(F, dofs, fe)
+        for x, p in self.pointLoads:
+            F[wDof[node_index(self.xNodes, x)]] += p
+        for x, m in self.pointMoments:
+            F[thetaLeft[node_index(self.xNodes, x)]] += m
+        u = solve_stiffness(ke, dofs, restrained, F)
+        self.displacements = u
+        # reactions from nodal equilibrium, K·u = F + R
+        residual = nodal_residual(ke, dofs, u, F)
+        self.reactions = []
+        for x, kind in self.supports:
+            node = node_index(self.xNodes, x)
+            fixW, fixTheta = _RESTRAINTS[kind]
+            # at a hinge node both rotations of a fixed support carry moment
+            mReaction = residual[thetaLeft[node] : thetaRight[node] + 1].sum()
+            self.reactions.append(
+                (
+                    float(self.xNodes[node]),
+                    kind,
+                    float(-residual[wDof[node]]) if fixW else None,
+                    float(-mReaction) if fixTheta else None,
+                )
+            )
+        # exact element polynomials of w(ξ)
+        self.wCoeffs = self._element_deflections(qLocal, le, u[dofs], scale)
+        self._fieldCoeffs = None
+        return self
+
+    def _consistent_loads(self, qLocal, le, scale):
+        """Equivalent nodal loads ∫ N·q dξ, exact by Gauss-Legendre quadrature."""
+        nGauss = (qLocal.shape[1] + 3) // 2 + 1
+        s, weights = np.polynomial.legendre.leggauss(nGauss)
+        s = 0.5 * (s + 1.0)  # map to [0, 1]
+        sPowers = s[:, None] ** np.arange(4)
+        shape = sPowers @ _HERMITE_N.T  # (nGauss, 4)
+        q = _polyval(qLocal, s[None, :] * le[:, None])  # (nElem, nGauss)
+        fe = np.einsum("eg,gi,g->ei", q, shape, 0.5 * weights)
+        return fe * scale * le[:, None]
+
+    def _element_deflections(self, qLocal, le, ue, scale):
+        """Ascending coefficients of w(ξ) per element, homogeneous Hermite part
+        plus the fixed-fixed particular solution of EI·w'''' = q."""
+        degree = max(3, qLocal.shape[1] + 3)
+        coeffs = np.zeros((le.size, degree + 1))
+        # Hermite interpolation of the nodal dofs, converted from s to ξ
+        hermite = (ue * scale) @ _HERMITE_N
+        coeffs[:, :4] = hermite / le[:, None] ** np.arange(4)
+        # particular solution: Q = ∫∫∫∫ q/EI plus c2·ξ² + c3·ξ³ to clamp both ends
+        k = np.arange(qLocal.shape[1])
+        factor = 1.0 / ((k + 1) * (k + 2) * (k + 3) * (k + 4))
+        Q = np.zeros((le.size, degree + 1))
+        Q[:, 4 : 4 + k.size] = qLocal * factor / self.EI
+        QL = _polyval(Q, le[:, None])[:, 0]
+        dQL = _polyval(_derivative(Q), le[:, None])[:, 0]
+        Q[:, 2] += dQL / le - 3 * QL / le**2
+        Q[:, 3] += (2 * QL - dQL * le) / le**3
+        return coeffs + Q
+
+    # --- RESULTS ---
+    def _fields(self):
+        """Ascending coefficients of w, θ, V and M per element, computed once
+        per solve and cached on the beam."""
+        if self._fieldCoeffs is None:
+            w = self.wCoeffs
+            theta = _derivative(w)
+            m = -self.EI * _derivative(theta)
+            v = _derivative(m)
+            self._fieldCoeffs = (w, theta, v, m)
+        return self._fieldCoeffs
+
+    def _evaluate(self, coeffs, elements, xi):
+        """Horner evaluation of coeffs[elements] at local coordinates xi,
+        gathering one coefficient column at a time to keep memory O(len(xi))."""
+        columns = np.ascontiguousarray(coeffs.T)
+        result = np.zeros_like(xi)
+        for k in range(columns.shape[0] - 1, -1, -1):
+            result *= xi
+            result += np.take(columns[k], elements)
+        return result
+
+    def field_function(self, key):
+        """Vectorized callable f(x) of field "w", "θ", "V" or "M" over any
+        array of positions; at a node the value just to its right is used."""
+        coeffs = dict(zip(FIELDS, self._fields()))[key]
+        xNodes = self.xNodes
+
+        def evaluate(x):
+            x = np.asarray(x, dtype=float)
+            elements = np.clip(
+                np.searchsorted(xNodes, x, side="right") - 1, 0, xNodes.size - 2
+            )
+            return self._evaluate(coeffs, elements, x - xNodes[elements])
+
+        return evaluate
+
+    def deflection_at(self, x):
+        return self.field_function("w")(x)
+
+    def slope_at(self, x):
+        return self.field_function("θ")(x)
+
+    def shear_at(self, x):
+        return self.field_function("V")(x)
+
+    def moment_at(self, x):
+        return self.field_function("M")(x)
+
+    def data_plot(self, n_points=500):
+        """Sampled x, w, θ, V, M with NaN separators between elements.
+
+        About n_points samples are spread over the beam in proportion to the
+        element lengths, with at least both ends of every element.
+        """
+        le = np.diff(self.xNodes)
+        counts = np.maximum(2, np.ceil(n_points * le / self.length)).astype(int)
+        # one extra slot per element for the NaN separator
+        elements = np.repeat(np.arange(le.size), counts + 1)
+        starts = np.concatenate(([0], np.cumsum(counts + 1)[:-1]))
+        local = np.arange(elements.size) - np.repeat(starts, counts + 1)
+        separator = local == np.repeat(counts, counts + 1)
+        xi = (
+            le[elements]
+            * np.minimum(local, counts[elements] - 1)
+            / (counts[elements] - 1)
+        )
+        arrays = [self.xNodes[elements] + xi]
+        arrays += [self._evaluate(c, elements, xi) for c in self._fields()]
+        for values in arrays:
+            values[separator] = np.nan
+        return tuple(values[:-1] for values in arrays)
+
+    def get_minmax(self):
+        """Exact max and min of w, θ, V and M with their positions.
+
+        Candidates are the element ends plus the real roots of the derivative
+        of every element polynomial; all values are plain floats and the
+        position is a list when the extreme is reached at several points.
+        """
+        le = np.diff(self.xNodes)
+        # work in s = ξ/le ∈ [0, 1] so all coefficients have comparable scale
+        sPowers = le[:, None] ** np.arange(self.wCoeffs.shape[1])
+        minmax = {}
+        for key, coeffs in zip(FIELDS, self._fields()):
+            coeffs = coeffs * sPowers
+            rows, roots = polynomial_roots(_derivative(coeffs))
+            inside = (np.abs(roots.imag) < 1e-9) & (roots.real > 0) & (roots.real < 1)
+            elements = np.concatenate(
+                [np.arange(le.size), np.arange(le.size), rows[inside]]
+            )
+            sVals = np.concatenate(
+                [np.zeros(le.size), np.ones(le.size), roots.real[inside]]
+            )
+            values = _polyval(coeffs[elements], sVals[:, None])[:, 0]
+            xVals = self.xNodes[elements] + sVals * le[elements]
+            tol = 1e-9 * max(np.max(np.abs(values)), np.finfo(float).tiny)
+            minmax[key] = {}
+            for bound, extreme in (("max", values.max()), ("min", values.min())):
+                positions = np.unique(
+                    np.round(xVals[np.abs(values - extreme) <= tol], 9)
+                )
+                positions = [float(x) for x in positions]
+                minmax[key][bound] = (
+                    positions[0] if len(positions) == 1 else positions,
+                    float(extreme),
+                )
+        return minmax
@@ -0,0 +1,3 @@
+"""Material constants shared by the beam, pile and section modules."""
+
+STEEL_DENSITY = 7850.0  # [kg/m³]
@@ -0,0 +1,233 @@
+"""Stratigraphy from cone penetration test (CPT) logs.
+
+Logs are CSV, semicolon or whitespace separated text with an optional header
+row naming the columns: depth [m] (``depth``, ``z`` or ``penetration``), cone
+resistance (``qt``, or ``qc`` corrected with ``u2`` when present) and pore
+pressure ``u2``. Files are streamed in chunks of lines, so memory does not
+depend on the number of readings:
+
+1. every reading gives cu = (qt - σv0) / Nkt, with σv0 = γ·z;
+2. readings are accumulated into fixed-depth bins (count, Σcu, Σcu²);
+3. adjacent bins are merged bottom-up with Ward's criterion, the pair whose
+   merge adds the least scatter first, while the merged layer stays below a
+   coefficient of variation, and layers thinner than a minimum are merged
+   into their closest neighbour;
+4. alpha follows API RP 2A: α = 0.5·ψ^-0.5 for ψ ≤ 1, 0.5·ψ^-0.25 above,
+   with ψ = cu/σ'v0 at mid-layer and α ≤ 1.
+"""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from pathlib import Path
+
+import numpy as np
+
+from engineering.pile import SoilLayer
+
+WATER_UNIT_WEIGHT = 9.81e3  # [N/m³]
+CPT_SUFFIXES = (".csv", ".txt", ".dat", ".cpt")
+
+
+def _text_stream(source):
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, encoding="utf-8", errors="replace"), True
+    if isinstance(source, io.TextIOBase):
+        return source, False
+    return io.TextIOWrapper(source, encoding="utf-8", errors="replace"), False
+
+
+def _split(line):
+    delimiter = "," if "," in line else ";" if ";" in line else None
+    fields = [field.strip().lower() for field in line.split(delimiter)]
+    if delimiter is None:  # unit tokens such as "(m)" are not columns
+        fields = [field for field in fields if not field.startswith(("(", "["))]
+    return delimiter, fields
+
+
+def _is_numeric(fields):
+    try:
+        [float(field) for field in fields if field]
+    except ValueError:
+        return False
+    return bool(fields)
+
+
+def _columns(header):
+    """Column indices of depth, cone resistance and pore pressure (or None)."""
+    if header is None:
+        return 0, 1, None, False
+
+    def find(*prefixes):
+        for prefix in prefixes:
+            for i, name in enumerate(header):
+                if name.startswith(prefix):
+                    return i
+        return None
+
+    depth = find("depth", "z", "penetration")
+    qt = find("qt")
+    qc = find("qc")
+    if depth is None or (qt is None and qc is None):
+        raise ValueError(f"CPT header needs depth and qt or qc columns: {header}")
+    return depth, qt if qt is not None else qc, find("u2"), qt is None
+
+
+def read_cpt(source, chunkSize=100_000, pressureUnit=1e6, netAreaRatio=0.8):
+    """Yield (depth [m], qt [Pa]) arrays, chunkSize readings at a time.
+
+    source is a path or an open text or binary stream; pressures in the file
+    are multiplied by pressureUnit (1e6 for MPa).
+    """
+    stream, owned = _text_stream(source)
+    try:
+        header = None
+        for line in stream:
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            delimiter, fields = _split(line)
+            if _is_numeric(fields):
+                first = line
+                break
+            header = fields
+        else:
+            return
+        depthCol, coneCol, u2Col, correct = _columns(header)
+        usecols = [depthCol, coneCol] + (
+            [u2Col] if correct and u2Col is not None else []
+        )
+        lines = chain([first], stream)
+        while chunk := list(islice(lines, chunkSize)):
+            data = np.loadtxt(
+                chunk, delimiter=delimiter, usecols=usecols, ndmin=2, comments="#"
+            )
+            qt = data[:, 1] * pressureUnit
+            if data.shape[1] == 3:  # qc corrected for the pore pressure
+                qt += (1 - netAreaRatio) * data[:, 2] * pressureUnit
+            yield data[:, 0], qt
+    finally:
+        if owned:
+            stream.close()
+        elif stream is not source:
+            stream.detach()  # leave the caller's binary stream open
+
+
+def _bin_readings(chunks, binWidth, Nkt, unitWeight):
+    """Count, Σcu and Σcu² of the readings in every depth bin."""
+    count, total, squares = (np.zeros(0) for _ in range(3))
+    for depth, qt in chunks:
+        cu = (qt - unitWeight * depth) / Nkt
+        index = np.floor(depth / binWidth).astype(int)
+        keep = (index >= 0) & np.isfinite(cu)
+        index, cu = index[keep], cu[keep]
+        if not index.size:
+            continue
+        size = max(count.size, int(index.max()) + 1)
+        count, total, squares = (
+            np.pad(a, (0, size - a.size)) for a in (count, total, squares)
+        )
+        count += np.bincount(index, minlength=size)
+        total += np.bincount(index, weights=cu, minlength=size)
+        squares += np.bincount(index, weights=cu**2, minlength=size)
+    return count, total, squares
+
+
+def _merge_bins(count, total, squares, binWidth, maxCov, minThickness):
+    """(top, bottom, cu) of the homogeneous layers built from the bins."""
+    occupied = np.flatnonzero(count)
+    if not occupied.size:
+        raise ValueError("The CPT log has no valid readings")
+    # segments: top depth, reading count, Σcu, Σcu²; each reaches the next top
+    tops = occupied * binWidth
+    tops[0] = 0.0
+    n, s, q = count[occupied], total[occupied], squares[occupied]
+    bottom = (occupied[-1] + 1) * binWidth
+
+    def merge(i):
+        nonlocal tops, n, s, q
+        n[i], s[i], q[i] = n[i] + n[i + 1], s[i] + s[i + 1], q[i] + q[i + 1]
+        tops, n, s, q = (np.delete(a, i + 1) for a in (tops, n, s, q))
+
+    while n.size > 1:
+        mean = s / n
+        nn, ss, qq = n[:-1] + n[1:], s[:-1] + s[1:], q[:-1] + q[1:]
+        mergedMean = ss / nn
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = np.sqrt(np.maximum(qq / nn - mergedMean**2, 0)) / np.abs(mergedMean)
+        ward = n[:-1] * n[1:] / nn * (mean[:-1] - mean[1:]) ** 2
+        ward[~(cov <= maxCov)] = np.inf
+        i = int(np.argmin(ward))
+        if not np.isfinite(ward[i]):
+            break
+        merge(i)
+    # layers thinner than the minimum join the neighbour with the closest mean
+    while n.size > 1:
+        thickness = np.diff(np.append(tops, bottom))
+        i = int(np.argmin(thickness))
+        if thickness[i] >= minThickness:
+            break
+        mean = s / n
+        below = i < n.size - 1
+        if i == 0 or (
+            below and abs(mean[i + 1] - mean[i]) < abs(mean[i - 1] - mean[i])
+        ):
+            merge(i)
+        else:
+            merge(i - 1)
+    bottoms = np.append(tops[1:], bottom)
+    return list(zip(tops, bottoms, s / n))
+
+
+def api_alpha(cu, effectiveStress):
+    """Adhesion factor of API RP 2A for cu and σ'v0 in the same units."""
+    psi = np.asarray(cu, dtype=float) / np.asarray(effectiveStress, dtype=float)
+    alpha = np.where(psi <= 1, 0.5 * psi**-0.5, 0.5 * psi**-0.25)
+    return np.minimum(alpha, 1.0)
+
+
+def cpt_stratigraphy(
+    source,
+    binWidth=0.1,
+    Nkt=15.0,
+    unitWeight=18e3,
+    waterDepth=0.0,
+    maxCov=0.25,
+    minThickness=0.5,
+    chunkSize=100_000,
+    pressureUnit=1e6,
+) -> list[SoilLayer]:
+    """Homogeneous ``SoilLayer`` objects from one CPT log.
+
+    unitWeight is the bulk unit weight [N/m³], waterDepth the depth of the
+    water table [m] used for the effective stress in alpha.
+    """
+    chunks = read_cpt(source, chunkSize, pressureUnit)
+    count, total, squares = _bin_readings(chunks, binWidth, Nkt, unitWeight)
+    layers = _merge_bins(count, total, squares, binWidth, maxCov, minThickness)
+    mid = np.array([(top + bottom) / 2 for top, bottom, _ in layers])
+    effective = unitWeight * mid - WATER_UNIT_WEIGHT * np.maximum(mid - waterDepth, 0)
+    cu = np.array([max(c, 1.0) for _, _, c in layers])
+    alpha = api_alpha(cu, np.maximum(effective, 1.0))
+    return [
+        SoilLayer(float(bottom - top), float(c), float(a))
+        for (top, bottom, _), c, a in zip(layers, cu, alpha)
+    ]
+
+
+def import_directory(directory, workers=None, **kwargs) -> dict:
+    """Stratigraphy of every CPT log in a directory, one process per log;
+    returns file name -> list of SoilLayer, or the error for that file."""
+    paths = sorted(
+        p for p in Path(directory).iterdir() if p.suffix.lower() in CPT_SUFFIXES
+    )
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {p.name: pool.submit(cpt_stratigraphy, p, **kwargs) for p in paths}
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            results[name] = e
+    return results
@@ -0,0 +1,117 @@
+"""Shape-preserving downsampling of plotted series.
+
+Both methods keep the NaN separators that split a series into independent
+segments (e.g. the elements of a solved beam) and share the point budget
+between the segments in proportion to their length:
+
+* ``minmax``: the x-range of each segment is cut into buckets and the minimum
+  and maximum of every bucket are kept, so no peak is ever lost.
+* ``lttb``: Largest-Triangle-Three-Buckets keeps one point per bucket, the
+  one forming the largest triangle with its neighbours; smoother, but a peak
+  may be shaved when it shares a bucket with a larger feature.
+
+The output never exceeds the budget. With more segments than a third of it,
+there is no room for two points and a separator each, so the separators are
+dropped and the joined series is decimated instead.
+"""
+
+import numpy as np
+
+METHODS = ("minmax", "lttb")
+
+
+def _segments(y):
+    """(start, stop) of every run of finite values."""
+    finite = np.concatenate(([False], np.isfinite(y), [False]))
+    edges = np.flatnonzero(np.diff(finite.astype(np.int8)))
+    return edges.reshape(-1, 2)
+
+
+def _minmax_indices(y, nOut):
+    """Indices of the endpoints and of the min and max of equal-count
+    buckets, at most nOut in total."""
+    n = y.size
+    if nOut < 4:  # no room for a bucket: endpoints and the largest |y|
+        keep = [0, n - 1] + ([int(np.argmax(np.abs(y)))] if nOut == 3 else [])
+        return np.unique(keep)
+    nBuckets = (nOut - 2) // 2
+    edges = np.linspace(0, n, nBuckets + 1).astype(int)
+    edges = np.unique(edges)
+    bucket = np.repeat(np.arange(edges.size - 1), np.diff(edges))
+    order = np.lexsort((y, bucket))  # by bucket, then by value
+    starts, stops = edges[:-1], edges[1:] - 1
+    keep = np.concatenate((order[starts], order[stops], [0, n - 1]))
+    return np.unique(keep)
+
+
+def _lttb_indices(x, y, nOut):
+    """Largest-Triangle-Three-Buckets indices, endpoints always kept."""
+    n = x.size
+    if nOut >= n or nOut < 3:
+        return np.arange(n) if nOut >= n else np.array([0, n - 1])
+    edges = np.linspace(1, n - 1, nOut - 1).astype(int)
+    keep = np.empty(nOut, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(nOut - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # average of the next bucket (the last point for the final bucket)
+        nextLo, nextHi = hi, edges[i + 2] if i + 2 < edges.size else n
+        xNext, yNext = x[nextLo:nextHi].mean(), y[nextLo:nextHi].mean()
+        area = np.abs(
+            (x[a] - xNext) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (yNext - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def _indices(x, y, nOut, method):
+    if y.size <= nOut:
+        return np.arange(y.size)
+    if method == "minmax":
+        return _minmax_indices(y, nOut)
+    return _lttb_indices(x, y, nOut)
+
+
+def _separator_x(x):
+    """x with NaN entries replaced by the previous finite x, so separators
+    only blank y, as in decimated output."""
+    missing = np.isnan(x)
+    if not missing.any():
+        return x
+    index = np.where(missing, 0, np.arange(x.size))
+    np.maximum.accumulate(index, out=index)
+    return x[index]
+
+
+def decimate(x, y, maxPoints=1000, method="minmax"):
+    """(x, y) reduced to at most maxPoints samples, NaN separators included;
+    series already within the budget keep every sample. Separators are NaN
+    in y only; their x repeats the last x of the segment before."""
+    if method not in METHODS:
+        raise ValueError(f"Unknown decimation method {method!r}; use {METHODS}")
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if y.size <= maxPoints:
+        return _separator_x(x), y
+    segments = _segments(y)
+    if len(segments) > maxPoints // 3:
+        # too many segments for two points and a separator each: join them
+        # and decimate the finite values as one series
+        finite = np.isfinite(y)
+        x, y = x[finite], y[finite]
+        index = _indices(x, y, maxPoints, method)
+        return x[index], y[index]
+    lengths = segments[:, 1] - segments[:, 0]
+    # two points per segment, the rest shared in proportion to the length
+    spare = maxPoints - (len(segments) - 1) - 2 * len(segments)
+    shares = 2 + spare * lengths // max(lengths.sum(), 1)
+    pieces = []
+    for (start, stop), share in zip(segments, shares):
+        xs, ys = x[start:stop], y[start:stop]
+        index = _indices(xs, ys, int(share), method)
+        pieces.append((xs[index], ys[index]))
+        pieces.append((xs[-1:], np.array([np.nan])))  # segment separator
+    xOut = np.concatenate([p[0] for p in pieces[:-1]])
+    yOut = np.concatenate([p[1] for p in pieces[:-1]])
+    return xOut, yOut
@@ -0,0 +1,170 @@
+"""Structural and geotechnical axial capacity of steel tube piles.
+
+The scalar functions evaluate one ``PileGeometry``; ``evaluate_pile_grid``
+evaluates the same formulas over NumPy arrays of L, D and t (any broadcast
+shapes) so whole design spaces are checked in one pass.
+
+Skin friction comes from a ``FrictionProfile``: the integral of alpha·cu over
+depth, stored at the layer boundaries once per stratigraphy, so the capacity
+at any array of depths is a searchsorted plus a linear interpolation.
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# --- DATACLASSES ---
+@dataclass
+class SteelProperties:
+    fy: float  # yield strength [MPa]
+    fu: float  # ultimate strength [MPa]
+    gamma_M0: float = 1.0
+    gamma_M1: float = 1.1
+
+
+@dataclass
+class PileGeometry:
+    length: float  # [m]
+    diameter: float  # [m]
+    thickness: float  # [m]
+
+    @property
+    def area(self):
+        return math.pi * (
+            (self.diameter / 2) ** 2 - ((self.diameter - 2 * self.thickness) / 2) ** 2
+        )
+
+
+@dataclass
+class SoilLayer:
+    thickness: float  # [m]
+    cu: float  # undrained cohesion [Pa]
+    alpha: float  # adhesion factor
+
+
+@dataclass
+class FrictionProfile:
+    boundaries: np.ndarray  # layer tops plus the base of the last layer [m]
+    unitFriction: np.ndarray  # alpha·cu of every layer [Pa]
+    cumulative: np.ndarray  # ∫ alpha·cu dz from the surface to each boundary [N/m]
+    cu: np.ndarray  # undrained cohesion of every layer [Pa]
+
+    @classmethod
+    def from_layers(cls, layers: list[SoilLayer]):
+        thickness = np.array([layer.thickness for layer in layers], dtype=float)
+        unitFriction = np.array(
+            [layer.alpha * layer.cu for layer in layers], dtype=float
+        )
+        return cls(
+            boundaries=np.concatenate(([0.0], np.cumsum(thickness))),
+            unitFriction=unitFriction,
+            cumulative=np.concatenate(([0.0], np.cumsum(unitFriction * thickness))),
+            cu=np.array([layer.cu for layer in layers], dtype=float),
+        )
+
+    def layer_at(self, depth):
+        """Index of the layer at each depth; a depth on a boundary belongs to
+        the layer below, depths under the last layer to the last layer."""
+        index = np.searchsorted(self.boundaries, depth, side="right") - 1
+        return np.clip(index, 0, self.cu.size - 1)
+
+    def friction_integral(self, depth):
+        """∫ alpha·cu dz from the surface to each depth [N/m]; no friction is
+        mobilised below the last layer."""
+        depth = np.clip(depth, 0.0, self.boundaries[-1])
+        i = self.layer_at(depth)
+        return self.cumulative[i] + self.unitFriction[i] * (depth - self.boundaries[i])
+
+    def capacity(self, depth, diameter, Nc=9):
+        """Skin friction plus end bearing [N] of a pile tip at each depth."""
+        tip = np.pi * (np.asarray(diameter) / 2) ** 2
+        return (
+            np.pi * diameter * self.friction_integral(depth)
+            + self.cu[self.layer_at(depth)] * Nc * tip
+        )
+
+
+# --- STRUCTURAL ---
+def axial_resistance(steel: SteelProperties, geo: PileGeometry):
+    return steel.fy * 1e6 * geo.area / steel.gamma_M0
+
+
+def buckling_resistance(steel: SteelProperties, geo: PileGeometry, K=2.0, E=210e9):
+    A = geo.area
+    Do = geo.diameter
+    t = geo.thickness
+    I = math.pi / 64 * (Do**4 - (Do - 2 * t) ** 4)
+    Lcr = geo.length * K
+    slenderness = Lcr * math.sqrt(steel.fy * 1e6 / (E * math.pi**2)) / math.sqrt(I / A)
+    alpha = 0.49  # curve c for tubes
+    phi = 0.5 * (1 + alpha * (slenderness - 0.2) + slenderness**2)
+    chi = 1 / (phi + math.sqrt(phi**2 - slenderness**2))
+    chi = min(1.0, chi)
+    return chi * steel.fy * 1e6 * A / steel.gamma_M1
+
+
+def plastic_moment_resistance(steel: SteelProperties, geo: PileGeometry):
+    Do = geo.diameter
+    Di = Do - 2 * geo.thickness
+    W_pl = (math.pi / 4) * ((Do / 2) ** 3 - (Di / 2) ** 3)
+    return steel.fy * 1e6 * W_pl / steel.gamma_M0
+
+
+# --- GEOTECHNICAL ---
+def compute_geotechnical_capacity(layers: list[SoilLayer], geo: PileGeometry, Nc=9):
+    profile = FrictionProfile.from_layers(layers)
+    return float(profile.capacity(geo.length, geo.diameter, Nc))
+
+
+# --- EVALUATION ---
+def evaluate_pile_full(steel, geo, soil_layers, K=2.0):
+    N_Rd = axial_resistance(steel, geo)
+    N_b_Rd = buckling_resistance(steel, geo, K)
+    M_Rd = plastic_moment_resistance(steel, geo)
+    Q_geo = compute_geotechnical_capacity(soil_layers, geo)
+    return {
+        "Axial resistance [kN]": N_Rd / 1e3,
+        "Buckling resistance [kN]": N_b_Rd / 1e3,
+        "Moment resistance [kNm]": M_Rd / 1e3,
+        "Geotechnical capacity [kN]": Q_geo / 1e3,
+        "Governing axial capacity [kN]": min(N_Rd, N_b_Rd, Q_geo) / 1e3,
+    }
+
+
+# --- GRID EVALUATION ---
+def evaluate_pile_grid(
+    steel, length, diameter, thickness, soil_layers, K=2.0, E=210e9, Nc=9
+):
+    """``evaluate_pile_full`` over arrays of L, D and t [m].
+
+    The three arrays are broadcast together, so ``np.meshgrid`` grids and
+    flat candidate lists both work; ``steel.fy`` may also be an array that
+    broadcasts with them. Returns the same keys as ``evaluate_pile_full``
+    with arrays of the broadcast shape as values.
+    """
+    L, Do, t = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (length, diameter, thickness))
+    )
+    fy = np.asarray(steel.fy, dtype=float) * 1e6
+    Di = Do - 2 * t
+    A = np.pi / 4 * (Do**2 - Di**2)
+    N_Rd = fy * A / steel.gamma_M0
+    # flexural buckling, curve c
+    I = np.pi / 64 * (Do**4 - Di**4)
+    slenderness = L * K * np.sqrt(fy / (E * np.pi**2)) / np.sqrt(I / A)
+    phi = 0.5 * (1 + 0.49 * (slenderness - 0.2) + slenderness**2)
+    chi = np.minimum(1.0, 1 / (phi + np.sqrt(phi**2 - slenderness**2)))
+    N_b_Rd = chi * fy * A / steel.gamma_M1
+    W_pl = (np.pi / 4) * ((Do / 2) ** 3 - (Di / 2) ** 3)
+    M_Rd = fy * W_pl / steel.gamma_M0
+    Q_geo = FrictionProfile.from_layers(soil_layers).capacity(L, Do, Nc)
+    return {
+        "Axial resistance [kN]": N_Rd / 1e3,
+        "Buckling resistance [kN]": N_b_Rd / 1e3,
+        "Moment resistance [kNm]": M_Rd / 1e3,
+        "Geotechnical capacity [kN]": Q_geo / 1e3,
+        "Governing axial capacity [kN]": np.minimum(np.minimum(N_Rd, N_b_Rd), Q_geo)
+        / 1e3,
+    }
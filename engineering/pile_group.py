@@ -0,0 +1,115 @@
+"""Pile groups under a rigid cap, stored as arrays of pile properties.
+
+A group holds one array per property (coordinates, L, D, t) instead of one
+``PileGeometry`` per pile, so loads, efficiencies, capacities and
+utilisations of every pile come from single vectorized evaluations.
+
+* Load distribution (rigid cap): P = N/n + a·dx + b·dy, where (dx, dy) are
+  the pile offsets from the group centroid and (a, b) solve the 2×2 system
+  of the group's second moments for (My, Mx). For groups symmetric about
+  both axes this is N/n + My·dx/Σdx² + Mx·dy/Σdy². Positive P is
+  compression, and a positive My compresses the piles at +x.
+* Efficiency (Feld's rule): each pile loses 1/16 of its capacity for every
+  adjacent pile, i.e. every pile in the same row, column or diagonal at the
+  closest spacing of the group.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from engineering.pile import FrictionProfile, evaluate_pile_grid
+
+
+@dataclass
+class PileGroup:
+    x: np.ndarray  # [m]
+    y: np.ndarray  # [m]
+    length: np.ndarray  # [m]
+    diameter: np.ndarray  # [m]
+    thickness: np.ndarray  # [m]
+
+    def __post_init__(self):
+        self.x, self.y, self.length, self.diameter, self.thickness = (
+            np.array(v, dtype=float)
+            for v in np.broadcast_arrays(
+                np.atleast_1d(self.x),
+                self.y,
+                self.length,
+                self.diameter,
+                self.thickness,
+            )
+        )
+
+    @classmethod
+    def rectangular(cls, nx, ny, sx, sy, length, diameter, thickness):
+        """nx × ny piles at spacings sx, sy [m], centred on the origin."""
+        x, y = np.meshgrid(
+            (np.arange(nx) - (nx - 1) / 2) * sx, (np.arange(ny) - (ny - 1) / 2) * sy
+        )
+        return cls(x.ravel(), y.ravel(), length, diameter, thickness)
+
+    @property
+    def size(self):
+        return self.x.size
+
+    def distribute(self, N, Mx=0.0, My=0.0) -> np.ndarray:
+        """Axial load of every pile [same unit as N] under the cap loads."""
+        dx, dy = self.x - self.x.mean(), self.y - self.y.mean()
+        inertia = np.array([[dx @ dx, dx @ dy], [dx @ dy, dy @ dy]])
+        if np.linalg.matrix_rank(inertia) < 2:  # single pile or single row
+            a, b = (
+                My / (dx @ dx) if dx @ dx > 0 else 0.0,
+                Mx / (dy @ dy) if dy @ dy > 0 else 0.0,
+            )
+        else:
+            a, b = np.linalg.solve(inertia, [My, Mx])
+        return N / self.size + a * dx + b * dy
+
+    def efficiency(self, rtol=1e-6) -> np.ndarray:
+        """Feld's rule efficiency of every pile."""
+        if self.size == 1:
+            return np.ones(1)
+        distance = np.hypot(
+            self.x[:, None] - self.x[None, :], self.y[:, None] - self.y[None, :]
+        )
+        np.fill_diagonal(distance, np.inf)
+        spacing = distance.min()
+        adjacent = np.count_nonzero(
+            distance <= np.sqrt(2) * spacing * (1 + rtol), axis=1
+        )
+        return np.maximum(1 - adjacent / 16, 0.0)
+
+
+@dataclass
+class GroupResult:
+    load: np.ndarray  # axial load of every pile, compression positive [kN]
+    efficiency: np.ndarray  # Feld's rule factor of every pile
+    compression: np.ndarray  # governing axial capacity of every pile [kN]
+    tension: np.ndarray  # skin friction capacity of every pile [kN]
+    utilisation: np.ndarray  # load over the reduced capacity in its direction
+
+    @property
+    def groupEfficiency(self):
+        return float(
+            np.sum(self.efficiency * self.compression) / np.sum(self.compression)
+        )
+
+    @property
+    def groupCapacity(self):
+        """Sum of the reduced compression capacities [kN]."""
+        return float(np.sum(self.efficiency * self.compression))
+
+
+def analyse_group(group: PileGroup, steel, soil_layers, N, Mx=0.0, My=0.0, K=2.0):
+    """Loads [kN], efficiencies, capacities and utilisations of every pile
+    under the cap loads N [kN], Mx and My [kNm]."""
+    load = group.distribute(N, Mx, My)
+    efficiency = group.efficiency()
+    compression = evaluate_pile_grid(
+        steel, group.length, group.diameter, group.thickness, soil_layers, K
+    )["Governing axial capacity [kN]"]
+    profile = FrictionProfile.from_layers(soil_layers)
+    tension = np.pi * group.diameter * profile.friction_integral(group.length) / 1e3
+    capacity = efficiency * np.where(load >= 0, compression, tension)
+    return GroupResult(load, efficiency, compression, tension, np.abs(load) / capacity)
@@ -0,0 +1,158 @@
+"""Lightest steel tube pile meeting an axial load and a bending moment.
+
+Every resistance grows with the wall thickness t, so for each (L, D) pair
+the thinnest sufficient wall is found by bisection over the sorted wall
+thicknesses instead of checking every wall. All pairs are bisected together
+with ``evaluate_pile_grid``: a pair whose thickest wall fails is dropped
+after one check, and the others need about log2(nWalls) checks each.
+
+``full_sweep`` solves the same problem by evaluating every candidate, for
+comparison.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from engineering.constants import STEEL_DENSITY
+from engineering.pile import PileGeometry, evaluate_pile_full, evaluate_pile_grid
+
+AXIAL = "Governing axial capacity [kN]"
+MOMENT = "Moment resistance [kNm]"
+
+
+@dataclass
+class PileOptimum:
+    geometry: PileGeometry | None  # None when no candidate meets the demand
+    mass: float  # [kg]
+    results: dict | None  # evaluate_pile_full of the selected pile
+    evaluations: int  # candidates checked
+    candidates: int  # size of the design space
+    wallTime: float  # [s]
+
+
+def pile_mass(length, diameter, thickness):
+    """Steel mass of a tube pile [kg]; works on arrays."""
+    inner = diameter - 2 * thickness
+    return STEEL_DENSITY * np.pi / 4 * (diameter**2 - inner**2) * length
+
+
+def _sorted_values(values):
+    return np.unique(np.asarray(values, dtype=float))
+
+
+def _feasible(grid, axialLoad, moment):
+    return (grid[AXIAL] >= axialLoad) & (grid[MOMENT] >= moment)
+
+
+def _optimum(steel, soil_layers, K, L, D, t, mass, evaluations, candidates, start):
+    """PileOptimum of the lightest of the sufficient candidates given."""
+    best = PileOptimum(None, math.inf, None, evaluations, candidates, 0.0)
+    if mass.size:
+        i = int(np.argmin(mass))
+        best.geometry = PileGeometry(float(L[i]), float(D[i]), float(t[i]))
+        best.mass = float(mass[i])
+        best.results = evaluate_pile_full(steel, best.geometry, soil_layers, K)
+    best.wallTime = time.perf_counter() - start
+    return best
+
+
+def optimize_pile(
+    steel,
+    soil_layers,
+    axialLoad,
+    moment=0.0,
+    lengths=(),
+    diameters=(),
+    thicknesses=(),
+    K=2.0,
+):
+    """Lightest (L, D, t) from the candidate values whose governing axial
+    capacity reaches axialLoad [kN] and moment resistance reaches moment
+    [kNm]. Catalogue sizes and discretised continuous ranges both work."""
+    start = time.perf_counter()
+    walls = _sorted_values(thicknesses)
+    L, D = (
+        v.ravel()
+        for v in np.meshgrid(_sorted_values(lengths), _sorted_values(diameters))
+    )
+    # index of the thickest wall that fits each diameter
+    hi = np.searchsorted(walls, D / 2, side="left") - 1
+    candidates = int(np.sum(hi + 1))
+    keep = hi >= 0
+    L, D, hi = L[keep], D[keep], hi[keep]
+    # a pair whose thickest wall fails cannot be made sufficient
+    keep = _feasible(
+        evaluate_pile_grid(steel, L, D, walls[hi], soil_layers, K), axialLoad, moment
+    )
+    evaluations = L.size
+    L, D, hi = L[keep], D[keep], hi[keep]
+    lo = np.zeros_like(hi)
+    # invariant: walls[hi] is sufficient and walls[:lo] are not
+    while (active := np.flatnonzero(lo < hi)).size:
+        mid = (lo[active] + hi[active]) // 2
+        ok = _feasible(
+            evaluate_pile_grid(steel, L[active], D[active], walls[mid], soil_layers, K),
+            axialLoad,
+            moment,
+        )
+        evaluations += active.size
+        hi[active] = np.where(ok, mid, hi[active])
+        lo[active] = np.where(ok, lo[active], mid + 1)
+    t = walls[hi]
+    return _optimum(
+        steel,
+        soil_layers,
+        K,
+        L,
+        D,
+        t,
+        pile_mass(L, D, t),
+        evaluations,
+        candidates,
+        start,
+    )
+
+
+def full_sweep(
+    steel,
+    soil_layers,
+    axialLoad,
+    moment=0.0,
+    lengths=(),
+    diameters=(),
+    thicknesses=(),
+    K=2.0,
+    maxCandidates=None,
+):
+    """Same result as ``optimize_pile`` from one evaluation of every candidate.
+
+    Every candidate is held in memory at once; raises ValueError when there
+    are more than maxCandidates of them.
+    """
+    start = time.perf_counter()
+    values = [_sorted_values(v) for v in (lengths, diameters, thicknesses)]
+    size = math.prod(v.size for v in values)
+    if maxCandidates is not None and size > maxCandidates:
+        raise ValueError(
+            f"The full sweep has {size:,} candidates, more than {maxCandidates:,}"
+        )
+    L, D, t = np.meshgrid(*values, indexing="ij")
+    valid = 2 * t < D
+    L, D, t = L[valid], D[valid], t[valid]
+    grid = evaluate_pile_grid(steel, L, D, t, soil_layers, K)
+    ok = _feasible(grid, axialLoad, moment)
+    return _optimum(
+        steel,
+        soil_layers,
+        K,
+        L[ok],
+        D[ok],
+        t[ok],
+        pile_mass(L[ok], D[ok], t[ok]),
+        L.size,
+        L.size,
+        start,
+    )
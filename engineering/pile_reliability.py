@@ -0,0 +1,207 @@
+"""Monte Carlo failure probability of an axially loaded tube pile.
+
+cu and alpha of every ``SoilLayer`` and fy of the steel are lognormal with
+the given coefficients of variation around their nominal values; the pile
+fails when its governing axial capacity falls below the design load.
+
+Samples are drawn in vectorized chunks. Chunks run on a process pool, each
+with its own child of one ``np.random.SeedSequence``, so the results depend
+on the seed and the chunk size but not on the number of workers. Running
+estimates are yielded after every chunk, in order, so callers can stop as
+soon as the confidence interval is narrow enough. Capacity percentiles come
+from a fixed-bin histogram, so memory does not grow with the sample count.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.stats import norm
+
+from engineering.pile import (
+    FrictionProfile,
+    PileGeometry,
+    SoilLayer,
+    SteelProperties,
+    evaluate_pile_full,
+    evaluate_pile_grid,
+)
+
+HISTOGRAM_BINS = 4000  # capacity bins between 0 and HISTOGRAM_SPAN × nominal
+HISTOGRAM_SPAN = 3.0
+PERCENTILES = (1, 5, 50, 95, 99)
+
+
+@dataclass
+class PileReliabilityModel:
+    steel: SteelProperties
+    geo: PileGeometry
+    layers: list[SoilLayer]
+    load: float  # design axial load [kN]
+    cuCov: float = 0.3  # coefficient of variation of cu
+    alphaCov: float = 0.1  # coefficient of variation of alpha
+    fyCov: float = 0.07  # coefficient of variation of fy
+    K: float = 2.0  # buckling length factor
+    Nc: float = 9  # bearing capacity factor
+
+    @property
+    def nominalCapacity(self):
+        """Governing axial capacity with nominal properties [kN]."""
+        results = evaluate_pile_full(self.steel, self.geo, self.layers, self.K)
+        return results["Governing axial capacity [kN]"]
+
+
+@dataclass
+class ReliabilityEstimate:
+    samples: int
+    failures: int
+    probability: float  # failure probability
+    interval: tuple  # Wilson confidence interval of the probability
+    beta: float  # reliability index -Φ⁻¹(probability)
+    meanCapacity: float  # [kN]
+    stdCapacity: float  # [kN]
+    percentiles: dict  # percentile -> capacity [kN]
+
+    @property
+    def relativeHalfWidth(self):
+        """Half-width of the confidence interval relative to the estimate."""
+        if self.failures == 0:
+            return np.inf
+        return (self.interval[1] - self.interval[0]) / (2 * self.probability)
+
+
+def _lognormal(rng, mean, cov, size):
+    """Lognormal samples with the given mean and coefficient of variation."""
+    mean = np.asarray(mean, dtype=float)
+    if cov <= 0:
+        return np.broadcast_to(mean, size).copy()
+    sigma2 = np.log1p(cov**2)
+    return rng.lognormal(np.log(mean) - sigma2 / 2, np.sqrt(sigma2), size)
+
+
+def sample_capacity(model: PileReliabilityModel, rng, n) -> np.ndarray:
+    """Governing axial capacity [kN] of n random realisations."""
+    layers, geo = model.layers, model.geo
+    nLayers = len(layers)
+    cu = _lognormal(rng, [layer.cu for layer in layers], model.cuCov, (n, nLayers))
+    alpha = _lognormal(
+        rng, [layer.alpha for layer in layers], model.alphaCov, (n, nLayers)
+    )
+    np.minimum(alpha, 1.0, out=alpha)
+    fy = _lognormal(rng, model.steel.fy, model.fyCov, n)
+    # geometry is fixed: embedded length per layer and tip layer are constant
+    profile = FrictionProfile.from_layers(layers)
+    tops, bases = profile.boundaries[:-1], profile.boundaries[1:]
+    embedded = np.clip(geo.length - tops, 0.0, bases - tops)
+    tip = int(profile.layer_at(geo.length))
+    skin = (alpha * cu) @ (np.pi * geo.diameter * embedded)
+    bearing = cu[:, tip] * model.Nc * np.pi * (geo.diameter / 2) ** 2
+    steel = SteelProperties(
+        fy, model.steel.fu, model.steel.gamma_M0, model.steel.gamma_M1
+    )
+    structural = evaluate_pile_grid(
+        steel, geo.length, geo.diameter, geo.thickness, layers, model.K, Nc=model.Nc
+    )
+    return np.minimum.reduce(
+        [
+            structural["Axial resistance [kN]"],
+            structural["Buckling resistance [kN]"],
+            (skin + bearing) / 1e3,
+        ]
+    )
+
+
+def _run_chunk(model, seed, n, span):
+    capacity = sample_capacity(model, np.random.default_rng(seed), n)
+    histogram, _ = np.histogram(capacity, bins=HISTOGRAM_BINS, range=(0.0, span))
+    return (
+        n,
+        int(np.count_nonzero(capacity < model.load)),
+        float(capacity.sum()),
+        float(np.square(capacity).sum()),
+        histogram,
+    )
+
+
+class _Accumulator:
+    def __init__(self, span, confidence):
+        self.span = span
+        self.z = norm.ppf(0.5 + confidence / 2)
+        self.n = self.failures = 0
+        self.total = self.squares = 0.0
+        self.histogram = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+
+    def add(self, chunk):
+        n, failures, total, squares, histogram = chunk
+        self.n += n
+        self.failures += failures
+        self.total += total
+        self.squares += squares
+        self.histogram += histogram
+
+    def _percentile(self, q):
+        target = q / 100 * self.n
+        counts = np.concatenate(([0], np.cumsum(self.histogram)))
+        i = int(np.searchsorted(counts, target, side="left"))
+        if i == 0 or i >= counts.size:  # outside the histogram range
+            return np.nan
+        width = self.span / HISTOGRAM_BINS
+        inBin = (target - counts[i - 1]) / max(counts[i] - counts[i - 1], 1)
+        return (i - 1 + inBin) * width
+
+    def estimate(self) -> ReliabilityEstimate:
+        n, z = self.n, self.z
+        p = self.failures / n
+        denominator = 1 + z**2 / n
+        centre = (p + z**2 / (2 * n)) / denominator
+        half = z * np.sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / denominator
+        mean = self.total / n
+        return ReliabilityEstimate(
+            samples=n,
+            failures=self.failures,
+            probability=p,
+            interval=(max(0.0, centre - half), min(1.0, centre + half)),
+            beta=float(-norm.ppf(p)),
+            meanCapacity=mean,
+            stdCapacity=float(np.sqrt(max(self.squares / n - mean**2, 0.0))),
+            percentiles={q: self._percentile(q) for q in PERCENTILES},
+        )
+
+
+def monte_carlo(
+    model: PileReliabilityModel,
+    samples=10**7,
+    chunkSize=10**6,
+    workers=None,
+    seed=0,
+    confidence=0.95,
+):
+    """Yield a ``ReliabilityEstimate`` after every completed chunk; stop
+    iterating at any point to end the simulation early."""
+    workers = workers or os.cpu_count() or 1
+    nChunks = -(-samples // chunkSize)
+    sizes = [min(chunkSize, samples - i * chunkSize) for i in range(nChunks)]
+    seeds = np.random.SeedSequence(seed).spawn(nChunks)
+    span = HISTOGRAM_SPAN * model.nominalCapacity
+    accumulator = _Accumulator(span, confidence)
+    if workers == 1:
+        for childSeed, n in zip(seeds, sizes):
+            accumulator.add(_run_chunk(model, childSeed, n, span))
+            yield accumulator.estimate()
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        try:
+            for childSeed, n in zip(seeds, sizes):
+                pending.append(pool.submit(_run_chunk, model, childSeed, n, span))
+                if len(pending) >= 2 * workers:
+                    accumulator.add(pending.popleft().result())
+                    yield accumulator.estimate()
+            while pending:
+                accumulator.add(pending.popleft().result())
+                yield accumulator.estimate()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,111 @@
+"""Figure lifecycle shared by every page.
+
+Figures are created through the object-oriented API (``Figure`` objects are
+never registered with pyplot), rendered to image bytes and released as soon
+as they are shown. Released figures are cleared and kept in a small pool so
+the next figure of the same size reuses their canvas. Figures made by other
+libraries through pyplot are closed when released.
+
+Each rerun counts the figures and bytes it renders; ``report()`` writes the
+counts to a sidebar caption together with the number of live figures.
+"""
+
+import io
+import threading
+
+import matplotlib.pyplot as plt
+import streamlit as st
+from matplotlib.figure import Figure
+
+POOL_SIZE = 4  # idle figures kept per figure size
+
+_lock = threading.Lock()
+_pool = {}  # figsize -> idle Figure objects
+_counts = {"created": 0, "reused": 0, "released": 0, "discarded": 0}
+
+
+def new_figure(figsize, nrows=1, ncols=1, **subplotKw):
+    """(fig, axes) like plt.subplots, reusing a pooled figure when possible."""
+    figsize = tuple(float(v) for v in figsize)
+    with _lock:
+        idle = _pool.get(figsize)
+        fig = idle.pop() if idle else None
+        _counts["reused" if fig else "created"] += 1
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        fig._poolKey = figsize
+    axes = fig.subplots(nrows, ncols, **subplotKw)
+    return fig, axes
+
+
+def release(fig):
+    """Free a figure: pooled figures are cleared for reuse, pyplot ones closed."""
+    poolKey = getattr(fig, "_poolKey", None)
+    if plt.fignum_exists(getattr(fig, "number", -1)):
+        plt.close(fig)
+    fig.clear()
+    with _lock:
+        _counts["released"] += 1
+        if poolKey is None:
+            return
+        if len(_pool.setdefault(poolKey, [])) < POOL_SIZE:
+            _pool[poolKey].append(fig)
+        else:
+            _counts["discarded"] += 1
+
+
+def render(fig, format="png", **savefigKw) -> bytes:
+    """Image bytes of the figure; the figure is released afterwards."""
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=format, bbox_inches="tight", **savefigKw)
+    finally:
+        release(fig)
+    data = buffer.getvalue()
+    stats = _rerun_stats()
+    if stats is not None:
+        stats["figures"] += 1
+        stats["bytes"] += len(data)
+    return data
+
+
+def show(fig, **imageKw):
+    """Render the figure into the page and release it."""
+    st.image(render(fig), use_container_width=True, **imageKw)
+    report()
+
+
+def live_figures() -> int:
+    """Figures still in memory: pooled or in use here, plus pyplot-managed ones."""
+    with _lock:
+        live = _counts["created"] - _counts["discarded"]
+    return live + len(plt.get_fignums())
+
+
+def begin_rerun():
+    """Reset the per-rerun counters; call once at the top of a page."""
+    st.session_state["_render_stats"] = {
+        "figures": 0,
+        "bytes": 0,
+        "placeholder": st.sidebar.empty(),
+    }
+
+
+def _rerun_stats():
+    try:
+        return st.session_state.get("_render_stats")
+    except Exception:  # outside a Streamlit session
+        return None
+
+
+def report():
+    """Show this rerun's rendering counters in the sidebar."""
+    stats = _rerun_stats()
+    if stats is None:
+        return
+    with _lock:
+        pooled = sum(map(len, _pool.values()))
+    stats["placeholder"].caption(
+        f"Rendered {stats['figures']} figures ({stats['bytes'] / 1024:.0f} kB) "
+        f"this rerun · live figures: {live_figures()} ({pooled} pooled)"
+    )
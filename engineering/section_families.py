@@ -0,0 +1,463 @@
+"""Dimension tables and closed-form properties of standard steel sections.
+
+Dimensions are in mm and follow EN 10365 for rolled sections and EN 10210
+for hot-finished hollow sections. Properties are computed for whole
+dimension arrays at once, so a family costs one vectorized pass however
+many sizes it has. Axes follow Eurocode: y is the strong axis, z the weak
+one. Centroids (xc, yc) are measured from the bottom-left corner of the
+bounding box.
+
+Root fillets and rounded corners are included as spandrels, the area
+between a square r×r and the inscribed quarter circle:
+
+    area (1 - π/4)·r², centroid r·(10 - 3π)/(3·(4 - π)) from either straight
+    edge, second moment r⁴·(1 - 5π/16) about either straight edge.
+
+UPN flanges are tapered, with the thickness tf measured at b/2. Their toe
+radii are left out and their root fillets are taken as right-angled
+spandrels, which keeps the properties within about 2% of the catalogue.
+The weak-axis plastic modulus of channels lumps each fillet at its
+centroid.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+# designation, h, b, tw, tf, r
+IPE = (
+    ("IPE 80", 80, 46, 3.8, 5.2, 5),
+    ("IPE 100", 100, 55, 4.1, 5.7, 7),
+    ("IPE 120", 120, 64, 4.4, 6.3, 7),
+    ("IPE 140", 140, 73, 4.7, 6.9, 7),
+    ("IPE 160", 160, 82, 5.0, 7.4, 9),
+    ("IPE 180", 180, 91, 5.3, 8.0, 9),
+    ("IPE 200", 200, 100, 5.6, 8.5, 12),
+    ("IPE 220", 220, 110, 5.9, 9.2, 12),
+    ("IPE 240", 240, 120, 6.2, 9.8, 15),
+    ("IPE 270", 270, 135, 6.6, 10.2, 15),
+    ("IPE 300", 300, 150, 7.1, 10.7, 15),
+    ("IPE 330", 330, 160, 7.5, 11.5, 18),
+    ("IPE 360", 360, 170, 8.0, 12.7, 18),
+    ("IPE 400", 400, 180, 8.6, 13.5, 21),
+    ("IPE 450", 450, 190, 9.4, 14.6, 21),
+    ("IPE 500", 500, 200, 10.2, 16.0, 21),
+    ("IPE 550", 550, 210, 11.1, 17.2, 24),
+    ("IPE 600", 600, 220, 12.0, 19.0, 24),
+)
+HEA = (
+    ("HEA 100", 96, 100, 5.0, 8.0, 12),
+    ("HEA 120", 114, 120, 5.0, 8.0, 12),
+    ("HEA 140", 133, 140, 5.5, 8.5, 12),
+    ("HEA 160", 152, 160, 6.0, 9.0, 15),
+    ("HEA 180", 171, 180, 6.0, 9.5, 15),
+    ("HEA 200", 190, 200, 6.5, 10.0, 18),
+    ("HEA 220", 210, 220, 7.0, 11.0, 18),
+    ("HEA 240", 230, 240, 7.5, 12.0, 21),
+    ("HEA 260", 250, 260, 7.5, 12.5, 24),
+    ("HEA 280", 270, 280, 8.0, 13.0, 24),
+    ("HEA 300", 290, 300, 8.5, 14.0, 27),
+    ("HEA 320", 310, 300, 9.0, 15.5, 27),
+    ("HEA 340", 330, 300, 9.5, 16.5, 27),
+    ("HEA 360", 350, 300, 10.0, 17.5, 27),
+    ("HEA 400", 390, 300, 11.0, 19.0, 27),
+    ("HEA 450", 440, 300, 11.5, 21.0, 27),
+    ("HEA 500", 490, 300, 12.0, 23.0, 27),
+    ("HEA 550", 540, 300, 12.5, 24.0, 27),
+    ("HEA 600", 590, 300, 13.0, 25.0, 27),
+    ("HEA 650", 640, 300, 13.5, 26.0, 27),
+    ("HEA 700", 690, 300, 14.5, 27.0, 27),
+    ("HEA 800", 790, 300, 15.0, 28.0, 30),
+    ("HEA 900", 890, 300, 16.0, 30.0, 30),
+    ("HEA 1000", 990, 300, 16.5, 31.0, 30),
+)
+HEB = (
+    ("HEB 100", 100, 100, 6.0, 10.0, 12),
+    ("HEB 120", 120, 120, 6.5, 11.0, 12),
+    ("HEB 140", 140, 140, 7.0, 12.0, 12),
+    ("HEB 160", 160, 160, 8.0, 13.0, 15),
+    ("HEB 180", 180, 180, 8.5, 14.0, 15),
+    ("HEB 200", 200, 200, 9.0, 15.0, 18),
+    ("HEB 220", 220, 220, 9.5, 16.0, 18),
+    ("HEB 240", 240, 240, 10.0, 17.0, 21),
+    ("HEB 260", 260, 260, 10.0, 17.5, 24),
+    ("HEB 280", 280, 280, 10.5, 18.0, 24),
+    ("HEB 300", 300, 300, 11.0, 19.0, 27),
+    ("HEB 320", 320, 300, 11.5, 20.5, 27),
+    ("HEB 340", 340, 300, 12.0, 21.5, 27),
+    ("HEB 360", 360, 300, 12.5, 22.5, 27),
+    ("HEB 400", 400, 300, 13.5, 24.0, 27),
+    ("HEB 450", 450, 300, 14.0, 26.0, 27),
+    ("HEB 500", 500, 300, 14.5, 28.0, 27),
+    ("HEB 550", 550, 300, 15.0, 29.0, 27),
+    ("HEB 600", 600, 300, 15.5, 30.0, 27),
+    ("HEB 650", 650, 300, 16.0, 31.0, 27),
+    ("HEB 700", 700, 300, 17.0, 32.0, 27),
+    ("HEB 800", 800, 300, 17.5, 33.0, 30),
+    ("HEB 900", 900, 300, 18.5, 35.0, 30),
+    ("HEB 1000", 1000, 300, 19.0, 36.0, 30),
+)
+UPN = (
+    ("UPN 80", 80, 45, 6.0, 8.0, 8.0),
+    ("UPN 100", 100, 50, 6.0, 8.5, 8.5),
+    ("UPN 120", 120, 55, 7.0, 9.0, 9.0),
+    ("UPN 140", 140, 60, 7.0, 10.0, 10.0),
+    ("UPN 160", 160, 65, 7.5, 10.5, 10.5),
+    ("UPN 180", 180, 70, 8.0, 11.0, 11.0),
+    ("UPN 200", 200, 75, 8.5, 11.5, 11.5),
+    ("UPN 220", 220, 80, 9.0, 12.5, 12.5),
+    ("UPN 240", 240, 85, 9.5, 13.0, 13.0),
+    ("UPN 260", 260, 90, 10.0, 14.0, 14.0),
+    ("UPN 280", 280, 95, 10.0, 15.0, 15.0),
+    ("UPN 300", 300, 100, 10.0, 16.0, 16.0),
+    ("UPN 320", 320, 100, 14.0, 17.5, 17.5),
+    ("UPN 350", 350, 100, 14.0, 16.0, 16.0),
+    ("UPN 380", 380, 102, 13.5, 16.0, 16.0),
+    ("UPN 400", 400, 110, 14.0, 18.0, 18.0),
+)
+# outside diameter: wall thicknesses
+CHS_SIZES = {
+    21.3: (2.0, 2.3, 2.6, 3.2),
+    26.9: (2.0, 2.3, 2.6, 3.2),
+    33.7: (2.6, 3.2, 4.0),
+    42.4: (2.6, 3.2, 4.0),
+    48.3: (2.6, 3.2, 4.0, 5.0),
+    60.3: (2.6, 3.2, 4.0, 5.0),
+    76.1: (3.2, 4.0, 5.0, 6.3),
+    88.9: (3.2, 4.0, 5.0, 6.3, 8.0),
+    114.3: (3.6, 4.0, 5.0, 6.3, 8.0),
+    139.7: (4.0, 5.0, 6.3, 8.0, 10.0),
+    168.3: (4.0, 5.0, 6.3, 8.0, 10.0),
+    219.1: (5.0, 6.3, 8.0, 10.0, 12.5),
+    273.0: (6.3, 8.0, 10.0, 12.5, 16.0),
+    323.9: (6.3, 8.0, 10.0, 12.5, 16.0),
+    355.6: (8.0, 10.0, 12.5, 16.0),
+    406.4: (8.0, 10.0, 12.5, 16.0),
+    457.0: (10.0, 12.5, 16.0),
+    508.0: (10.0, 12.5, 16.0, 20.0),
+}
+# (depth, width): wall thicknesses; square sizes included
+RHS_SIZES = {
+    (40, 40): (2.5, 3.2, 4.0),
+    (50, 30): (2.5, 3.2, 4.0),
+    (50, 50): (3.2, 4.0, 5.0),
+    (60, 40): (3.2, 4.0, 5.0),
+    (60, 60): (3.2, 4.0, 5.0),
+    (80, 40): (3.2, 4.0, 5.0),
+    (80, 80): (4.0, 5.0, 6.3),
+    (100, 50): (4.0, 5.0, 6.3),
+    (100, 60): (4.0, 5.0, 6.3),
+    (100, 100): (4.0, 5.0, 6.3, 8.0),
+    (120, 60): (4.0, 5.0, 6.3),
+    (120, 80): (5.0, 6.3, 8.0),
+    (120, 120): (5.0, 6.3, 8.0, 10.0),
+    (150, 100): (5.0, 6.3, 8.0, 10.0),
+    (150, 150): (6.3, 8.0, 10.0, 12.5),
+    (160, 80): (5.0, 6.3, 8.0),
+    (200, 100): (6.3, 8.0, 10.0, 12.5),
+    (200, 200): (8.0, 10.0, 12.5, 16.0),
+    (250, 150): (6.3, 8.0, 10.0, 12.5),
+    (250, 250): (8.0, 10.0, 12.5, 16.0),
+    (300, 200): (8.0, 10.0, 12.5, 16.0),
+    (300, 300): (10.0, 12.5, 16.0),
+    (400, 200): (8.0, 10.0, 12.5, 16.0),
+}
+# designation, D, t
+CHS = tuple((f"CHS {D:g}x{t:g}", D, t) for D, walls in CHS_SIZES.items() for t in walls)
+# designation, h, b, t
+RHS = tuple(
+    (f"RHS {h:g}x{b:g}x{t:g}", h, b, t)
+    for (h, b), walls in RHS_SIZES.items()
+    for t in walls
+)
+
+I_DIMENSIONS = ("h", "b", "tw", "tf", "r")
+CHS_DIMENSIONS = ("D", "t")
+RHS_DIMENSIONS = ("h", "b", "t")
+
+
+def designation_key(name):
+    """Designation normalised for lookups: "ipe200" and "IPE 200" match."""
+    return re.sub(r"\s+", "", str(name)).upper()
+
+
+def dimension_table(rows, fields):
+    """(designations, {field: array}) of a table of dimension rows."""
+    names = np.array([row[0] for row in rows])
+    values = np.array([row[1:] for row in rows], dtype=float)
+    return names, dict(zip(fields, values.T))
+
+
+def _arrays(*values):
+    return np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values))
+
+
+def _spandrel(r):
+    """Area, centroid offset from the edges and own centroidal inertia."""
+    area = (1 - np.pi / 4) * r**2
+    offset = r * (10 - 3 * np.pi) / (3 * (4 - np.pi))
+    inertia = r**4 * (1 - 5 * np.pi / 16) - area * offset**2
+    return area, offset, inertia
+
+
+def _strip_moment(x0, x1, p):
+    """∫ |x - p| dx over [x0, x1], for a strip of unit density."""
+    c = np.clip(p, x0, x1)
+    return ((c - x0) ** 2 + (x1 - c) ** 2) / 2 + (x1 - x0) * np.abs(p - c)
+
+
+def i_section(h, b, tw, tf, r) -> dict:
+    """Properties of doubly symmetric rolled I and H sections [mm units].
+
+    Returns A, xc, yc, Iy, Iz, Wel_y, Wel_z, Wpl_y and Wpl_z as arrays.
+    """
+    h, b, tw, tf, r = _arrays(h, b, tw, tf, r)
+    a, e, Ic = _spandrel(r)
+    web = h - 2 * tf
+    # four fillets, at distance dy from the y axis and dz from the z axis
+    dy, dz = h / 2 - tf - e, tw / 2 + e
+    Iy = (b * h**3 - (b - tw) * web**3) / 12 + 4 * (Ic + a * dy**2)
+    Iz = (2 * tf * b**3 + web * tw**3) / 12 + 4 * (Ic + a * dz**2)
+    return {
+        "A": 2 * b * tf + web * tw + 4 * a,
+        "xc": b / 2,
+        "yc": h / 2,
+        "Iy": Iy,
+        "Iz": Iz,
+        "Wel_y": Iy / (h / 2),
+        "Wel_z": Iz / (b / 2),
+        "Wpl_y": b * tf * (h - tf) + tw * web**2 / 4 + 4 * a * dy,
+        "Wpl_z": tf * b**2 / 2 + web * tw**2 / 4 + 4 * a * dz,
+    }
+
+
+def _gauss(x0, x1, f):
+    """∫ f dx over [x0, x1] by two-point Gauss, exact for cubics."""
+    half, mid = (x1 - x0) / 2, (x0 + x1) / 2
+    offset = half / np.sqrt(3)
+    return half * (f(mid - offset) + f(mid + offset))
+
+
+def channel_section(h, b, tw, tf, r, slope=0.08) -> dict:
+    """Properties of channels with the back of the web at x = 0.
+
+    The inner flange faces slope by ``slope`` (8% for UPN) and tf is the
+    flange thickness at b/2; slope 0 gives parallel flange channels.
+    """
+    h, b, tw, tf, r, slope = _arrays(h, b, tw, tf, r, slope)
+    a, e, Ic = _spandrel(r)
+
+    def t(x):  # flange thickness
+        return tf + slope * (b / 2 - x)
+
+    root, xFillet = t(tw), tw + e
+    dy = h / 2 - root - e
+    # one flange: area, first moment about x = 0, and about the y axis
+    flange = _gauss(tw, b, t)
+    A = h * tw + 2 * flange + 2 * a
+    xc = (h * tw**2 / 2 + 2 * _gauss(tw, b, lambda x: x * t(x)) + 2 * a * xFillet) / A
+    Iy = (
+        tw * h**3 / 12
+        + 2 * _gauss(tw, b, lambda x: ((h / 2) ** 3 - (h / 2 - t(x)) ** 3) / 3)
+        + 2 * (Ic + a * dy**2)
+    )
+    Iz = (
+        h * tw**3 / 12
+        + h * tw * (tw / 2 - xc) ** 2
+        + 2 * _gauss(tw, b, lambda x: (x - xc) ** 2 * t(x))
+        + 2 * (Ic + a * (xFillet - xc) ** 2)
+    )
+    # plastic neutral axis, with half the area on each side: in the web, in
+    # the flanges before the fillets, or in the flanges beyond them; the
+    # flange area from tw to tw + u is u·root - slope·u²/2
+    need = A / 2 - h * tw
+
+    def reach(area):
+        return tw + area / (root + np.sqrt(np.maximum(root**2 - slope * area, 0)))
+
+    beforeFillets = reach(need)
+    beyondFillets = np.maximum(reach(need - 2 * a), xFillet)
+    xp = np.where(
+        need <= 0,
+        A / (2 * h),
+        np.where(beforeFillets <= xFillet, beforeFillets, beyondFillets),
+    )
+    c = np.clip(xp, tw, b)
+    flangeMoment = _gauss(tw, c, lambda x: (xp - x) * t(x)) + _gauss(
+        c, b, lambda x: (x - xp) * t(x)
+    )
+    return {
+        "A": A,
+        "xc": xc,
+        "yc": h / 2,
+        "Iy": Iy,
+        "Iz": Iz,
+        "Wel_y": Iy / (h / 2),
+        "Wel_z": Iz / (b - xc),
+        "Wpl_y": tw * h**2 / 4
+        + 2 * _gauss(tw, b, lambda x: t(x) * (h - t(x)) / 2)
+        + 2 * a * dy,
+        "Wpl_z": h * _strip_moment(0, tw, xp)
+        + 2 * flangeMoment
+        + 2 * a * np.abs(xFillet - xp),
+    }
+
+
+def circular_hollow(D, t) -> dict:
+    """Properties of circular hollow sections."""
+    D, t = _arrays(D, t)
+    d = D - 2 * t
+    inertia = np.pi / 64 * (D**4 - d**4)
+    return {
+        "A": np.pi / 4 * (D**2 - d**2),
+        "xc": D / 2,
+        "yc": D / 2,
+        "Iy": inertia,
+        "Iz": inertia,
+        "Wel_y": inertia / (D / 2),
+        "Wel_z": inertia / (D / 2),
+        "Wpl_y": (D**3 - d**3) / 6,
+        "Wpl_z": (D**3 - d**3) / 6,
+    }
+
+
+def _rounded_rectangle(h, b, r):
+    """A, Iy, Iz, Wpl_y and Wpl_z of a solid h × b box with corner radius r."""
+    a, e, Ic = _spandrel(r)
+    dy, dz = h / 2 - e, b / 2 - e
+    return (
+        h * b - 4 * a,
+        b * h**3 / 12 - 4 * (Ic + a * dy**2),
+        h * b**3 / 12 - 4 * (Ic + a * dz**2),
+        b * h**2 / 4 - 4 * a * dy,
+        h * b**2 / 4 - 4 * a * dz,
+    )
+
+
+def rectangular_hollow(h, b, t) -> dict:
+    """Properties of hot-finished rectangular and square hollow sections,
+    with outer corner radius 1.5·t and inner radius t."""
+    h, b, t = _arrays(h, b, t)
+    outer = _rounded_rectangle(h, b, 1.5 * t)
+    inner = _rounded_rectangle(h - 2 * t, b - 2 * t, t)
+    A, Iy, Iz, Zy, Zz = (o - i for o, i in zip(outer, inner))
+    return {
+        "A": A,
+        "xc": b / 2,
+        "yc": h / 2,
+        "Iy": Iy,
+        "Iz": Iz,
+        "Wel_y": Iy / (h / 2),
+        "Wel_z": Iz / (b / 2),
+        "Wpl_y": Zy,
+        "Wpl_z": Zz,
+    }
+
+
+# --- Outlines ---
+ARC_POINTS = 8  # points per quarter circle
+
+
+def _arc(cx, cy, r, start, end, n=ARC_POINTS):
+    angles = np.radians(np.linspace(start, end, n))
+    return np.column_stack((cx + r * np.cos(angles), cy + r * np.sin(angles)))
+
+
+def _rounded_box(x0, y0, x1, y1, r):
+    """Counter-clockwise outline of a box with rounded corners."""
+    return np.vstack(
+        [
+            _arc(x1 - r, y0 + r, r, -90, 0),
+            _arc(x1 - r, y1 - r, r, 0, 90),
+            _arc(x0 + r, y1 - r, r, 90, 180),
+            _arc(x0 + r, y0 + r, r, 180, 270),
+        ]
+    )
+
+
+def i_outline(h, b, tw, tf, r):
+    right, left = (b + tw) / 2, (b - tw) / 2
+    return [
+        np.vstack(
+            [
+                [[0, 0], [b, 0], [b, tf]],
+                _arc(right + r, tf + r, r, -90, -180),
+                _arc(right + r, h - tf - r, r, 180, 90),
+                [[b, h - tf], [b, h], [0, h], [0, h - tf]],
+                _arc(left - r, h - tf - r, r, 90, 0),
+                _arc(left - r, tf + r, r, 0, -90),
+                [[0, tf]],
+            ]
+        )
+    ]
+
+
+def channel_outline(h, b, tw, tf, r, slope=0.08):
+    root, toe = tf + slope * (b / 2 - tw), tf - slope * b / 2
+    return [
+        np.vstack(
+            [
+                [[0, 0], [b, 0], [b, toe]],
+                _arc(tw + r, root + r, r, -90, -180),
+                _arc(tw + r, h - root - r, r, 180, 90),
+                [[b, h - toe], [b, h], [0, h]],
+            ]
+        )
+    ]
+
+
+def chs_outline(D, t):
+    n = 4 * ARC_POINTS
+    return [
+        _arc(D / 2, D / 2, D / 2, 0, 360, n)[:-1],
+        _arc(D / 2, D / 2, D / 2 - t, 360, 0, n)[:-1],
+    ]
+
+
+def rhs_outline(h, b, t):
+    return [
+        _rounded_box(0, 0, b, h, 1.5 * t),
+        _rounded_box(t, t, b - t, h - t, t)[::-1],
+    ]
+
+
+@dataclass
+class SectionFamily:
+    rows: tuple  # designation followed by the dimensions
+    fields: tuple  # dimension names
+    properties: Callable  # dimension arrays -> property arrays
+    outline: Callable  # dimensions -> [outer, *holes] vertex arrays [mm]
+
+
+FAMILIES = {
+    "IPE": SectionFamily(IPE, I_DIMENSIONS, i_section, i_outline),
+    "HEA": SectionFamily(HEA, I_DIMENSIONS, i_section, i_outline),
+    "HEB": SectionFamily(HEB, I_DIMENSIONS, i_section, i_outline),
+    "UPN": SectionFamily(UPN, I_DIMENSIONS, channel_section, channel_outline),
+    "CHS": SectionFamily(CHS, CHS_DIMENSIONS, circular_hollow, chs_outline),
+    "RHS": SectionFamily(RHS, RHS_DIMENSIONS, rectangular_hollow, rhs_outline),
+}
+
+
+@dataclass
+class ParametricProfile:
+    """One size of a family, with its dimensions [mm]."""
+
+    family: str
+    name: str
+    dimensions: dict
+
+    def outline(self) -> list[np.ndarray]:
+        """Outer boundary (counter-clockwise) and holes (clockwise) [mm]."""
+        return FAMILIES[self.family].outline(**self.dimensions)
+
+
+def family_profiles(family) -> dict:
+    """{designation: ParametricProfile} of every size of a family."""
+    spec = FAMILIES[family]
+    return {
+        row[0]: ParametricProfile(family, row[0], dict(zip(spec.fields, row[1:])))
+        for row in spec.rows
+    }
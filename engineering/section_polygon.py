@@ -0,0 +1,279 @@
+"""Properties of arbitrary polygonal cross-sections with holes.
+
+A section is a list of vertex rings, (n, 2) arrays in mm: the outer
+boundary first, then the holes. Rings are open (the last vertex is not a
+repeat of the first) and may run either way round. Area, first and second
+moments come from Green's theorem over the edges of every ring at once:
+
+    A   = Σ c / 2,                 c = x_i·y_{i+1} - x_{i+1}·y_i
+    Sy  = Σ (x_i + x_{i+1})·c / 6,         Sx = Σ (y_i + y_{i+1})·c / 6
+    Ixx = Σ (y_i² + y_i·y_{i+1} + y_{i+1}²)·c / 12
+    Iyy = Σ (x_i² + x_i·x_{i+1} + x_{i+1}²)·c / 12
+    Ixy = Σ (x_i·y_{i+1} + 2·x_i·y_i + 2·x_{i+1}·y_{i+1} + x_{i+1}·y_i)·c / 24
+
+Each ring's sums are reductions over views of its vertex arrays, with no
+per-edge temporaries beyond c. Rings are then signed so the outer boundary
+adds and the holes subtract, whatever their direction. Coordinates are shifted to the first vertex first, to avoid
+cancellation far from the origin.
+
+The torsion constant is an approximation. Bredt's thin-walled cell,
+J = 4·Am²·t / Pm, is used between the outer boundary and the largest hole
+when that hole makes a thin wall. Am and Pm are the mean enclosed area and
+perimeter, t = (A_out - A_hole) / Pm, and the wall counts as thin when t is
+at most THIN_WALL_RATIO times the cell size 4·Am / Pm (the side of a square
+cell). Otherwise, e.g. a plate with bolt holes, Saint-Venant's
+J ≈ A⁴ / (4π²·Ip) of the net section is used, as for solid sections. Other
+holes only reduce the area and inertias.
+
+``validate_rings`` checks imported geometry with shapely. The property
+sums only need NumPy.
+"""
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class PolygonProperties:
+    area: float  # [mm²]
+    xc: float  # centroid [mm]
+    yc: float  # [mm]
+    Ixx: float  # centroidal second moments [mm⁴]
+    Iyy: float
+    Ixy: float
+    I1: float  # major principal second moment [mm⁴]
+    I2: float  # minor principal second moment [mm⁴]
+    angle: float  # angle of the major principal axis from x [rad]
+    ix: float  # radii of gyration [mm]
+    iy: float
+    Welx: float  # elastic moduli to the extreme vertices [mm³]
+    Wely: float
+    torsion: float  # torsion constant J [mm⁴]
+    vertices: int
+
+
+# largest wall thickness over cell size treated as a thin-walled cell
+THIN_WALL_RATIO = 0.25
+DIVISORS = np.array([2.0, 6.0, 6.0, 12.0, 12.0, 24.0])
+
+
+def _edge_sums(x0, y0, x1, y1, c):
+    """A, Sy, Sx, Ixx, Iyy and Ixy sums (times DIVISORS) of the edges
+    (x0, y0) -> (x1, y1). Three-operand einsum reduces without building the
+    products as temporaries."""
+
+    def dot(a, b):
+        return np.einsum("i,i,i", a, b, c)
+
+    return np.array(
+        [
+            c.sum(),
+            x0 @ c + x1 @ c,
+            y0 @ c + y1 @ c,
+            dot(y0, y0) + dot(y0, y1) + dot(y1, y1),
+            dot(x0, x0) + dot(x0, x1) + dot(x1, x1),
+            dot(x0, y1) + 2 * dot(x0, y0) + 2 * dot(x1, y1) + dot(x1, y0),
+        ]
+    )
+
+
+def _ring_sums(rings):
+    """(rings, 6) A, Sy, Sx, Ixx, Iyy and Ixy about the first vertex, and
+    the perimeters of the rings."""
+    origin = rings[0][0]
+    sums, perimeters = np.empty((len(rings), 6)), np.empty(len(rings))
+    for i, ring in enumerate(rings):
+        # shifted coordinates as rows, closed by repeating the first vertex
+        points = np.empty((2, len(ring) + 1))
+        np.subtract(ring.T, origin[:, None], out=points[:, :-1])
+        points[:, -1] = points[:, 0]
+        x, y = points
+        # edges to the next vertex as views, no copies
+        x0, y0, x1, y1 = x[:-1], y[:-1], x[1:], y[1:]
+        c = x0 * y1
+        c -= x1 * y0
+        sums[i] = _edge_sums(x0, y0, x1, y1, c)
+        if len(rings) > 1:  # only Bredt's torsion needs them
+            dx, dy = np.diff(points)
+            perimeters[i] = np.sqrt(dx * dx + dy * dy).sum()
+    return sums / DIVISORS, perimeters
+
+
+def polygon_properties(rings) -> PolygonProperties:
+    """Section properties of an outer ring and its holes [mm units]."""
+    rings = [np.asarray(ring, dtype=float) for ring in rings]
+    if any(ring.ndim != 2 or ring.shape[0] < 3 for ring in rings):
+        raise ValueError("Every ring needs at least 3 (x, y) vertices")
+    sums, perimeters = _ring_sums(rings)
+    origin = rings[0][0]
+    # outer ring adds, holes subtract, whatever their direction
+    sign = np.sign(sums[:, 0])
+    sign[1:] *= -1
+    A, Sy, Sx, Ixx0, Iyy0, Ixy0 = sign @ sums
+    if A <= 0:
+        raise ValueError("The holes are larger than the outer boundary")
+    xc, yc = Sy / A, Sx / A
+    Ixx, Iyy, Ixy = Ixx0 - A * yc**2, Iyy0 - A * xc**2, Ixy0 - A * xc * yc
+    mean, half = (Ixx + Iyy) / 2, np.hypot((Ixx - Iyy) / 2, Ixy)
+    # extreme fibres from the outer boundary
+    xMax = np.max(np.abs(rings[0][:, 0] - origin[0] - xc))
+    yMax = np.max(np.abs(rings[0][:, 1] - origin[1] - yc))
+    areas = np.abs(sums[:, 0])
+    # Saint-Venant for solid sections and thick walls around small holes
+    torsion = A**4 / (4 * np.pi**2 * (Ixx + Iyy))
+    if len(rings) > 1:
+        hole = 1 + int(np.argmax(areas[1:]))
+        Am = (areas[0] + areas[hole]) / 2
+        Pm = (perimeters[0] + perimeters[hole]) / 2
+        t = (areas[0] - areas[hole]) / Pm
+        if t <= THIN_WALL_RATIO * 4 * Am / Pm:
+            torsion = 4 * Am**2 * t / Pm
+    return PolygonProperties(
+        area=float(A),
+        xc=float(xc + origin[0]),
+        yc=float(yc + origin[1]),
+        Ixx=float(Ixx),
+        Iyy=float(Iyy),
+        Ixy=float(Ixy),
+        I1=float(mean + half),
+        I2=float(mean - half),
+        angle=float(0.5 * np.arctan2(-2 * Ixy, Ixx - Iyy)),
+        ix=float(np.sqrt(Ixx / A)),
+        iy=float(np.sqrt(Iyy / A)),
+        Welx=float(Ixx / yMax),
+        Wely=float(Iyy / xMax),
+        torsion=float(torsion),
+        vertices=sum(len(ring) for ring in rings),
+    )
+
+
+def geometry_key(rings) -> str:
+    """SHA-1 of the vertex coordinates and of the ring sizes."""
+    digest = hashlib.sha1()
+    for ring in rings:
+        ring = np.ascontiguousarray(ring, dtype=float)
+        digest.update(np.int64(ring.shape[0]).tobytes())
+        digest.update(ring.tobytes())
+    return digest.hexdigest()
+
+
+class PolygonPropertyCache:
+    """Bounded LRU cache of polygon properties keyed on the geometry hash."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def properties(self, rings) -> PolygonProperties:
+        key = geometry_key(rings)
+        with self._lock:
+            properties = self._entries.get(key)
+            if properties is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return properties
+            self.misses += 1
+        properties = polygon_properties(rings)
+        with self._lock:
+            self._entries[key] = properties
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return properties
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+# module level instance, shared by all sessions of the server process
+polygon_cache = PolygonPropertyCache()
+
+
+# --- Import ---
+def validate_rings(rings) -> list[np.ndarray]:
+    """Rings with the largest one first as the outer boundary; raises
+    ValueError unless the others are holes inside it and the polygon is
+    valid."""
+    from shapely.geometry import Polygon
+    from shapely.validation import explain_validity
+
+    rings = [np.asarray(ring, dtype=float) for ring in rings]
+    rings = [ring[:-1] if np.array_equal(ring[0], ring[-1]) else ring for ring in rings]
+    if not rings or any(ring.ndim != 2 or ring.shape[0] < 3 for ring in rings):
+        raise ValueError("Every ring needs at least 3 (x, y) vertices")
+    areas = [Polygon(ring).area for ring in rings]
+    outer = int(np.argmax(areas))
+    rings.insert(0, rings.pop(outer))
+    polygon = Polygon(rings[0], rings[1:])
+    if not polygon.is_valid:
+        raise ValueError(f"Invalid section geometry: {explain_validity(polygon)}")
+    return rings
+
+
+def _lines(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8", errors="replace") as f:
+            return f.read().splitlines()
+    if isinstance(source, bytes):
+        return source.decode("utf-8", errors="replace").splitlines()
+    if isinstance(source, io.TextIOBase):
+        return source.read().splitlines()
+    return source.read().decode("utf-8", errors="replace").splitlines()
+
+
+def read_vertex_csv(source) -> list[np.ndarray]:
+    """Rings from a text file of "x, y" rows [mm]; blank lines separate
+    rings. Comma, semicolon or whitespace delimited, with an optional
+    header; lines starting with # are ignored."""
+    rings, current = [], []
+    for line in _lines(source) + [""]:
+        line = line.strip()
+        if line.startswith("#"):
+            continue
+        if not line:
+            if current:
+                rings.append(np.array(current))
+                current = []
+            continue
+        delimiter = "," if "," in line else ";" if ";" in line else None
+        try:
+            x, y = (float(v) for v in line.split(delimiter)[:2])
+        except ValueError:
+            continue  # header
+        current.append((x, y))
+    return validate_rings(rings)
+
+
+def read_dxf(source) -> list[np.ndarray]:
+    """Rings from the LWPOLYLINE entities of an ASCII DXF file [drawing
+    units]; bulges are ignored, so arcs become chords."""
+    lines = [line.strip() for line in _lines(source)]
+    rings, current = [], None
+    for code, value in zip(lines[::2], lines[1::2]):
+        if code == "0":
+            if current:
+                rings.append(np.array(current))
+            current = [] if value == "LWPOLYLINE" else None
+        elif current is not None and code == "10":
+            current.append([float(value), np.nan])
+        elif current is not None and code == "20" and current:
+            current[-1][1] = float(value)
+    if current:
+        rings.append(np.array(current))
+    if not rings:
+        raise ValueError("The DXF file has no LWPOLYLINE entities")
+    return validate_rings(rings)
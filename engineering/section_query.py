@@ -0,0 +1,121 @@
+"""Lightest sections meeting bounds on their properties.
+
+``SectionIndex`` keeps, for every searchable property, the row order that
+sorts it. A bound becomes a bisection of that sorted column, so the number
+of rows meeting each bound is known without touching the rows. The most
+selective bound gives the starting candidates. The other bounds are
+vectorized masks over those candidates only, and the survivors are ranked
+by mass (or any other column). Rows with NaN in a bounded property never
+match.
+"""
+
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+from engineering.section_table import section_table
+
+QUERY_FIELDS = ("A", "Ixx", "Iyy", "ix", "iy", "Welx", "Wely", "Wplx", "Wply", "mass")
+
+
+@dataclass
+class QueryResult:
+    rows: np.ndarray  # matching rows, best ranked first, at most the limit
+    matches: int  # rows meeting every bound
+    candidates: int  # rows masked after the bisections
+    wallTime: float  # [s]
+
+
+@dataclass
+class SectionIndex:
+    data: np.ndarray  # structured array of section table rows
+    fields: tuple = QUERY_FIELDS
+    order: dict = field(init=False, repr=False)  # field -> argsort, NaN last
+    sortedValues: dict = field(init=False, repr=False)  # field -> sorted column
+
+    def __post_init__(self):
+        self.order, self.sortedValues = {}, {}
+        for name in self.fields:
+            column = np.asarray(self.data[name], dtype=float)
+            order = np.argsort(column, kind="stable")
+            self.order[name] = order
+            self.sortedValues[name] = column[order]
+
+    def _span(self, name, low, high):
+        """Positions [start, stop) of the sorted column within the bounds."""
+        values = self.sortedValues[name]
+        # NaN sorts last and fails every comparison
+        stop = int(np.searchsorted(values, np.nan, side="left"))
+        start = 0 if low is None else int(np.searchsorted(values[:stop], low, "left"))
+        if high is not None:
+            stop = int(np.searchsorted(values[:stop], high, side="right"))
+        return start, max(start, stop)
+
+    def query(
+        self, minimum=None, maximum=None, families=None, rank="mass", limit=10
+    ) -> QueryResult:
+        """Rows with minimum[f] <= row[f] <= maximum[f] for every bounded
+        field f, ranked by ascending ``rank``; families restricts the rows to
+        those families."""
+        start = time.perf_counter()
+        minimum, maximum = minimum or {}, maximum or {}
+        bounded = sorted(set(minimum) | set(maximum))
+        unknown = set(bounded) - set(self.fields)
+        if unknown:
+            raise KeyError(f"Fields without an index: {sorted(unknown)}")
+        spans = {
+            name: self._span(name, minimum.get(name), maximum.get(name))
+            for name in bounded
+        }
+        if spans:
+            first = min(spans, key=lambda name: spans[name][1] - spans[name][0])
+            a, b = spans[first]
+            rows = self.order[first][a:b]
+        else:
+            first, rows = None, np.arange(self.data.size)
+        candidates = rows.size
+        mask = np.ones(rows.size, dtype=bool)
+        for name in bounded:
+            if name == first:
+                continue
+            column = self.data[name][rows]
+            if name in minimum:
+                mask &= column >= minimum[name]
+            if name in maximum:
+                mask &= column <= maximum[name]
+        if families is not None:
+            mask &= np.isin(self.data["family"][rows], list(families))
+        rows = rows[mask]
+        key = self.data[rank][rows]
+        if rows.size > limit:
+            best = np.argpartition(key, limit - 1)[:limit]
+            rows, key = rows[best], key[best]
+        ranked = rows[np.argsort(key, kind="stable")]
+        return QueryResult(
+            rows=self.data[ranked],
+            matches=int(mask.sum()),
+            candidates=candidates,
+            wallTime=time.perf_counter() - start,
+        )
+
+
+@lru_cache(maxsize=1)
+def section_index() -> SectionIndex:
+    """Index over the whole section table, shared by the process."""
+    return SectionIndex(section_table().data)
+
+
+def scan_query(data, minimum=None, maximum=None, rank="mass", limit=10):
+    """Same rows as ``SectionIndex.query`` from a Python loop over every row,
+    for comparison."""
+    minimum, maximum = minimum or {}, maximum or {}
+    matches = [
+        row
+        for row in data
+        if all(row[name] >= value for name, value in minimum.items())
+        and all(row[name] <= value for name, value in maximum.items())
+    ]
+    matches.sort(key=lambda row: row[rank])
+    return matches[:limit]
@@ -0,0 +1,192 @@
+"""Columnar table of steel section properties, persisted as a ``.npy`` file.
+
+Properties of every catalogue profile are computed once into a NumPy
+structured array, one row per profile, and saved under ``.cache/sections``.
+IPE rows come from the ``section`` package objects; the other families come
+from the closed forms of ``section_families``, one pass per family.
+Later processes memory-map the file, so reading a property is an index into
+a column. The file name carries ``TABLE_VERSION`` and a fingerprint of the
+``section`` package sources and of ``section_families``; a change of either
+builds a new table and removes the stale one.
+
+Units are mm, mm², mm⁴ and mm³; mass is in kg/m. x and y are the axes of the
+``section`` package; parametric sections stand upright, so their x axis is
+the strong one. Elastic moduli are I over the extreme fibre distance (h/2
+about the strong axis, b/2 about the weak one; the toe side for channels)
+and plastic moduli come from the closed forms of ``section_families``.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+
+import numpy as np
+
+from engineering import section_families
+from engineering.constants import STEEL_DENSITY
+from engineering.section_families import (
+    FAMILIES,
+    I_DIMENSIONS,
+    IPE,
+    designation_key,
+    dimension_table,
+    i_section,
+)
+
+TABLE_VERSION = 2
+# families computed from their dimension tables; IPE comes from the package
+PARAMETRIC_FAMILIES = ("HEA", "HEB", "UPN", "CHS", "RHS")
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "sections"
+SECTION_DTYPE = np.dtype(
+    [
+        ("name", "U24"),
+        ("family", "U8"),
+        ("A", "f8"),
+        ("xc", "f8"),
+        ("yc", "f8"),
+        ("Ixx", "f8"),
+        ("Iyy", "f8"),
+        ("Ixy", "f8"),
+        ("ix", "f8"),
+        ("iy", "f8"),
+        ("Welx", "f8"),
+        ("Wely", "f8"),
+        ("Wplx", "f8"),
+        ("Wply", "f8"),
+        ("mass", "f8"),
+    ]
+)
+
+
+@lru_cache(maxsize=1)
+def package_fingerprint() -> str:
+    """SHA-256 of the table layout and of the sources the table comes from."""
+    spec = find_spec("section")
+    if spec is None:
+        raise ModuleNotFoundError("The section package is not installed")
+    roots = [Path(root) for root in spec.submodule_search_locations or ()]
+    sources = [(p.relative_to(root), p) for root in roots for p in root.rglob("*.py")]
+    sources.sort()
+    sources.append((Path("section_families.py"), Path(section_families.__file__)))
+    digest = hashlib.sha256(f"{TABLE_VERSION}{SECTION_DTYPE.descr}".encode())
+    for name, path in sources:
+        digest.update(str(name).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def profile_rows(family, profiles: dict, rows, fields, properties) -> np.ndarray:
+    """Table rows of section objects such as ``section.ipe.ipeDict``.
+
+    Area, centroid, inertia and radii come from the objects; depth, width
+    and plastic moduli come from the dimension rows of the same
+    designations, and are NaN when missing.
+    """
+    table = np.zeros(len(profiles), dtype=SECTION_DTYPE)
+    table["family"] = family
+    for i, (name, profile) in enumerate(profiles.items()):
+        table["name"][i] = name
+        table["A"][i] = profile.area()
+        table["xc"][i], table["yc"][i] = profile.centroid()
+        table["Ixx"][i], table["Iyy"][i], table["Ixy"][i] = profile.inertia()
+        table["ix"][i], table["iy"][i] = profile.radii_of_gyration()
+    names, dimensions = dimension_table(rows, fields)
+    values = {**dimensions, **properties(**dimensions)}
+    index = {designation_key(name): i for i, name in enumerate(names)}
+    match = np.array([index.get(designation_key(n), -1) for n in table["name"]])
+
+    def column(key):
+        return np.where(match >= 0, values[key][match], np.nan)
+
+    # x is the strong axis when Ixx is the larger inertia
+    strongX = table["Ixx"] >= table["Iyy"]
+    h, b = column("h"), column("b")
+    table["Welx"] = table["Ixx"] / np.where(strongX, h, b) * 2
+    table["Wely"] = table["Iyy"] / np.where(strongX, b, h) * 2
+    table["Wplx"] = np.where(strongX, column("Wpl_y"), column("Wpl_z"))
+    table["Wply"] = np.where(strongX, column("Wpl_z"), column("Wpl_y"))
+    table["mass"] = table["A"] * 1e-6 * STEEL_DENSITY
+    return table
+
+
+def family_rows(family) -> np.ndarray:
+    """Table rows of a family of ``section_families``, from one vectorized
+    evaluation of its closed forms. Sections stand upright, so x is the
+    strong axis."""
+    spec = FAMILIES[family]
+    names, dimensions = dimension_table(spec.rows, spec.fields)
+    p = spec.properties(**dimensions)
+    table = np.zeros(names.size, dtype=SECTION_DTYPE)
+    table["name"], table["family"] = names, family
+    table["A"], table["xc"], table["yc"] = p["A"], p["xc"], p["yc"]
+    table["Ixx"], table["Iyy"] = p["Iy"], p["Iz"]
+    table["ix"], table["iy"] = np.sqrt(p["Iy"] / p["A"]), np.sqrt(p["Iz"] / p["A"])
+    table["Welx"], table["Wely"] = p["Wel_y"], p["Wel_z"]
+    table["Wplx"], table["Wply"] = p["Wpl_y"], p["Wpl_z"]
+    table["mass"] = p["A"] * 1e-6 * STEEL_DENSITY
+    return table
+
+
+def build_table() -> np.ndarray:
+    """Rows of every catalogue family, computed from scratch."""
+    from section.ipe import ipeDict
+
+    return np.concatenate(
+        [profile_rows("IPE", ipeDict, IPE, I_DIMENSIONS, i_section)]
+        + [family_rows(family) for family in PARAMETRIC_FAMILIES]
+    )
+
+
+def load_table(cacheDir=CACHE_DIR) -> np.ndarray:
+    """Memory-mapped section table, built and saved first when missing."""
+    cacheDir = Path(cacheDir)
+    path = cacheDir / f"sections-v{TABLE_VERSION}-{package_fingerprint()[:16]}.npy"
+    if not path.exists():
+        table = build_table()
+        cacheDir.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary, "wb") as f:
+            np.save(f, table)
+        os.replace(temporary, path)  # atomic, so readers never see half a file
+        for stale in cacheDir.glob("sections-*.npy"):
+            if stale != path:
+                try:
+                    stale.unlink()
+                except OSError:  # still mapped by another process
+                    pass
+    return np.load(path, mmap_mode="r")
+
+
+@dataclass
+class SectionTable:
+    data: np.ndarray  # structured array of SECTION_DTYPE rows
+    index: dict = field(init=False, repr=False)  # name -> row
+
+    def __post_init__(self):
+        self.index = {str(name): i for i, name in enumerate(self.data["name"])}
+
+    def __len__(self):
+        return self.data.size
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __getitem__(self, name):
+        """Row of one profile by designation."""
+        return self.data[self.index[name]]
+
+    def family(self, family) -> np.ndarray:
+        """Rows of one family, in catalogue order."""
+        return self.data[self.data["family"] == family]
+
+    def names(self, family) -> list[str]:
+        return [str(name) for name in self.family(family)["name"]]
+
+
+@lru_cache(maxsize=1)
+def section_table() -> SectionTable:
+    """Section table of the catalogue, shared by the whole process."""
+    return SectionTable(load_table())
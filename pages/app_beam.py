@@ -1,14 +1,37 @@
 import streamlit as st
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import PatchCollection, PolyCollection
 import numpy as np
 
 from main import STRUCTURAL_TOOLS
 from structuralelement.beam2d import Beam2D
+from engineering.beam_cache import beam_cache
+from engineering.beam_numeric import NumericBeam2D
+from engineering.beam_influence import influence_lines
+from engineering.beam_loadcases import LoadCase, LoadCaseLibrary, LoadCombination
+from engineering.beam_design import design_beam
+from engineering import rendering
+from engineering.decimate import decimate
+
+SOLVERS = {
+    "Symbolic (sympy)": Beam2D,
+    "Numeric (banded stiffness matrix)": NumericBeam2D,
+}
+STATIC_LOADS = "Static loads"
+MOVING_LOADS = "Moving loads"
+LOAD_COMBINATIONS = "Load combinations"
+IPE_DESIGN = "Design (IPE)"
+# modes driven by the point and distributed load inputs
+STATIC_LOAD_MODES = (STATIC_LOADS, IPE_DESIGN)
+STATIC_CHARTS = "Static (image)"
+INTERACTIVE_CHARTS = "Interactive (zoomable)"
+MAX_CHART_POINTS = 1000  # per series sent to the browser
 
 appName = "Beam Model"
 app = STRUCTURAL_TOOLS[appName]
 st.set_page_config(page_title=appName, page_icon="🛠️")
+rendering.begin_rerun()
 
 # Aumentar el grosor de líneas del hatch
 plt.rcParams["hatch.linewidth"] = 2.0
@@ -27,6 +50,11 @@ st.write(app["desc"])
 st.markdown("---")
 
 st.title("Bernoulli Beam Model (V & M)")
+mode = st.radio(
+    "Analysis mode",
+    [STATIC_LOADS, MOVING_LOADS, LOAD_COMBINATIONS, IPE_DESIGN],
+    horizontal=True,
+)
 with st.expander("Beam Parameters"):
     default_E_GPa = "210.0"  # default young modulus in GPa
     default_I_mm4 = "8000000"  # default moment of inertia in mm⁴
@@ -71,26 +99,152 @@ with st.expander("Beam Parameters"):
         I = None
 # --- Supports ---
 with st.expander("Supports"):
-    col1, col2, col3 = st.columns([1, 3, 1])
-    with col1:
-        left_support = st.selectbox("Left Support", ["Fixed", "Simple", "Free"])
-    with col2:
-        use_middle_support = st.checkbox("Include Middle Support")
-    with col3:
-        right_support = st.selectbox("Right Support", ["Fixed", "Simple", "Free"])
-    col1, col2, col3 = st.columns([1, 5, 1])
-    with col2:
-        if use_middle_support:
-            middle_support_position = st.slider(
-                "Middle Support Position (m)",
-                min_value=1.0,
-                max_value=length - 1.0,
-                value=length / 2,
-                step=0.5,
+    st.markdown("Any number of supports and internal hinges along the beam")
+    support_rows = st.data_editor(
+        [
+            {"Position (m)": 0.0, "Type": "Fixed"},
+            {"Position (m)": length, "Type": "Fixed"},
+        ],
+        num_rows="dynamic",
+        column_config={
+            "Position (m)": st.column_config.NumberColumn(
+                min_value=0.0, max_value=length, step=0.5, required=True
+            ),
+            "Type": st.column_config.SelectboxColumn(
+                options=["Fixed", "Simple", "Free", "Hinge"], required=True
+            ),
+        },
+        key=f"supports_{length}",
+    )
+support_rows = sorted(
+    (row for row in support_rows if row.get("Position (m)") is not None),
+    key=lambda row: row["Position (m)"],
+)
+supports = [
+    (row["Position (m)"], row["Type"].lower())
+    for row in support_rows
+    if row.get("Type") in ("Fixed", "Simple", "Free")
+]
+hinges = [row["Position (m)"] for row in support_rows if row.get("Type") == "Hinge"]
+# --- Load Train ---
+if mode == MOVING_LOADS:
+    with st.expander("Load Train", expanded=True):
+        st.markdown("Axles listed from the leading one; spacings between axles")
+        col1, col2 = st.columns(2)
+        with col1:
+            axle_loads_text = st.text_input("Axle loads (kN)", "100, 100, 50")
+        with col2:
+            axle_spacings_text = st.text_input("Axle spacings (m)", "1.5, 3.0")
+        try:
+            axle_loads = [float(v) for v in axle_loads_text.split(",") if v.strip()]
+            axle_spacings = [
+                float(v) for v in axle_spacings_text.split(",") if v.strip()
+            ]
+            if len(axle_spacings) != len(axle_loads) - 1:
+                raise ValueError("one spacing is needed between each pair of axles")
+            axles = list(zip(np.cumsum([0.0] + axle_spacings), axle_loads))
+        except ValueError as e:
+            st.error(f"Invalid load train: {e}")
+            axles = []
+# --- Load Cases and Combinations ---
+if mode == LOAD_COMBINATIONS:
+    with st.expander("Load Cases", expanded=True):
+        st.markdown(
+            "Point loads use x₁ and a₀ as position and value; distributed loads "
+            "are w(x) = a₀ + a₁·x + a₂·x² between x₁ and x₂"
+        )
+        case_rows = st.data_editor(
+            [
+                {
+                    "Case": "G",
+                    "Type": "Distributed",
+                    "x₁ (m)": 0.0,
+                    "x₂ (m)": length,
+                    "a₀": 10.0,
+                    "a₁": 0.0,
+                    "a₂": 0.0,
+                },
+                {
+                    "Case": "Q",
+                    "Type": "Distributed",
+                    "x₁ (m)": 0.0,
+                    "x₂ (m)": length,
+                    "a₀": 15.0,
+                    "a₁": 0.0,
+                    "a₂": 0.0,
+                },
+                {
+                    "Case": "W",
+                    "Type": "Point",
+                    "x₁ (m)": length / 3,
+                    "x₂ (m)": None,
+                    "a₀": 20.0,
+                    "a₁": 0.0,
+                    "a₂": 0.0,
+                },
+            ],
+            num_rows="dynamic",
+            column_config={
+                "Type": st.column_config.SelectboxColumn(
+                    options=["Point", "Distributed"], required=True
+                )
+            },
+            key=f"load_cases_{length}",
+        )
+        load_cases = {}
+        for row in case_rows:
+            if not row.get("Case") or row.get("x₁ (m)") is None:
+                continue
+            case = load_cases.setdefault(row["Case"], LoadCase(row["Case"]))
+            if row.get("Type") == "Point":
+                case.pointLoads.append((row["x₁ (m)"], row.get("a₀") or 0.0))
+            elif row.get("x₂ (m)") is not None:
+                case.distributedLoads.append(
+                    (
+                        (row["x₁ (m)"], row["x₂ (m)"]),
+                        tuple(row.get(a) or 0.0 for a in ("a₀", "a₁", "a₂")),
+                    )
+                )
+    with st.expander("Combinations", expanded=True):
+        default_factors = {
+            "ULS 1": {"G": 1.35, "Q": 1.5},
+            "ULS 2": {"G": 1.35, "Q": 1.5, "W": 0.9},
+            "ULS 3": {"G": 1.0, "W": 1.5},
+            "SLS": {"G": 1.0, "Q": 1.0},
+        }
+        combination_rows = st.data_editor(
+            [
+                {"Combination": name}
+                | {case: factors.get(case, 0.0) for case in load_cases}
+                for name, factors in default_factors.items()
+            ],
+            num_rows="dynamic",
+            key="combinations_" + "_".join(load_cases),
+        )
+        combinations = [
+            LoadCombination(
+                row["Combination"],
+                {case: row.get(case) or 0.0 for case in load_cases},
+            )
+            for row in combination_rows
+            if row.get("Combination")
+        ]
+# --- Design Criteria ---
+if mode == IPE_DESIGN:
+    with st.expander("Design Criteria", expanded=True):
+        col1, col2 = st.columns(2)
+        with col1:
+            design_fy = st.number_input("Yield strength fy (MPa)", 100, 1000, 355)
+        with col2:
+            deflection_ratio = st.number_input(
+                "Deflection limit L /", 100, 1000, 250, step=50
             )
 # --- Point Loads ---
 with st.expander("Point Loads"):
-    use_point_load = st.checkbox("Include Point Load")
+    use_point_load = (
+        st.checkbox("Include Point Load", disabled=mode not in STATIC_LOAD_MODES)
+        and mode in STATIC_LOAD_MODES
+    )
     if use_point_load:
         point_load_magnitude = st.slider(
             "Point Load Magnitude (kN)",
@@ -110,9 +264,12 @@ with st.expander("Point Loads"):
             )
 # --- Distributed Loads ---
 with st.expander("Distributed Loads"):
-    use_distributed = st.checkbox("Include Distributed Load")
+    use_distributed = (
+        st.checkbox("Include Distributed Load", disabled=mode not in STATIC_LOAD_MODES)
+        and mode in STATIC_LOAD_MODES
+    )
     if use_distributed:
-        st.markdown("Coeficientes del polinomio w(x) = a₀ + a₁·x + a₂·x²")
+        st.markdown("Coeficientes del polinomio q(x) = a₀ + a₁·x + a₂·x² (N/m, x en m)")
         col1, col2, col3 = st.columns(3)
         with col1:
             a0 = st.number_input("a₀", value=50.0, step=0.5)
@@ -131,242 +288,442 @@ with st.expander("Distributed Loads"):
                     step=0.5,
                 )
 # --- Plot ---
-fig, ax = plt.subplots(figsize=(8, 2))
-ax.set_xlim(-length * 0.1, length * 1.1)
-ax.set_ylim(-1, 2)
-ax.axis("off")
-# --- Beam ---
-ax.plot([0, length], [0, 0], color="black", linewidth=3)
-# --- Dibujar apoyos ---
 # Escala constante para los apoyos (en metros, relativo)
 support_height = 0.8
 support_width = 0.05
 
 
-def draw_support(x, kind):
-    if kind == "Fixed":
-        # Rectángulo vertical con hachurado (empotramiento)
-        rect = patches.Rectangle(
-            (x - support_width * length / 2, -support_height),
-            support_width * length,
-            2 * support_height,
-            hatch="///",
-            facecolor="none",
-            edgecolor="black",
-            linewidth=0,
+@st.cache_data(max_entries=256, show_spinner=False)
+def render_schematic(length, supports, hinges, point_load, distributed_load):
+    """PNG of the beam schematic, cached on its geometric inputs so reruns
+    caused by unrelated widgets skip the matplotlib work entirely."""
+    fig, ax = rendering.new_figure((8, 2))
+    ax.set_xlim(-length * 0.1, length * 1.1)
+    ax.set_ylim(-1, 2)
+    ax.axis("off")
+    # --- Beam ---
+    ax.plot([0, length], [0, 0], color="black", linewidth=3)
+    # --- Dibujar apoyos ---
+    half_width = support_width * length / 2
+    # rectángulos con hachurado (empotramiento)
+    fixed = [
+        patches.Rectangle(
+            (x - half_width, -support_height), 2 * half_width, 2 * support_height
         )
-        ax.add_patch(rect)
-    elif kind == "Simple":
-        # Triángulo isósceles
-        triangle = [
-            [x - support_width * length / 2, -support_height],
-            [x, 0],
-            [x + support_width * length / 2, -support_height],
-        ]
-        ax.add_patch(plt.Polygon(triangle, closed=True, color="black"))
-
-
-# left support
-if left_support != "Free":
-    draw_support(0, left_support)
-# right support
-if right_support != "Free":
-    draw_support(length, right_support)
-# middle support (optional)
-if use_middle_support:
-    draw_support(middle_support_position, "Simple")
-# --- Plot Point Load ---
-if use_point_load:
-    # arrow plot
-    ax.annotate(
-        "",  # sin texto
-        xy=(point_load_position, 0),  # punta de flecha
-        xytext=(point_load_position, 2.5),  # inicio de flecha
-        arrowprops=dict(arrowstyle="->", color="red", lw=2),
-    )
-    # value label
-    ax.text(
-        point_load_position + 0.1,
-        0.6,
-        f"{point_load_magnitude} kN",
-        color="red",
-        fontsize=10,
-    )
-# --- Plot Distributed Load ---
-if use_distributed:
-    # load function
-    # q(x) = a0 + a1*x + a2*x²
-    num_points = max(10, int(25 * (x2 - x1) / length))
-    x_vals = np.linspace(x1, x2, num=num_points)
-    q_vals = a0 + a1 * x_vals + a2 * x_vals**2
-    max_q = np.max(np.abs(q_vals))
-    if max_q == 0:
-        max_q = 1  # avoid division by zero
-    scale = 1.5 / max_q  # scale arrows
-    for xi, qi in zip(x_vals, q_vals):
-        arrow_len = qi * scale
+        for x, kind in supports
+        if kind == "fixed"
+    ]
+    # triángulos isósceles (apoyo simple)
+    simple = [
+        [[x - half_width, -support_height], [x, 0], [x + half_width, -support_height]]
+        for x, kind in supports
+        if kind == "simple"
+    ]
+    if fixed:
+        ax.add_collection(
+            PatchCollection(
+                fixed, hatch="///", facecolor="none", edgecolor="black", linewidth=0
+            )
+        )
+    if simple:
+        ax.add_collection(PolyCollection(simple, facecolor="black", edgecolor="black"))
+    # internal hinges as open circles on the beam axis
+    if hinges:
+        ax.plot(hinges, [0] * len(hinges), "o", mfc="white", mec="black", zorder=3)
+    # --- Plot Point Load ---
+    if point_load:
+        position, magnitude = point_load
         ax.annotate(
-            "",
-            xy=(xi, 0),
-            xytext=(xi, arrow_len),
-            arrowprops=dict(arrowstyle="->", color="blue", lw=1.5),
+            "",  # sin texto
+            xy=(position, 0),  # punta de flecha
+            xytext=(position, 2.5),  # inicio de flecha
+            arrowprops=dict(arrowstyle="->", color="red", lw=2),
+        )
+        # value label
+        ax.text(position + 0.1, 0.6, f"{magnitude} kN", color="red", fontsize=10)
+    # --- Plot Distributed Load ---
+    if distributed_load:
+        (x1, x2), (a0, a1, a2) = distributed_load
+        # q(x) = a0 + a1*x + a2*x²
+        num_points = max(10, int(25 * (x2 - x1) / length))
+        x_vals = np.linspace(x1, x2, num=num_points)
+        q_vals = a0 + a1 * x_vals + a2 * x_vals**2
+        max_q = np.max(np.abs(q_vals))
+        if max_q == 0:
+            max_q = 1  # avoid division by zero
+        arrow_len = q_vals * 1.5 / max_q  # scale arrows
+        # every arrow in a single quiver, pointing from q(x) down to the beam
+        ax.quiver(
+            x_vals,
+            arrow_len,
+            np.zeros_like(x_vals),
+            -arrow_len,
+            angles="xy",
+            scale_units="xy",
+            scale=1,
+            color="blue",
+            width=0.003,
         )
-    # value label
-    ax.text((x1 + x2) / 2, 1.2, "q(x)", color="blue", fontsize=10)
-# show figure
-st.pyplot(fig)
+        # value label
+        ax.text((x1 + x2) / 2, 1.2, "q(x)", color="blue", fontsize=10)
+    return rendering.render(fig)
+
+
+st.image(
+    render_schematic(
+        length,
+        tuple(supports),
+        tuple(hinges),
+        (point_load_position, point_load_magnitude) if use_point_load else None,
+        ((x1, x2), (a0, a1, a2)) if use_distributed else None,
+    ),
+    use_container_width=True,
+)
+rendering.report()
 # --- Calculate reactions and efforts ---
 # create the beam model and calculate reactions and efforts
 st.markdown("### Calculations")
 
 
-def calculate_beam():
-    # supports
-    supports = []
-    supports.append((0, left_support.lower()))
-    supports.append((length, right_support.lower()))
-    if use_middle_support:
-        supports.insert(1, (middle_support_position, "simple"))
-    # point loads
+def plot_envelopes(lines, envelope):
+    """Moving-load envelopes of V and M plus the reaction influence lines."""
+    xVals = envelope["x"]
+    fig3, axs = rendering.new_figure((6, 7.5), 3, 1)
+    for ax_env, key, color, label in (
+        (axs[0], "V", "lightgreen", "Shear force (kN)"),
+        (axs[1], "M", "lightcoral", "Bending Moment (kN·m)"),
+    ):
+        low, high = envelope[key]
+        ax_env.fill_between(xVals, 0, high, color=color, alpha=0.6, label="max")
+        ax_env.fill_between(xVals, 0, low, color=color, alpha=0.3, label="min")
+        ax_env.set_ylabel(label)
+        ax_env.set_title(f"{key} envelope")
+        ax_env.legend(loc="upper right", fontsize=8)
+    for (xSupport, _), reactionLine in zip(lines.supports, lines.reaction):
+        axs[2].plot(lines.x, reactionLine, label=f"R ({xSupport:.2f} m)")
+    axs[2].axhline(0, color="black", linewidth=0.5)
+    axs[2].set_title("Reaction influence lines (unit load)")
+    axs[2].set_xlabel("x (m)")
+    axs[2].legend(loc="upper right", fontsize=8)
+    fig3.tight_layout()
+    rendering.show(fig3)
+
+
+if mode == MOVING_LOADS:
+    if st.button("Calculate Envelopes") and axles:
+        try:
+            lines = influence_lines(E, I, length, supports, hinges)
+            envelope = lines.envelope(axles)
+        except Exception as e:
+            st.error(f"Error al calcular la viga: {e}")
+        else:
+            plot_envelopes(lines, envelope)
+            st.markdown("### Reactions (max / min)")
+            cols = st.columns(len(lines.supports))
+            for col, (xSupport, _), rMin, rMax in zip(
+                cols, lines.supports, *envelope["R"]
+            ):
+                col.markdown(f"R ({xSupport:.2f} m): {rMax:.2f} / {rMin:.2f} kN")
+    st.stop()
+
+
+def plot_combination_envelope(results, envelope):
+    """Governing envelopes of w, V and M over every combination."""
+    fig4, axs = rendering.new_figure((6, 7.5), 3, 1)
+    for ax_env, key, color, label in (
+        (axs[0], "w", "skyblue", "Deflection (m)"),
+        (axs[1], "V", "lightgreen", "Shear force (N)"),
+        (axs[2], "M", "lightcoral", "Bending Moment (N·m)"),
+    ):
+        low, high = envelope[key]["min"], envelope[key]["max"]
+        where = ~np.isnan(high)
+        ax_env.fill_between(results.x, 0, high, where=where, color=color, alpha=0.6)
+        ax_env.fill_between(results.x, 0, low, where=where, color=color, alpha=0.3)
+        ax_env.set_ylabel(label)
+        ax_env.set_title(f"{key} envelope")
+    axs[2].set_xlabel("x (m)")
+    fig4.tight_layout()
+    rendering.show(fig4)
+
+
+if mode == LOAD_COMBINATIONS:
+    if st.button("Calculate Combinations") and load_cases and combinations:
+        try:
+            library = LoadCaseLibrary(
+                E, I, length, supports, load_cases.values(), hinges
+            ).solve()
+            results = library.combine(combinations)
+        except Exception as e:
+            st.error(f"Error al calcular la viga: {e}")
+        else:
+            envelope = results.envelope()
+            plot_combination_envelope(results, envelope)
+            st.markdown("### Max / Min Values per Combination")
+            st.dataframe(
+                [
+                    {"Combination": name}
+                    | {
+                        f"{key} {bound}": value[bound][1]
+                        for key, value in extremes.items()
+                        for bound in ("max", "min")
+                    }
+                    for name, extremes in results.minmax().items()
+                ]
+            )
+            st.markdown("### Governing Values")
+            cols = st.columns(4)
+            for col, (key, bounds) in zip(cols, envelope.items()):
+                iMax = np.nanargmax(bounds["max"])
+                iMin = np.nanargmin(bounds["min"])
+                col.markdown(
+                    f"{key} max: {bounds['max'][iMax]:.2f} "
+                    f"({results.names[bounds['maxCombination'][iMax]]})"
+                )
+                col.markdown(
+                    f"{key} min: {bounds['min'][iMin]:.2f} "
+                    f"({results.names[bounds['minCombination'][iMin]]})"
+                )
+    st.stop()
+
+
+def static_loads(asExpression=False):
+    """Point and distributed loads from the load inputs."""
     point_loads = []
     if use_point_load:
         point_loads.append((point_load_position, point_load_magnitude))
-    # distributed loads
     distributed_loads = []
     if use_distributed:
-        distributed_loads.append(((x1, x2), f"{a0} + {a1}*x + {a2}*x**2"))
-
-    beam = Beam2D(
-        youngModulus=float(st.session_state.young_modulus) * 1e9,  # GPa to Pa
-        inertia=float(st.session_state.inertia) * 1e-12,  # mm⁴ to m⁴
-        length=length,
-        supports=supports,
-        pointLoads=point_loads,
-        pointMoments=[],
-        distributedLoads=distributed_loads,
+        if asExpression:
+            # symbolic solver parses the polynomial from a string
+            distributed_loads.append(((x1, x2), f"{a0} + {a1}*x + {a2}*x**2"))
+        else:
+            distributed_loads.append(((x1, x2), (a0, a1, a2)))
+    return point_loads, distributed_loads
+
+
+if mode == IPE_DESIGN:
+    if st.button("Select Profile"):
+        point_loads, distributed_loads = static_loads()
+        # the slider is in kN, design_beam works in N, m and Pa
+        point_loads = [(x, p * 1e3) for x, p in point_loads]
+        try:
+            design = design_beam(
+                E,
+                length,
+                supports,
+                pointLoads=point_loads,
+                distributedLoads=distributed_loads,
+                hinges=hinges,
+                fy=design_fy * 1e6,
+                deflectionLimit=length / deflection_ratio,
+            )
+        except Exception as e:
+            st.error(f"Error al calcular la viga: {e}")
+        else:
+            catalogue = design.catalogue
+            selected = design.selected
+            if selected is None:
+                st.error("No IPE profile meets the bending and deflection limits.")
+            else:
+                st.success(
+                    f"Lightest profile: **{catalogue.names[selected]}** "
+                    f"({catalogue.mass[selected]:.1f} kg/m)"
+                )
+            st.markdown(f"Governing moment: {design.maxMoment:.2f} N·m")
+            st.dataframe(
+                [
+                    {
+                        "Profile": str(catalogue.names[i]),
+                        "Mass (kg/m)": round(float(catalogue.mass[i]), 1),
+                        "M / M_Rd": round(float(design.bendingUtilisation[i]), 3),
+                        "w (mm)": round(float(design.deflection[i]) * 1e3, 2),
+                        "w / w_lim": round(float(design.deflectionUtilisation[i]), 3),
+                        "OK": bool(design.feasible[i]),
+                    }
+                    for i in np.argsort(catalogue.mass)
+                ]
+            )
+    st.stop()
+solverName = st.radio("Solver", list(SOLVERS.keys()), horizontal=True)
+chartBackend = st.radio("Charts", [STATIC_CHARTS, INTERACTIVE_CHARTS], horizontal=True)
+beamClass = SOLVERS[solverName]
+if hinges and beamClass is not NumericBeam2D:
+    st.warning("Internal hinges are only supported by the numeric solver.")
+    beamClass = NumericBeam2D
+
+
+def calculate_beam():
+    point_loads, distributed_loads = static_loads(
+        asExpression=beamClass is not NumericBeam2D
     )
+
+    # solved beams are shared between sessions through the solve cache
     try:
-        beam.solve()
-        return beam
+        return beam_cache.solve(
+            beamClass,
+            youngModulus=float(st.session_state.young_modulus) * 1e9,  # GPa to Pa
+            inertia=float(st.session_state.inertia) * 1e-12,  # mm⁴ to m⁴
+            length=length,
+            supports=supports,
+            pointLoads=point_loads,
+            pointMoments=[],
+            distributedLoads=distributed_loads,
+            **({"hinges": hinges} if hinges else {}),
+        )
     except Exception as e:
         st.error(f"Error al calcular la viga: {e}")
         return None
 
 
+def plot_interactive(xVals, series):
+    """Zoomable Vega-Lite charts rendered in the browser. Each series is
+    decimated to MAX_CHART_POINTS so the payload does not grow with the
+    sampling density of the solution."""
+    charts = []
+    sent = 0
+    for i, (_, values, color, label) in enumerate(series):
+        xData, yData = decimate(xVals, values, MAX_CHART_POINTS)
+        sent += xData.size
+        charts.append(
+            {
+                "data": {
+                    "values": [
+                        {
+                            "x": None if np.isnan(x) else float(x),
+                            "y": None if np.isnan(y) else float(y),
+                        }
+                        for x, y in zip(xData, yData)
+                    ]
+                },
+                # null values break the area between beam elements
+                "mark": {"type": "area", "line": True, "color": color, "invalid": None},
+                "encoding": {
+                    "x": {"field": "x", "type": "quantitative", "title": "x (m)"},
+                    "y": {"field": "y", "type": "quantitative", "title": label},
+                },
+                "params": [
+                    {"name": f"zoom{i}", "select": "interval", "bind": "scales"}
+                ],
+                "width": "container",
+                "height": 150,
+            }
+        )
+    st.vega_lite_chart(
+        {"vconcat": charts, "resolve": {"scale": {"x": "shared"}}},
+        use_container_width=True,
+    )
+    st.caption(
+        f"{sent} of {len(xVals) * len(charts)} points sent to the browser; "
+        "drag to pan, scroll to zoom"
+    )
+
+
 # button to calculate the beam
 if st.button("Calculate Beam"):
     # Crear el modelo de la viga
-    calculatedBeam = calculate_beam()
-    if calculatedBeam:
+    solution = calculate_beam()
+    if solution:
+        calculatedBeam = solution.beam
         # data plot from beam
-        xVals, wVals, thetaVals, vVals, mVals = calculatedBeam.data_plot()
-        fig2, axs = plt.subplots(2, 1, figsize=(6, 5))
-        # Combined Deflection (w) and Slope (θ)
-        ax0 = axs[0]
-        ax0_2 = ax0.twinx()
-        # common limits
-        wMax = np.nanmax(np.abs(wVals))
-        thetaMax = np.nanmax(np.abs(thetaVals))
-        wLims = (-wMax, wMax)
-        thetaLims = (-thetaMax, thetaMax)
-        ax0.fill_between(
-            xVals,
-            0,
-            wVals,
-            where=~np.isnan(wVals),
-            color="skyblue",
-            alpha=0.25,
-            label="Deflection (w)",
-        )
-        ax0.set_ylabel("Deflection (m)", color="skyblue")
-        ax0.tick_params(axis="y", labelcolor="skyblue")
-        ax0.set_ylim(wLims)
-        ax0_2.fill_between(
-            xVals,
-            0,
-            thetaVals,
-            where=~np.isnan(thetaVals),
-            color="peachpuff",
-            alpha=0.5,
-            label="Slope (θ)",
-        )
-        ax0_2.set_ylabel("Slope (rad)", color="peru")
-        ax0_2.tick_params(axis="y", labelcolor="peru")
-        ax0_2.set_ylim(thetaLims)
-        # common title and x_labels
-        ax0.set_title("Deflection (w) and Slope (θ)")
-        ax0.set_xlabel("x (m)")
-        # Combined Shear (V) and Bending Moment (M)
-        axs1 = axs[1]
-        axs1_2 = axs1.twinx()
-        # common limits
-        vMax = np.nanmax(np.abs(vVals))
-        mMax = np.nanmax(np.abs(mVals))
-        vLims = (-vMax, vMax)
-        mLims = (-mMax, mMax)
-        axs1.fill_between(
-            xVals,
-            0,
-            vVals,
-            where=~np.isnan(vVals),
-            color="lightgreen",
-            alpha=0.5,
-            label="Shear force (V)",
-        )
-        axs1.set_ylabel("Shear force (N)", color="lightgreen")
-        axs1.tick_params(axis="y", labelcolor="lightgreen")
-        axs1.set_ylim(vLims)
-        axs1_2.fill_between(
-            xVals,
-            0,
-            mVals,
-            where=~np.isnan(mVals),
-            color="lightcoral",
-            alpha=0.25,
-            label="Bending Moment (M)",
-        )
-        axs1_2.set_ylabel("Bending Moment (N·m)", color="lightcoral")
-        axs1_2.tick_params(axis="y", labelcolor="lightcoral")
-        axs1_2.set_ylim(mLims)
-        # common title and x_labels
-        axs1.set_title("Shear (V) and Moment (M)")
-        axs1.set_xlabel("x (m)")
-        # general settings for all subplots
-        plt.tight_layout(rect=[0, 0.05, 1, 1])
-        st.pyplot(fig2)
+        xVals, wVals, thetaVals, vVals, mVals = solution.plot_data
+        if chartBackend == INTERACTIVE_CHARTS:
+            plot_interactive(
+                xVals,
+                (
+                    ("w", wVals, "skyblue", "Deflection (m)"),
+                    ("θ", thetaVals, "peru", "Slope (rad)"),
+                    ("V", vVals, "lightgreen", "Shear force (N)"),
+                    ("M", mVals, "lightcoral", "Bending Moment (N·m)"),
+                ),
+            )
+        else:
+            fig2, axs = rendering.new_figure((6, 5), 2, 1)
+            # Combined Deflection (w) and Slope (θ)
+            ax0 = axs[0]
+            ax0_2 = ax0.twinx()
+            # common limits
+            wMax = np.nanmax(np.abs(wVals))
+            thetaMax = np.nanmax(np.abs(thetaVals))
+            wLims = (-wMax, wMax)
+            thetaLims = (-thetaMax, thetaMax)
+            ax0.fill_between(
+                xVals,
+                0,
+                wVals,
+                where=~np.isnan(wVals),
+                color="skyblue",
+                alpha=0.25,
+                label="Deflection (w)",
+            )
+            ax0.set_ylabel("Deflection (m)", color="skyblue")
+            ax0.tick_params(axis="y", labelcolor="skyblue")
+            ax0.set_ylim(wLims)
+            ax0_2.fill_between(
+                xVals,
+                0,
+                thetaVals,
+                where=~np.isnan(thetaVals),
+                color="peachpuff",
+                alpha=0.5,
+                label="Slope (θ)",
+            )
+            ax0_2.set_ylabel("Slope (rad)", color="peru")
+            ax0_2.tick_params(axis="y", labelcolor="peru")
+            ax0_2.set_ylim(thetaLims)
+            # common title and x_labels
+            ax0.set_title("Deflection (w) and Slope (θ)")
+            ax0.set_xlabel("x (m)")
+            # Combined Shear (V) and Bending Moment (M)
+            axs1 = axs[1]
+            axs1_2 = axs1.twinx()
+            # common limits
+            vMax = np.nanmax(np.abs(vVals))
+            mMax = np.nanmax(np.abs(mVals))
+            vLims = (-vMax, vMax)
+            mLims = (-mMax, mMax)
+            axs1.fill_between(
+                xVals,
+                0,
+                vVals,
+                where=~np.isnan(vVals),
+                color="lightgreen",
+                alpha=0.5,
+                label="Shear force (V)",
+            )
+            axs1.set_ylabel("Shear force (N)", color="lightgreen")
+            axs1.tick_params(axis="y", labelcolor="lightgreen")
+            axs1.set_ylim(vLims)
+            axs1_2.fill_between(
+                xVals,
+                0,
+                mVals,
+                where=~np.isnan(mVals),
+                color="lightcoral",
+                alpha=0.25,
+                label="Bending Moment (M)",
+            )
+            axs1_2.set_ylabel("Bending Moment (N·m)", color="lightcoral")
+            axs1_2.tick_params(axis="y", labelcolor="lightcoral")
+            axs1_2.set_ylim(mLims)
+            # common title and x_labels
+            axs1.set_title("Shear (V) and Moment (M)")
+            axs1.set_xlabel("x (m)")
+            # general settings for all subplots
+            fig2.tight_layout(rect=[0, 0.05, 1, 1])
+            rendering.show(fig2)
 
         # reactions
         st.markdown("### Reactions")
 
-        def reactions_text(reactions, xRef):
-            has_support = any(
-                xSupport == xRef for xSupport, _, vReaction, mReaction in reactions
-            )
-            if not has_support:
-                return None
-            else:
-                for xSupport, _, vReaction, mReaction in reactions:
-                    if xSupport == xRef:
-                        vReaction = 0 if vReaction is None else vReaction
-                        mReaction = 0 if mReaction is None else mReaction
-                        return vReaction, mReaction
-
-        col1, col2, col3 = st.columns([1, 1, 1])
-        with col1:
-            vReaction, mReaction = reactions_text(calculatedBeam.reactions, 0)
-            st.markdown(f"V (0): {vReaction:.2f} N")
-            st.markdown(f"M (0): {mReaction:.2f} Nm")
-        with col2:
-            if use_middle_support:
-                vReaction, mReaction = reactions_text(
-                    calculatedBeam.reactions, middle_support_position
-                )
-                st.markdown(f"V ({middle_support_position:.2f} m): {vReaction:.2f} N")
-                st.markdown(f"M ({middle_support_position:.2f} m): {mReaction:.2f} Nm")
-        with col3:
-            vReaction, mReaction = reactions_text(calculatedBeam.reactions, length)
-            st.markdown(f"V ({length:.2f} m): {vReaction:.2f} N")
-            st.markdown(f"M ({length:.2f} m): {mReaction:.2f} Nm")
+        cols = st.columns(3)
+        for i, (xSupport, _, vReaction, mReaction) in enumerate(
+            calculatedBeam.reactions
+        ):
+            vReaction = 0 if vReaction is None else vReaction
+            mReaction = 0 if mReaction is None else mReaction
+            with cols[i % 3]:
+                st.markdown(f"V ({float(xSupport):.2f} m): {float(vReaction):.2f} N")
+                st.markdown(f"M ({float(xSupport):.2f} m): {float(mReaction):.2f} Nm")
 
         # # efforts formulas
         # st.markdown("### Efforts Formulas")
@@ -379,35 +736,23 @@ if st.button("Calculate Beam"):
 
         # efforts formulas
         st.markdown("### Max / Min Values")
-        minmax = calculatedBeam.get_minmax()
+        minmax = solution.minmax
         col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
         for i, (key, value) in enumerate(minmax.items()):
             maxPos, maxVal = value["max"]
             minPos, minVal = value["min"]
-            # format positions as lists of floats with 2 decimals
-            maxPosStr = (
-                [f"{float(p):.2f}" for p in maxPos]
-                if isinstance(maxPos, list)
-                else f"{float(maxPos):.2f}"
-            )
-            minPosStr = (
-                [f"{float(p):.2f}" for p in minPos]
-                if isinstance(minPos, list)
-                else f"{float(minPos):.2f}"
-            )
-            # Format values with 2 decimals
-            try:
-                maxValStr = f"{float(maxVal):.2f}"
-            except Exception:
-                maxValStr = str(maxVal)
-            try:
-                minValStr = f"{float(minVal):.2f}"
-            except Exception:
-                minValStr = str(minVal)
+            # positions are a list when the extreme is reached at several points
+            maxPosStr = ", ".join(f"{p:.2f}" for p in np.atleast_1d(maxPos))
+            minPosStr = ", ".join(f"{p:.2f}" for p in np.atleast_1d(minPos))
             col = (
                 col1
                 if i % 4 == 0
                 else col2 if i % 4 == 1 else col3 if i % 4 == 2 else col4
             )
-            col.markdown(f"{key} max: {maxValStr}")
-            col.markdown(f"{key} min: {minValStr}")
+            col.markdown(f"{key} max: {maxVal:.2f} (x = {maxPosStr} m)")
+            col.markdown(f"{key} min: {minVal:.2f} (x = {minPosStr} m)")
+        stats = beam_cache.stats()
+        st.caption(
+            f"Solve cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['size']}/{stats['maxsize']} beams stored"
+        )
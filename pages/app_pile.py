@@ -1,142 +1,198 @@
+import os
+
 import streamlit as st
-from dataclasses import dataclass
-import math
-import matplotlib.pyplot as plt
+import numpy as np
 import matplotlib.patches as patches
+from matplotlib.collections import PatchCollection
+from matplotlib import colormaps
 
 from main import STRUCTURAL_TOOLS
+from engineering import rendering
+from engineering.pile import (
+    FrictionProfile,
+    PileGeometry,
+    SoilLayer,
+    SteelProperties,
+    evaluate_pile_full,
+    evaluate_pile_grid,
+)
+from engineering.pile_optimizer import full_sweep, optimize_pile
+from engineering.pile_reliability import PileReliabilityModel, monte_carlo
+from engineering.pile_lateral import lateral_pile
+from engineering.pile_group import PileGroup, analyse_group
+from engineering.cpt import cpt_stratigraphy
+
+SINGLE_PILE = "Single pile"
+DESIGN_CHARTS = "Design charts"
+OPTIMIZER = "Optimizer"
+RELIABILITY = "Reliability"
+LATERAL = "Lateral load"
+# worker processes the page may start for one simulation; larger pools are
+# for batch runs outside the server (see benchmarks/pile_reliability.py)
+MAX_PAGE_WORKERS = min(2, os.cpu_count() or 1)
+# largest optimizer space the page will sweep in full for comparison
+MAX_SWEEP_CANDIDATES = 1_000_000
+PILE_GROUP = "Pile group"
 
 appName = "Pile Model"
 app = STRUCTURAL_TOOLS[appName]
 st.set_page_config(page_title=appName, page_icon="🛠️")
-
-
-# --- DATACLASSES ---
-@dataclass
-class SteelProperties:
-    fy: float  # yield strength [MPa]
-    fu: float  # ultimate strength [MPa]
-    gamma_M0: float = 1.0
-    gamma_M1: float = 1.1
-
-
-@dataclass
-class PileGeometry:
-    length: float  # [m]
-    diameter: float  # [m]
-    thickness: float  # [m]
-
-    @property
-    def area(self):
-        return math.pi * (
-            (self.diameter / 2) ** 2 - ((self.diameter - 2 * self.thickness) / 2) ** 2
-        )
-
-
-@dataclass
-class SoilLayer:
-    thickness: float  # [m]
-    cu: float  # undrained cohesion [Pa]
-    alpha: float  # adhesion factor
-
-
-# --- STRUCTURAL ---
-def axial_resistance(steel: SteelProperties, geo: PileGeometry):
-    return steel.fy * 1e6 * geo.area / steel.gamma_M0
-
-
-def buckling_resistance(steel: SteelProperties, geo: PileGeometry, K=2.0, E=210e9):
-    A = geo.area
-    Do = geo.diameter
-    t = geo.thickness
-    I = math.pi / 64 * (Do**4 - (Do - 2 * t) ** 4)
-    Lcr = geo.length * K
-    slenderness = Lcr * math.sqrt(steel.fy * 1e6 / (E * math.pi**2)) / math.sqrt(I / A)
-    alpha = 0.49  # curve c for tubes
-    phi = 0.5 * (1 + alpha * (slenderness - 0.2) + slenderness**2)
-    chi = 1 / (phi + math.sqrt(phi**2 - slenderness**2))
-    chi = min(1.0, chi)
-    return chi * steel.fy * 1e6 * A / steel.gamma_M1
-
-
-def plastic_moment_resistance(steel: SteelProperties, geo: PileGeometry):
-    Do = geo.diameter
-    Di = Do - 2 * geo.thickness
-    W_pl = (math.pi / 4) * ((Do / 2) ** 3 - (Di / 2) ** 3)
-    return steel.fy * 1e6 * W_pl / steel.gamma_M0
-
-
-# --- GEOTECHNICAL ---
-def compute_geotechnical_capacity(layers: list[SoilLayer], geo: PileGeometry, Nc=9):
-    Q_s = 0
-    depth_accum = 0
-    for layer in layers:
-        depth_in_layer = min(layer.thickness, geo.length - depth_accum)
-        if depth_in_layer <= 0:
-            break
-        perimeter = math.pi * geo.diameter
-        Q_s += layer.alpha * layer.cu * perimeter * depth_in_layer
-        depth_accum += depth_in_layer
-    A_b = math.pi * (geo.diameter / 2) ** 2
-    cu_tip = layers[-1].cu  # Last = deepest
-    Q_b = cu_tip * Nc * A_b
-    return Q_s + Q_b
-
-
-# --- EVALUATION ---
-def evaluate_pile_full(steel, geo, soil_layers, K=2.0):
-    N_Rd = axial_resistance(steel, geo)
-    N_b_Rd = buckling_resistance(steel, geo, K)
-    M_Rd = plastic_moment_resistance(steel, geo)
-    Q_geo = compute_geotechnical_capacity(soil_layers, geo)
-    return {
-        "Axial resistance [kN]": N_Rd / 1e3,
-        "Buckling resistance [kN]": N_b_Rd / 1e3,
-        "Moment resistance [kNm]": M_Rd / 1e3,
-        "Geotechnical capacity [kN]": Q_geo / 1e3,
-        "Governing axial capacity [kN]": min(N_Rd, N_b_Rd, Q_geo) / 1e3,
-    }
+rendering.begin_rerun()
 
 
 # --- PLOT FUNCTION ---
-def plot_pile_and_soil(geo: PileGeometry, soil_layers: list[SoilLayer]):
-    fig, ax = plt.subplots(figsize=(3, 6))
-    depth = 0
-    n = len(soil_layers)
-    for i, layer in enumerate(soil_layers):
-        h = min(layer.thickness, geo.length - depth)
-        # if h <= 0:
-        #     break
-        # Capa desde profundidad "depth" hasta "depth + h"
-        cmap_val = 0.2 + 0.6 * (i / max(1, n - 1))  # entre 0.2 y 0.8 del colormap
-        rect = patches.Rectangle(
-            (0.6, depth),  # x, y (y = profundidad actual)
-            0.8,
-            depth + layer.thickness,
-            linewidth=1,
-            edgecolor=None,
+@st.cache_data(max_entries=64, show_spinner=False)
+def render_pile_and_soil(length, layers):
+    """PNG of the pile and its stratigraphy; layers is a tuple of
+    (thickness [m], cu [Pa]), so widgets that do not change the drawing
+    reuse the cached image."""
+    fig, ax = rendering.new_figure((3, 6))
+    tops = np.concatenate(([0.0], np.cumsum([thickness for thickness, _ in layers])))
+    n = len(layers)
+    # una sola colección para todas las capas, entre 0.2 y 0.8 del colormap
+    ax.add_collection(
+        PatchCollection(
+            [
+                patches.Rectangle((0.6, top), 0.8, thickness)
+                for top, (thickness, _) in zip(tops, layers)
+            ],
+            facecolor=colormaps["terrain"](0.2 + 0.6 * np.arange(n) / max(1, n - 1)),
+            edgecolor="none",
             alpha=0.5,
-            facecolor=plt.cm.terrain(cmap_val),
         )
-        ax.add_patch(rect)
+    )
+    for i, (top, (thickness, cu)) in enumerate(zip(tops, layers)):
         ax.text(
             1.5,
-            depth + layer.thickness / 2,
-            f"Layer {i+1}\ncu={layer.cu/1e3:.0f} kPa",
+            top + thickness / 2,
+            f"Layer {i+1}\ncu={cu/1e3:.0f} kPa",
             va="center",
             fontsize=8,
         )
-        depth += layer.thickness
     # Dibujo del pilote
-    ax.plot([1.0, 1.0], [0, geo.length], color="grey", linewidth=None, label="Pile")
+    ax.plot([1.0, 1.0], [0, length], color="grey", linewidth=None, label="Pile")
     ax.set_xlim(0, 3)
-    maxDepth = sum(layer.thickness for layer in soil_layers)
-    ax.set_ylim(0, max(geo.length + 0.5, maxDepth + 0.5))
+    ax.set_ylim(0, max(length, tops[-1]) + 0.5)
     ax.set_title("Pile and Soil Stratigraphy")
     ax.set_ylabel("Depth [m]")
     ax.invert_yaxis()  # ahora sí, sentido físico: profundidad va hacia abajo
     ax.axis("off")
-    st.pyplot(fig)
+    return rendering.render(fig)
+
+
+def plot_pile_and_soil(geo: PileGeometry, soil_layers: list[SoilLayer]):
+    st.image(
+        render_pile_and_soil(
+            geo.length, tuple((layer.thickness, layer.cu) for layer in soil_layers)
+        ),
+        use_container_width=True,
+    )
+    rendering.report()
+
+
+def plot_capacity_depth(profile: FrictionProfile, geo: PileGeometry):
+    """Geotechnical capacity and skin friction vs tip depth for the diameter
+    in the sidebar, with the current pile length marked."""
+    depths = np.linspace(0.0, max(geo.length, profile.boundaries[-1]), 400)
+    skin = np.pi * geo.diameter * profile.friction_integral(depths) / 1e3
+    total = profile.capacity(depths, geo.diameter) / 1e3
+    fig, ax = rendering.new_figure((4, 6))
+    ax.plot(total, depths, color="black", label="Total")
+    ax.plot(skin, depths, "--", color="grey", label="Skin friction")
+    ax.axhline(geo.length, color="red", linewidth=0.8, label="Pile tip")
+    for boundary in profile.boundaries[1:-1]:
+        ax.axhline(boundary, color="lightgrey", linewidth=0.5)
+    ax.set_title("Capacity vs depth")
+    ax.set_xlabel("Capacity [kN]")
+    ax.set_ylabel("Depth [m]")
+    ax.set_ylim(depths[-1], 0)
+    ax.legend(fontsize=8)
+    rendering.show(fig)
+
+
+def plot_lateral_response(result):
+    """Deflection, bending moment and shear along the pile."""
+    fig, axs = rendering.new_figure((8, 5), 1, 3, sharey=True)
+    for ax, values, color, label in (
+        (axs[0], result.deflection * 1e3, "skyblue", "Deflection [mm]"),
+        (axs[1], result.moment / 1e3, "lightcoral", "Moment [kNm]"),
+        (axs[2], result.shear / 1e3, "lightgreen", "Shear [kN]"),
+    ):
+        ax.fill_betweenx(result.z, 0, values, color=color, alpha=0.5)
+        ax.plot(values, result.z, color="black", linewidth=0.8)
+        ax.axvline(0, color="grey", linewidth=0.5)
+        ax.set_xlabel(label)
+    axs[0].set_ylabel("Depth [m]")
+    axs[0].invert_yaxis()
+    fig.tight_layout()
+    rendering.show(fig)
+
+
+def plot_group_plan(group, result):
+    """Plan of the group with every pile coloured by its utilisation."""
+    fig, ax = rendering.new_figure((6, 5))
+    points = ax.scatter(
+        group.x,
+        group.y,
+        c=result.utilisation,
+        s=max(10, 2000 / group.size),
+        cmap="RdYlGn_r",
+        vmin=0,
+        vmax=max(1.0, result.utilisation.max()),
+        edgecolors="black",
+        linewidths=0.5,
+    )
+    fig.colorbar(points, ax=ax, label="Utilisation")
+    ax.set_aspect("equal")
+    ax.set_xlabel("x [m]")
+    ax.set_ylabel("y [m]")
+    ax.set_title("Pile utilisation (plan)")
+    rendering.show(fig)
+
+
+def plot_design_charts(lengths, diameters, results):
+    """Governing and geotechnical capacity vs length, one line per diameter."""
+    fig, axs = rendering.new_figure((6, 7), 2, 1)
+    governing = results["Governing axial capacity [kN]"]
+    geotechnical = results["Geotechnical capacity [kN]"]
+    for j, diameter in enumerate(diameters):
+        (line,) = axs[0].plot(lengths, governing[:, j], label=f"D = {diameter:.2f} m")
+        axs[0].plot(lengths, geotechnical[:, j], ":", color=line.get_color())
+        axs[1].plot(lengths, results["Buckling resistance [kN]"][:, j])
+    axs[0].set_title("Governing capacity (dotted: geotechnical)")
+    axs[0].set_ylabel("Capacity [kN]")
+    axs[0].legend(fontsize=8)
+    axs[1].set_title("Buckling resistance")
+    axs[1].set_ylabel("N_b,Rd [kN]")
+    axs[1].set_xlabel("Length [m]")
+    fig.tight_layout()
+    rendering.show(fig)
+
+
+@st.cache_data(max_entries=32, show_spinner="Solving the lateral response...")
+def lateral_response(length, diameter, thickness, layers, H, M0, nNodes):
+    """Lateral response of the tube pile, solved once per set of inputs;
+    layers is a tuple of (thickness, cu, alpha)."""
+    inner = diameter - 2 * thickness
+    return lateral_pile(
+        210e9,
+        np.pi / 64 * (diameter**4 - inner**4),
+        length,
+        diameter,
+        [SoilLayer(*layer) for layer in layers],
+        H=H,
+        M0=M0,
+        nNodes=nNodes,
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner="Reading CPT log...")
+def cpt_layers(fileId, _upload, nkt, water_depth):
+    """Soil layers of an uploaded CPT log, streamed from the upload itself.
+    The cache is keyed on the upload's file id, so the content is neither
+    copied nor hashed on reruns."""
+    _upload.seek(0)
+    return cpt_stratigraphy(_upload, Nkt=nkt, waterDepth=water_depth)
 
 
 # --- STREAMLIT APP ---
@@ -146,6 +202,11 @@ if st.button("⬅️ Back to Home"):
 st.title(appName)
 st.write(app["desc"])
 st.markdown("---")
+mode = st.radio(
+    "Analysis mode",
+    [SINGLE_PILE, DESIGN_CHARTS, OPTIMIZER, RELIABILITY, LATERAL, PILE_GROUP],
+    horizontal=True,
+)
 
 st.sidebar.header("Pile Geometry")
 L = st.sidebar.number_input("Length [m]", 1.0, 50.0, 10.0, step=0.5)
@@ -160,25 +221,269 @@ geo = PileGeometry(L, D, t)
 steel = SteelProperties(fy, fu)
 
 st.sidebar.header("Soil Stratigraphy")
-num_layers = st.sidebar.number_input("Number of layers", 1, 10, 3)
-layers = []
-for i in range(num_layers):
-    cols = st.columns(4)
-    with cols[0]:
-        st.subheader(f"Layer {i+1}")
-    with cols[1]:
-        thickness = st.number_input(
-            f"Thickness [m] - Layer {i+1}", 0.1, 50.0, 5.0, key=f"t{i}", step=1.0
+cpt_file = st.sidebar.file_uploader(
+    "Import CPT log (depth [m], qc or qt [MPa])", type=["csv", "txt", "dat", "cpt"]
+)
+if cpt_file is not None:
+    nkt = st.sidebar.number_input("Cone factor Nkt", 5.0, 30.0, 15.0, step=0.5)
+    water_depth = st.sidebar.number_input("Water table depth [m]", 0.0, 100.0, 0.0)
+    try:
+        layers = cpt_layers(cpt_file.file_id, cpt_file, nkt, water_depth)
+    except ValueError as e:
+        st.error(f"Could not read the CPT log: {e}")
+        st.stop()
+    st.subheader(f"Layers from {cpt_file.name}")
+    st.dataframe(
+        [
+            {
+                "Layer": i + 1,
+                "Thickness [m]": round(layer.thickness, 2),
+                "cu [kPa]": round(layer.cu / 1e3, 1),
+                "Alpha": round(layer.alpha, 3),
+            }
+            for i, layer in enumerate(layers)
+        ]
+    )
+else:
+    num_layers = st.sidebar.number_input("Number of layers", 1, 10, 3)
+    layers = []
+    for i in range(num_layers):
+        cols = st.columns(4)
+        with cols[0]:
+            st.subheader(f"Layer {i+1}")
+        with cols[1]:
+            thickness = st.number_input(
+                f"Thickness [m] - Layer {i+1}", 0.1, 50.0, 5.0, key=f"t{i}", step=1.0
+            )
+        with cols[2]:
+            cu = st.number_input(
+                f"Cohesion cu [kPa] - Layer {i+1}",
+                1.0,
+                500.0,
+                50.0,
+                key=f"cu{i}",
+                step=5.0,
+            )
+        with cols[3]:
+            alpha = st.number_input(
+                f"Alpha - Layer {i+1}", 0.1, 1.0, 0.5, key=f"a{i}", step=0.05
+            )
+            layers.append(SoilLayer(thickness, cu * 1e3, alpha))
+
+# --- Design Charts ---
+if mode == DESIGN_CHARTS:
+    st.markdown("Wall thickness from the sidebar; all lengths and diameters at once")
+    col1, col2 = st.columns(2)
+    with col1:
+        length_range = st.slider("Length range [m]", 1.0, 50.0, (5.0, 30.0), step=0.5)
+    with col2:
+        diameters_text = st.text_input("Diameters [m]", "0.3, 0.5, 0.8, 1.0")
+    try:
+        diameters = sorted(float(v) for v in diameters_text.split(",") if v.strip())
+    except ValueError:
+        st.error("Please enter the diameters as comma separated numbers.")
+        st.stop()
+    diameters = [d for d in diameters if d > 2 * t]
+    if diameters:
+        lengths = np.linspace(*length_range, 200)
+        LGrid, DGrid = np.meshgrid(lengths, diameters, indexing="ij")
+        results = evaluate_pile_grid(steel, LGrid, DGrid, t, layers)
+        plot_design_charts(lengths, diameters, results)
+    else:
+        st.error("Every diameter must exceed twice the wall thickness.")
+    st.stop()
+
+# --- Optimizer ---
+if mode == OPTIMIZER:
+    st.markdown("Lightest tube meeting the design loads; steel and soil from above")
+    col1, col2 = st.columns(2)
+    with col1:
+        axial_load = st.number_input("Design axial load N_Ed [kN]", 0.0, 1e5, 2000.0)
+    with col2:
+        design_moment = st.number_input("Design moment M_Ed [kNm]", 0.0, 1e5, 200.0)
+    ranges = {}
+    for name, label, bounds, default, step in (
+        ("L", "Length [m]", (1.0, 50.0), (5.0, 30.0), 0.5),
+        ("D", "Diameter [m]", (0.1, 2.0), (0.2, 1.5), 0.01),
+        ("t", "Wall thickness [m]", (0.005, 0.05), (0.006, 0.04), 0.001),
+    ):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            low, high = st.slider(label, *bounds, default, step=step)
+        with col2:
+            increment = st.number_input(
+                f"Step {name}", step / 10, bounds[1], step, format="%.3f"
+            )
+        ranges[name] = np.arange(low, high + increment / 2, increment)
+    compare = st.checkbox(
+        "Compare with a full sweep",
+        help=f"Evaluates every candidate; refused above {MAX_SWEEP_CANDIDATES:,}",
+    )
+    if st.button("Optimize"):
+        space = (ranges["L"], ranges["D"], ranges["t"])
+        best = optimize_pile(steel, layers, axial_load, design_moment, *space)
+        if best.geometry is None:
+            st.error("No candidate in the ranges meets the design loads.")
+        else:
+            g = best.geometry
+            st.success(
+                f"L = {g.length:.2f} m, D = {g.diameter:.3f} m, "
+                f"t = {g.thickness * 1e3:.1f} mm: {best.mass:.0f} kg"
+            )
+            for k, v in best.results.items():
+                st.write(f"**{k}**: {v:.2f}")
+        summary = (
+            f"Bisection: {best.evaluations:,} of {best.candidates:,} candidates "
+            f"evaluated in {best.wallTime * 1e3:.1f} ms"
+        )
+        if compare:
+            try:
+                sweep = full_sweep(
+                    steel,
+                    layers,
+                    axial_load,
+                    design_moment,
+                    *space,
+                    maxCandidates=MAX_SWEEP_CANDIDATES,
+                )
+            except ValueError as e:
+                st.warning(f"Full sweep skipped: {e}")
+            else:
+                summary += (
+                    f" · full sweep: {sweep.evaluations:,} "
+                    f"in {sweep.wallTime * 1e3:.1f} ms"
+                )
+        st.caption(summary)
+    st.stop()
+
+# --- Reliability ---
+if mode == RELIABILITY:
+    st.markdown("cu, alpha and fy are lognormal around the values entered above")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        reliability_load = st.number_input("Design load [kN]", 0.0, 1e5, 700.0)
+    with col2:
+        cu_cov = st.number_input("COV cu", 0.0, 1.0, 0.3, step=0.05)
+    with col3:
+        alpha_cov = st.number_input("COV alpha", 0.0, 1.0, 0.1, step=0.05)
+    with col4:
+        fy_cov = st.number_input("COV fy", 0.0, 0.5, 0.07, step=0.01)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        n_samples = st.select_slider(
+            "Maximum samples", [10**k for k in range(4, 9)], value=10**7
+        )
+    with col2:
+        tolerance = st.number_input(
+            "Stop when the CI half-width is below (% of Pf)", 0.1, 100.0, 2.0
         )
-    with cols[2]:
-        cu = st.number_input(
-            f"Cohesion cu [kPa] - Layer {i+1}", 1.0, 500.0, 50.0, key=f"cu{i}", step=5.0
+    with col3:
+        # in-process by default, so a run does not load the whole server
+        workers = st.number_input("Worker processes", 1, MAX_PAGE_WORKERS, 1)
+    if st.button("Run Simulation"):
+        model = PileReliabilityModel(
+            steel, geo, layers, reliability_load, cu_cov, alpha_cov, fy_cov
         )
-    with cols[3]:
-        alpha = st.number_input(
-            f"Alpha - Layer {i+1}", 0.1, 1.0, 0.5, key=f"a{i}", step=0.05
+        progress = st.progress(0.0)
+        status = st.empty()
+        for estimate in monte_carlo(
+            model, n_samples, chunkSize=min(n_samples, 10**6), workers=int(workers)
+        ):
+            low, high = estimate.interval
+            progress.progress(estimate.samples / n_samples)
+            status.markdown(
+                f"**Pf = {estimate.probability:.3e}** "
+                f"(95% CI {low:.3e} – {high:.3e}), β = {estimate.beta:.2f}  \n"
+                f"{estimate.samples:,} samples, {estimate.failures:,} failures"
+            )
+            if estimate.relativeHalfWidth * 100 <= tolerance:
+                st.success("Converged")
+                break
+        st.markdown(
+            f"Capacity: mean {estimate.meanCapacity:.0f} kN, "
+            f"std {estimate.stdCapacity:.0f} kN"
         )
-        layers.append(SoilLayer(thickness, cu * 1e3, alpha))
+        st.dataframe(
+            [
+                {"Percentile": f"{q}%", "Capacity [kN]": round(float(v), 1)}
+                for q, v in estimate.percentiles.items()
+            ]
+        )
+    st.stop()
+
+# --- Lateral Load ---
+if mode == LATERAL:
+    st.markdown("Free-head pile on Matlock soft clay p-y springs from the layers")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        head_load = st.number_input("Horizontal load H [kN]", 0.0, 1e4, 100.0)
+    with col2:
+        head_moment = st.number_input("Head moment M₀ [kNm]", -1e4, 1e4, 0.0)
+    with col3:
+        n_nodes = st.number_input("Nodes", 11, 100_000, 501, step=100)
+    try:
+        lateral = lateral_response(
+            L,
+            D,
+            t,
+            tuple((layer.thickness, layer.cu, layer.alpha) for layer in layers),
+            head_load * 1e3,
+            head_moment * 1e3,
+            int(n_nodes),
+        )
+    except ValueError as e:
+        st.error(f"Error in the lateral analysis: {e}")
+        st.stop()
+    if not lateral.converged:
+        st.warning(f"p-y iteration did not converge in {lateral.iterations} steps")
+    M_Rd = evaluate_pile_full(steel, geo, layers)["Moment resistance [kNm]"]
+    M_max = np.max(np.abs(lateral.moment)) / 1e3
+    st.markdown(
+        f"Head deflection: {lateral.deflection[0] * 1e3:.2f} mm · "
+        f"max moment: {M_max:.1f} kNm (M_Rd = {M_Rd:.1f} kNm, "
+        f"utilisation {M_max / M_Rd:.2f})"
+    )
+    plot_lateral_response(lateral)
+    st.stop()
+
+# --- Pile Group ---
+if mode == PILE_GROUP:
+    st.markdown("Rectangular group of identical piles (sidebar) under a rigid cap")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        nx = st.number_input("Piles in x", 1, 50, 5)
+    with col2:
+        ny = st.number_input("Piles in y", 1, 50, 4)
+    with col3:
+        sx = st.number_input("Spacing x [m]", 0.1, 20.0, 3 * D, step=0.1)
+    with col4:
+        sy = st.number_input("Spacing y [m]", 0.1, 20.0, 3 * D, step=0.1)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        group_N = st.number_input("Axial load N [kN]", -1e6, 1e6, 10000.0)
+    with col2:
+        group_Mx = st.number_input("Moment Mx [kNm]", -1e6, 1e6, 2000.0)
+    with col3:
+        group_My = st.number_input("Moment My [kNm]", -1e6, 1e6, 4000.0)
+    group = PileGroup.rectangular(int(nx), int(ny), sx, sy, L, D, t)
+    result = analyse_group(group, steel, layers, group_N, group_Mx, group_My)
+    worst = int(np.argmax(result.utilisation))
+    message = (
+        f"Max utilisation {result.utilisation[worst]:.2f} at pile "
+        f"({group.x[worst]:.2f}, {group.y[worst]:.2f}) m, "
+        f"load {result.load[worst]:.0f} kN"
+    )
+    if result.utilisation[worst] <= 1:
+        st.success(message)
+    else:
+        st.error(message)
+    st.markdown(
+        f"Group efficiency (Feld): {result.groupEfficiency:.2f} · "
+        f"group capacity {result.groupCapacity:.0f} kN · "
+        f"loads from {result.load.min():.0f} to {result.load.max():.0f} kN"
+    )
+    plot_group_plan(group, result)
+    st.stop()
 
 col1, col2 = st.columns([1, 2])
 with col1:
@@ -191,3 +496,4 @@ with col1:
 with col2:
     st.subheader("Visualization")
     plot_pile_and_soil(geo, layers)
+    plot_capacity_depth(FrictionProfile.from_layers(layers), geo)
@@ -1,24 +1,176 @@
+import numpy as np
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
 
 from main import ENGINEERING_UTILITIES
+from engineering import rendering
+from engineering.section_families import ParametricProfile, family_profiles
+from engineering.section_polygon import polygon_cache, read_dxf, read_vertex_csv
+from engineering.section_query import section_index
+from engineering.section_table import PARAMETRIC_FAMILIES, section_table
 from section.ipe import ipeDict
 
+BROWSE = "Browse"
+SEARCH = "Search"
+CUSTOM = "Custom section"
+# welded box girder 300 x 400, 20 mm flanges and 10 mm webs
+DEFAULT_VERTICES = """# x, y [mm]; a blank line starts the next ring (holes)
+0, 0
+300, 0
+300, 400
+0, 400
+
+10, 20
+290, 20
+290, 380
+10, 380
+"""
+# searchable properties and their labels
+SEARCH_FIELDS = {
+    "A": "A [mm²]",
+    "Ixx": "Ixx [mm⁴]",
+    "Iyy": "Iyy [mm⁴]",
+    "ix": "ix [mm]",
+    "iy": "iy [mm]",
+    "Welx": "Wel,x [mm³]",
+    "Wely": "Wel,y [mm³]",
+    "Wplx": "Wpl,x [mm³]",
+    "Wply": "Wpl,y [mm³]",
+}
 
 appName = "Steel Section Properties"
 app = ENGINEERING_UTILITIES[appName]
 st.set_page_config(page_title=appName, page_icon="📐")
+rendering.begin_rerun()
 
 typesDict = {
     "IPE": ipeDict,
+    **{family: family_profiles(family) for family in PARAMETRIC_FAMILIES},
 }
 
+
+# --- PLOT FUNCTIONS ---
+def outline_figure(rings, title):
+    """Figure of the filled outline of a section given as vertex rings,
+    holes included."""
+    # closed paths drop their last vertex, so each ring repeats its first
+    path = Path.make_compound_path(
+        *(Path(np.vstack([ring, ring[:1]]), closed=True) for ring in rings)
+    )
+    fig, ax = rendering.new_figure((4, 4))
+    ax.add_patch(PathPatch(path, facecolor="lightsteelblue", edgecolor="black"))
+    ax.autoscale_view()
+    ax.set_aspect("equal")
+    ax.set_title(title)
+    ax.axis("off")
+    return fig
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def profile_svg(typeProfile, profileName) -> str:
+    """SVG drawing of a catalogue profile. The catalogue is static, so each
+    drawing is rendered once per server process and shared by every
+    session."""
+    profile = typesDict[typeProfile][profileName]
+    if isinstance(profile, ParametricProfile):
+        fig = outline_figure(profile.outline(), profile.name)
+    else:
+        # drawn by the section package through pyplot; closed once rendered
+        fig, ax = profile.plot(show=False)
+    svg = rendering.render(fig, format="svg").decode()
+    return svg[svg.index("<svg") :]  # st.image expects the <svg> element first
+
+
 if st.button("⬅️ Back to Home"):
     st.switch_page("main.py")
 st.title(appName)
 st.write(app["desc"])
 st.markdown("---")
+mode = st.radio("Mode", [BROWSE, SEARCH, CUSTOM], horizontal=True)
+
+# --- Search ---
+if mode == SEARCH:
+    st.markdown("Lightest sections meeting every lower bound")
+    families = st.multiselect("Families", list(typesDict), default=list(typesDict))
+    bounded = st.multiselect(
+        "Constrained properties",
+        list(SEARCH_FIELDS),
+        default=["Iyy", "Wply"],
+        format_func=SEARCH_FIELDS.get,
+    )
+    minimum = {}
+    for col, name in zip(st.columns(max(1, len(bounded))), bounded):
+        with col:
+            minimum[name] = st.number_input(
+                f"Min {SEARCH_FIELDS[name]}", 0.0, value=0.0, format="%.0f"
+            )
+    limit = st.slider("Results", 1, 50, 10)
+    result = section_index().query(minimum, families=families, limit=limit)
+    if result.matches:
+        st.dataframe(
+            {
+                "Profile": result.rows["name"],
+                "Family": result.rows["family"],
+                "Mass [kg/m]": result.rows["mass"],
+                **{SEARCH_FIELDS[name]: result.rows[name] for name in bounded},
+            },
+            use_container_width=True,
+        )
+    else:
+        st.warning("No section meets the bounds.")
+    st.caption(
+        f"{result.matches:,} matches from {result.candidates:,} candidates "
+        f"after bisection, in {result.wallTime * 1e3:.2f} ms"
+    )
+    st.stop()
+
+# --- Custom section ---
+if mode == CUSTOM:
+    upload = st.file_uploader(
+        "Import vertices (CSV of x, y rows or DXF polylines, mm)",
+        type=["csv", "txt", "dxf"],
+    )
+    try:
+        if upload is None:
+            text = st.text_area("Vertices", DEFAULT_VERTICES, height=260)
+            rings = read_vertex_csv(text.encode())
+        elif upload.name.lower().endswith(".dxf"):
+            rings = read_dxf(upload.getvalue())
+        else:
+            rings = read_vertex_csv(upload.getvalue())
+        properties = polygon_cache.properties(rings)
+    except ValueError as e:
+        st.error(f"Could not read the section: {e}")
+        st.stop()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Properties")
+        st.write(f"x centroid: {properties.xc:.2f} mm")
+        st.write(f"y centroid: {properties.yc:.2f} mm")
+        st.write(f"A: {properties.area:.2f} mm²")
+        st.write(f"Ixx: {properties.Ixx:.0f} mm⁴")
+        st.write(f"Iyy: {properties.Iyy:.0f} mm⁴")
+        st.write(f"Ixy: {properties.Ixy:.0f} mm⁴")
+        st.write(f"ix: {properties.ix:.2f} mm")
+        st.write(f"iy: {properties.iy:.2f} mm")
+        st.write(f"Wel,x: {properties.Welx:.0f} mm³")
+        st.write(f"Wel,y: {properties.Wely:.0f} mm³")
+    with col2:
+        st.subheader("Principal axes")
+        st.write(f"I1: {properties.I1:.0f} mm⁴")
+        st.write(f"I2: {properties.I2:.0f} mm⁴")
+        st.write(f"Angle of axis 1: {np.degrees(properties.angle):.2f}°")
+        st.write(f"J (approximate): {properties.torsion:.0f} mm⁴")
+        st.write(f"{len(rings)} rings, {properties.vertices} vertices")
+    if st.checkbox("Draw section", value=properties.vertices <= 5000):
+        rendering.show(outline_figure(rings, "Custom section"))
+    stats = polygon_cache.stats()
+    st.caption(
+        f"Property cache: {stats['hits']} hits, {stats['misses']} misses, "
+        f"{stats['size']}/{stats['maxsize']} sections stored"
+    )
+    st.stop()
 
 col1, col2, col3 = st.columns(3)
 with col1:
@@ -34,19 +186,25 @@ with col2:
     # for k, v in dim.items():
     #     st.text(f"{str(k).rjust(20)}: {v}")
     st.subheader("Properties")
-    xCentroid, yCentroid = profile.centroid()
-    area = profile.area()
-    inertiaxxTotal, inertiayyTotal, inertiaxyTotal = profile.inertia()
-    ix, iy = profile.radii_of_gyration()
-    st.write(f"x centroid: {xCentroid:.2f} mm")
-    st.write(f"y centroid: {yCentroid:.2f} mm")
-    st.write(f"A: {area:.2f} mm²")
-    st.write(f"Ixx: {inertiaxxTotal:.0f} mm⁴")
-    st.write(f"Iyy: {inertiayyTotal:.0f} mm⁴")
-    st.write(f"ix: {ix:.2f} mm")
-    st.write(f"iy: {iy:.2f} mm")
+    # one row of the precomputed section table
+    properties = section_table()[profileName]
+    st.write(f"x centroid: {properties['xc']:.2f} mm")
+    st.write(f"y centroid: {properties['yc']:.2f} mm")
+    st.write(f"A: {properties['A']:.2f} mm²")
+    st.write(f"Ixx: {properties['Ixx']:.0f} mm⁴")
+    st.write(f"Iyy: {properties['Iyy']:.0f} mm⁴")
+    st.write(f"ix: {properties['ix']:.2f} mm")
+    st.write(f"iy: {properties['iy']:.2f} mm")
+    st.write(f"Wel,x: {properties['Welx']:.0f} mm³")
+    st.write(f"Wel,y: {properties['Wely']:.0f} mm³")
+    st.write(f"Wpl,x: {properties['Wplx']:.0f} mm³")
+    st.write(f"Wpl,y: {properties['Wply']:.0f} mm³")
+    st.write(f"Mass: {properties['mass']:.1f} kg/m")
 
 with col3:
     st.subheader("Dimensions (mm)")
-    fig, ax = profile.plot(show=False)
-    st.pyplot(fig)
+    if isinstance(profile, ParametricProfile):
+        for k, v in profile.dimensions.items():
+            st.write(f"{k}: {v:g}")
+    st.image(profile_svg(typeProfile, profileName), use_container_width=True)
+    rendering.report()
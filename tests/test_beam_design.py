@@ -0,0 +1,60 @@
+"""Catalogue design of a beam from one reference solve."""
+
+import numpy as np
+import pytest
+
+from engineering.beam_design import SectionCatalogue, design_beam
+from engineering.section_families import I_DIMENSIONS, IPE, dimension_table, i_section
+
+E = 210e9  # [Pa]
+L = 6.0  # [m]
+SIMPLY_SUPPORTED = [(0.0, "simple"), (L, "simple")]
+
+
+@pytest.fixture(scope="module")
+def catalogue():
+    """IPE catalogue from the closed forms, without the section package."""
+    names, dimensions = dimension_table(IPE, I_DIMENSIONS)
+    p = i_section(**dimensions)
+    return SectionCatalogue(names, p["A"], p["Iy"], p["Wel_y"])
+
+
+def selected_name(design):
+    return str(design.catalogue.names[design.selected])
+
+
+def test_point_load_in_newtons_selects_bending_governed_profile(catalogue):
+    # 50 kN at midspan: M = PL/4 = 75 kN·m needs Wel ≥ 211e3 mm³ at 355 MPa
+    design = design_beam(
+        E,
+        L,
+        SIMPLY_SUPPORTED,
+        pointLoads=[(L / 2, 50 * 1e3)],
+        fy=355e6,
+        deflectionLimit=L / 100,
+        catalogue=catalogue,
+    )
+    assert design.maxMoment == pytest.approx(50e3 * L / 4)
+    assert selected_name(design) == "IPE 220"
+    i = design.selected
+    assert design.bendingUtilisation[i] <= 1 < design.bendingUtilisation[i - 1]
+
+
+def test_udl_selects_deflection_governed_profile(catalogue):
+    # q = 10 kN/m: bending alone needs an IPE 180, L/250 needs I ≥ 33.5e6 mm⁴
+    design = design_beam(
+        E,
+        L,
+        SIMPLY_SUPPORTED,
+        distributedLoads=[((0.0, L), (10e3,))],
+        fy=355e6,
+        catalogue=catalogue,
+    )
+    assert design.maxMoment == pytest.approx(10e3 * L**2 / 8)
+    assert selected_name(design) == "IPE 240"
+    bending = np.flatnonzero(design.bendingUtilisation <= 1)[0]
+    assert str(catalogue.names[bending]) == "IPE 180"
+    # w = 5qL⁴/384EI of the selected profile
+    i = design.selected
+    expected = 5 * 10e3 * L**4 / (384 * E * catalogue.inertia[i] * 1e-12)
+    assert design.deflection[i] == pytest.approx(expected, rel=1e-9)
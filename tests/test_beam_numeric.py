@@ -0,0 +1,182 @@
+"""NumericBeam2D against closed-form beam results and the symbolic Beam2D."""
+
+import numpy as np
+import pytest
+
+from engineering.beam_numeric import FIELDS, NumericBeam2D
+
+E = 210e9  # [Pa]
+I = 8.356e-5  # [m⁴]
+EI = E * I
+L = 6.0  # [m]
+q = 20e3  # [N/m], downwards
+P = 50e3  # [N], downwards
+RTOL = 1e-9
+
+
+def reaction(beam, x):
+    """Vertical force and moment reaction of the support at x."""
+    for xSupport, _, v, m in beam.reactions:
+        if np.isclose(xSupport, x):
+            return v, m
+    raise KeyError(x)
+
+
+def test_simply_supported_udl():
+    beam = NumericBeam2D(
+        E, I, L, [(0, "simple"), (L, "simple")], distributedLoads=[((0, L), (q,))]
+    ).solve()
+    minmax = beam.get_minmax()
+    x, M = minmax["M"]["max"]
+    assert x == pytest.approx(L / 2)
+    assert M == pytest.approx(q * L**2 / 8, rel=RTOL)
+    x, w = minmax["w"]["max"]
+    assert x == pytest.approx(L / 2)
+    assert w == pytest.approx(5 * q * L**4 / (384 * EI), rel=RTOL)
+    # loads down, reactions up
+    assert reaction(beam, 0)[0] == pytest.approx(q * L / 2, rel=RTOL)
+    assert reaction(beam, L)[0] == pytest.approx(q * L / 2, rel=RTOL)
+
+
+def test_cantilever_point_load():
+    beam = NumericBeam2D(E, I, L, [(0, "fixed")], pointLoads=[(L, P)]).solve()
+    v, m = reaction(beam, 0)
+    assert v == pytest.approx(P, rel=RTOL)
+    assert abs(m) == pytest.approx(P * L, rel=RTOL)
+    # hogging at the clamp
+    assert beam.moment_at(0.0) == pytest.approx(-P * L, rel=RTOL)
+    assert beam.deflection_at(L) == pytest.approx(P * L**3 / (3 * EI), rel=RTOL)
+    assert beam.get_minmax()["w"]["max"][1] == pytest.approx(
+        P * L**3 / (3 * EI), rel=RTOL
+    )
+
+
+def test_fixed_fixed_udl():
+    beam = NumericBeam2D(
+        E, I, L, [(0, "fixed"), (L, "fixed")], distributedLoads=[((0, L), (q,))]
+    ).solve()
+    assert beam.moment_at(0.0) == pytest.approx(-q * L**2 / 12, rel=RTOL)
+    assert beam.moment_at(L / 2) == pytest.approx(q * L**2 / 24, rel=RTOL)
+    assert beam.deflection_at(L / 2) == pytest.approx(q * L**4 / (384 * EI), rel=RTOL)
+    assert reaction(beam, 0)[0] == pytest.approx(q * L / 2, rel=RTOL)
+    assert abs(reaction(beam, L)[1]) == pytest.approx(q * L**2 / 12, rel=RTOL)
+
+
+def test_two_span_continuous_udl():
+    beam = NumericBeam2D(
+        E,
+        I,
+        2 * L,
+        [(0, "simple"), (L, "simple"), (2 * L, "simple")],
+        distributedLoads=[((0, 2 * L), (q,))],
+    ).solve()
+    assert reaction(beam, L)[0] == pytest.approx(1.25 * q * L, rel=RTOL)
+    assert reaction(beam, 0)[0] == pytest.approx(0.375 * q * L, rel=RTOL)
+    assert beam.moment_at(L) == pytest.approx(-q * L**2 / 8, rel=RTOL)
+    assert beam.get_minmax()["M"]["min"][1] == pytest.approx(-q * L**2 / 8, rel=RTOL)
+
+
+def test_data_plot_matches_field_functions():
+    beam = NumericBeam2D(
+        E, I, L, [(0, "simple"), (L, "simple")], distributedLoads=[((0, L), (q,))]
+    ).solve()
+    x, *fields = beam.data_plot()
+    finite = ~np.isnan(x)
+    for key, values in zip(FIELDS, fields):
+        assert np.isnan(values[~finite]).all()
+        expected = beam.field_function(key)(x[finite])
+        # element ends are sampled from the left element, so compare where
+        # the fields are continuous
+        if key in ("w", "θ", "M"):
+            np.testing.assert_allclose(values[finite], expected, atol=1e-9 * q * L**2)
+
+
+# --- Agreement with the symbolic solver ---
+CASES = {
+    "simply supported": dict(
+        length=L,
+        supports=[(0, "simple"), (L, "simple")],
+        pointLoads=[(2.0, P)],
+        distributedLoads=[((1.0, 5.0), (q, 1e3, 0.0))],
+    ),
+    "cantilever": dict(
+        length=L,
+        supports=[(0, "fixed")],
+        pointLoads=[(L, P)],
+        distributedLoads=[((0.0, L), (q, 0.0, 0.0))],
+    ),
+    "propped cantilever": dict(
+        length=L,
+        supports=[(0, "fixed"), (L, "simple")],
+        pointLoads=[(4.0, P)],
+        distributedLoads=[((0.0, L), (q, 0.0, 500.0))],
+    ),
+    "two span": dict(
+        length=2 * L,
+        supports=[(0, "simple"), (L, "simple"), (2 * L, "simple")],
+        pointLoads=[(3.0, P)],
+        distributedLoads=[((0.0, 2 * L), (q, 0.0, 0.0))],
+    ),
+}
+
+
+def as_expression(coeffs):
+    a0, a1, a2 = coeffs
+    return f"{a0} + {a1}*x + {a2}*x**2"
+
+
+@pytest.mark.parametrize("case", list(CASES))
+def test_agrees_with_symbolic_beam(case):
+    beam2d = pytest.importorskip("structuralelement.beam2d")
+    args = dict(CASES[case], youngModulus=E, inertia=I, pointMoments=[])
+    numeric = NumericBeam2D(**args).solve()
+    symbolicArgs = dict(
+        args,
+        distributedLoads=[
+            (span, as_expression(coeffs)) for span, coeffs in args["distributedLoads"]
+        ],
+    )
+    symbolic = beam2d.Beam2D(**symbolicArgs)
+    symbolic.solve()
+
+    # reactions: same supports, same signs
+    assert len(numeric.reactions) == len(symbolic.reactions)
+    for (xn, kn, vn, mn), (xs, ks, vs, ms) in zip(
+        numeric.reactions, symbolic.reactions
+    ):
+        assert float(xn) == pytest.approx(float(xs))
+        assert kn == ks
+        for a, b in ((vn, vs), (mn, ms)):
+            assert (a is None) == (b is None)
+            if a is not None:
+                assert float(a) == pytest.approx(float(b), rel=1e-6, abs=1e-6 * P)
+
+    # fields at the symbolic sample positions, away from the jumps of V
+    x, *fields = (np.asarray(a, dtype=float) for a in symbolic.data_plot())
+    finite = ~np.isnan(x)
+    for key, values in zip(FIELDS, fields):
+        expected = numeric.field_function(key)(x[finite])
+        scale = np.nanmax(np.abs(values))
+        if key == "V":
+            continuous = np.ones(finite.sum(), dtype=bool)
+            for xJump in numeric.key_points():
+                continuous &= np.abs(x[finite] - xJump) > 1e-6 * L
+            np.testing.assert_allclose(
+                values[finite][continuous],
+                expected[continuous],
+                atol=1e-6 * scale,
+                err_msg=f"{case}: {key}",
+            )
+        else:
+            np.testing.assert_allclose(
+                values[finite], expected, atol=1e-6 * scale, err_msg=f"{case}: {key}"
+            )
+
+    # extremes: same values, including their signs
+    numericMinmax, symbolicMinmax = numeric.get_minmax(), symbolic.get_minmax()
+    for key in FIELDS:
+        scale = max(abs(float(symbolicMinmax[key][b][1])) for b in ("max", "min"))
+        for bound in ("max", "min"):
+            assert numericMinmax[key][bound][1] == pytest.approx(
+                float(symbolicMinmax[key][bound][1]), abs=1e-6 * scale
+            ), f"{case}: {key} {bound}"
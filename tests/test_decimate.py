@@ -0,0 +1,66 @@
+"""Point budget and peak preservation of the chart decimation."""
+
+import numpy as np
+import pytest
+
+from engineering.decimate import METHODS, decimate
+
+
+def segmented_series(nSegments, pointsPerSegment, seed=0):
+    """Random segments joined by NaN separators, as data_plot() returns."""
+    rng = np.random.default_rng(seed)
+    x, y = [], []
+    for i in range(nSegments):
+        x.append(np.linspace(i, i + 1, pointsPerSegment))
+        y.append(rng.normal(size=pointsPerSegment))
+        x.append([np.nan])
+        y.append([np.nan])
+    return np.concatenate(x[:-1]), np.concatenate(y[:-1])
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize(
+    "nSegments, pointsPerSegment",
+    [(1, 100_000), (10, 5_000), (200, 50), (333, 10), (334, 10), (800, 10)],
+)
+def test_output_never_exceeds_budget(method, nSegments, pointsPerSegment):
+    x, y = segmented_series(nSegments, pointsPerSegment)
+    for maxPoints in (10, 100, 1000):
+        xOut, yOut = decimate(x, y, maxPoints, method)
+        assert len(xOut) == len(yOut) <= maxPoints
+
+
+def test_series_within_budget_keeps_samples_and_finite_x():
+    x, y = segmented_series(3, 167)  # 503 points, 2 NaN separators
+    xOut, yOut = decimate(x, y, 1000)
+    assert np.array_equal(yOut, y, equal_nan=True)
+    assert np.isfinite(xOut).all()
+    finite = ~np.isnan(x)
+    assert np.array_equal(xOut[finite], x[finite])
+    # a separator repeats the x of the point before it
+    separators = np.flatnonzero(np.isnan(y))
+    assert np.array_equal(xOut[separators], x[separators - 1])
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_separators_have_finite_x(method):
+    for nSegments, points in ((3, 167), (20, 2_000), (800, 10)):
+        x, y = segmented_series(nSegments, points)
+        xOut, _ = decimate(x, y, 1000, method)
+        assert np.isfinite(xOut).all()
+
+
+def test_minmax_keeps_every_segment_extreme():
+    x, y = segmented_series(20, 2_000)
+    xOut, yOut = decimate(x, y, 1000, "minmax")
+    assert np.isnan(yOut).sum() == 19  # separators kept
+    assert np.nanmax(yOut) == np.nanmax(y)
+    assert np.nanmin(yOut) == np.nanmin(y)
+
+
+def test_many_segments_keep_global_extremes():
+    x, y = segmented_series(800, 10)
+    xOut, yOut = decimate(x, y, 1000, "minmax")
+    assert not np.isnan(yOut).any()
+    assert yOut.max() == np.nanmax(y) and yOut.min() == np.nanmin(y)
+    assert np.all(np.diff(xOut) >= 0)
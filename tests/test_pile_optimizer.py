@@ -0,0 +1,30 @@
+"""Bisection search against the full sweep of the pile optimizer."""
+
+import numpy as np
+import pytest
+
+from engineering.pile import SoilLayer, SteelProperties
+from engineering.pile_optimizer import full_sweep, optimize_pile
+
+STEEL = SteelProperties(355, 510)
+LAYERS = [SoilLayer(5.0, 50e3, 0.5), SoilLayer(10.0, 80e3, 0.5)]
+SPACE = (
+    np.arange(5.0, 15.01, 0.5),
+    np.arange(0.2, 1.01, 0.05),
+    np.arange(0.006, 0.0301, 0.002),
+)
+
+
+def test_bisection_matches_full_sweep():
+    best = optimize_pile(STEEL, LAYERS, 1500.0, 100.0, *SPACE)
+    sweep = full_sweep(STEEL, LAYERS, 1500.0, 100.0, *SPACE)
+    assert best.geometry is not None
+    assert best.mass == pytest.approx(sweep.mass)
+    assert best.evaluations < sweep.evaluations
+
+
+def test_full_sweep_refuses_spaces_above_the_cap():
+    size = SPACE[0].size * SPACE[1].size * SPACE[2].size
+    with pytest.raises(ValueError):
+        full_sweep(STEEL, LAYERS, 1500.0, 100.0, *SPACE, maxCandidates=size - 1)
+    full_sweep(STEEL, LAYERS, 1500.0, 100.0, *SPACE, maxCandidates=size)
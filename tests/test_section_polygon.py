@@ -0,0 +1,110 @@
+"""Polygon section properties against closed forms."""
+
+import numpy as np
+import pytest
+
+from engineering.section_polygon import (
+    PolygonPropertyCache,
+    polygon_properties,
+    read_vertex_csv,
+)
+
+
+def rectangle(x0, y0, width, height):
+    return np.array(
+        [[x0, y0], [x0 + width, y0], [x0 + width, y0 + height], [x0, y0 + height]]
+    )
+
+
+def circle(radius, n=4000, centre=(0.0, 0.0)):
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return np.column_stack(
+        [centre[0] + radius * np.cos(t), centre[1] + radius * np.sin(t)]
+    )
+
+
+def rectangle_torsion(a, b):
+    """Saint-Venant J of a solid a x b rectangle, a ≥ b, series form."""
+    return a * b**3 * (1 / 3 - 0.21 * (b / a) * (1 - b**4 / (12 * a**4)))
+
+
+def test_rectangle_far_from_origin():
+    p = polygon_properties([rectangle(1000, 2000, 100, 20)])
+    assert p.area == pytest.approx(2000)
+    assert (p.xc, p.yc) == pytest.approx((1050, 2010))
+    assert p.Ixx == pytest.approx(100 * 20**3 / 12, rel=1e-9)
+    assert p.Iyy == pytest.approx(20 * 100**3 / 12, rel=1e-9)
+    assert p.Ixy == pytest.approx(0, abs=1e-6)
+
+
+def test_ring_direction_does_not_matter():
+    rings = [rectangle(0, 0, 300, 400), rectangle(10, 20, 280, 360)]
+    forward = polygon_properties(rings)
+    reversed_ = polygon_properties([ring[::-1] for ring in rings])
+    assert forward.area == pytest.approx(reversed_.area)
+    assert forward.Ixx == pytest.approx(reversed_.Ixx)
+
+
+def test_principal_axes_of_rotated_rectangle():
+    angle = np.radians(30)
+    rotation = np.array(
+        [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
+    )
+    p = polygon_properties([rectangle(0, 0, 100, 20) @ rotation.T])
+    assert p.I1 == pytest.approx(20 * 100**3 / 12, rel=1e-9)
+    assert p.I2 == pytest.approx(100 * 20**3 / 12, rel=1e-9)
+    # major axis normal to the long side, i.e. at 30° + 90° ≡ -60°
+    assert np.degrees(p.angle) == pytest.approx(-60)
+
+
+# --- Torsion ---
+def test_solid_circle_torsion_is_exact():
+    R = 100.0
+    p = polygon_properties([circle(R)])
+    assert p.torsion == pytest.approx(np.pi * R**4 / 2, rel=1e-5)
+
+
+def test_solid_rectangle_torsion():
+    p = polygon_properties([rectangle(0, 0, 300, 400)])
+    assert p.torsion == pytest.approx(rectangle_torsion(400, 300), rel=0.1)
+
+
+def test_thin_box_uses_bredt():
+    # 300 x 400 box with 10 mm walls: mid-line cell 290 x 390
+    p = polygon_properties([rectangle(0, 0, 300, 400), rectangle(10, 10, 280, 380)])
+    Am, Pm, t = 290 * 390, 2 * (290 + 390), 10
+    assert p.torsion == pytest.approx(4 * Am**2 * t / Pm, rel=2e-3)
+
+
+def test_thin_tube_uses_bredt():
+    # circular hollow section 200 x 8
+    p = polygon_properties([circle(100), circle(92)[::-1]])
+    assert p.torsion == pytest.approx(np.pi / 2 * (100**4 - 92**4), rel=5e-3)
+
+
+def test_bolt_hole_keeps_solid_torsion():
+    solid = polygon_properties([rectangle(0, 0, 300, 400)])
+    holed = polygon_properties(
+        [rectangle(0, 0, 300, 400), circle(5, n=64, centre=(150, 200))]
+    )
+    assert holed.torsion <= solid.torsion
+    assert holed.torsion == pytest.approx(solid.torsion, rel=0.01)
+    assert holed.torsion == pytest.approx(rectangle_torsion(400, 300), rel=0.1)
+
+
+# --- Cache and import ---
+def test_cache_hits_on_same_geometry():
+    cache = PolygonPropertyCache(maxsize=2)
+    ring = rectangle(0, 0, 100, 20)
+    first = cache.properties([ring])
+    assert cache.properties([ring.copy()]) is first
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_vertex_csv_orders_outer_ring_first():
+    pytest.importorskip("shapely")
+    text = b"x, y\n10, 10\n20, 10\n20, 20\n10, 20\n\n0, 0\n30, 0\n30, 30\n0, 30\n"
+    rings = read_vertex_csv(text)
+    assert polygon_properties(rings).area == pytest.approx(900 - 100)
+    with pytest.raises(ValueError):
+        read_vertex_csv(b"0, 0\n10, 0\n0, 10\n10, 10\n")  # self-intersecting